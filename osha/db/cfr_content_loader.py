@@ -10,9 +10,16 @@ import psycopg2
 import psycopg2.extras
 from datetime import datetime
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator
 import sys
 
+# For streaming very large extraction files (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Database configuration
 DB_CONFIG = {
     'host': 'rds-dev-compliease-pg.cm9ok286yrdx.us-east-1.rds.amazonaws.com',
@@ -37,10 +44,15 @@ class CFRContentLoader:
         self.conn = None
         self.cursor = None
         self.content_type_map = {}
+        self.regulation_map = {}
         self.regulation_id = None
+        self.session_active = False
         
     def connect(self):
-        """Establish database connection"""
+        """Establish database connection (reused if already open)"""
+        if self.conn is not None and not self.conn.closed:
+            return
+        
         try:
             self.conn = psycopg2.connect(
                 host=self.db_config['host'],
@@ -65,19 +77,64 @@ class CFRContentLoader:
             self.cursor.close()
         if self.conn:
             self.conn.close()
+        self.cursor = None
+        self.conn = None
         logger.info("Database connection closed")
     
+    def start_session(self):
+        """
+        Open a persistent loader session: one connection and one set of
+        lookup caches shared by every load_cfr_dataset call until end_session
+        """
+        self.connect()
+        self.session_active = True
+        logger.info("CFR loader session started")
+    
+    def end_session(self):
+        """Close the persistent loader session"""
+        self.session_active = False
+        self.disconnect()
+        logger.info("CFR loader session ended")
+    
+    def __enter__(self):
+        self.start_session()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_session()
+        return False
+    
+    def invalidate_caches(self):
+        """Drop cached lookups; content types are reloaded, regulations refill on lookup"""
+        self.content_type_map = {}
+        self.regulation_map = {}
+        if self.conn is not None and not self.conn.closed:
+            self._load_content_type_mapping()
+    
+    def invalidate_regulation(self, regulation_code: str):
+        """Drop one cached regulation, e.g. after it was deleted outside the session"""
+        if self.regulation_map.pop(regulation_code, None) is not None:
+            logger.info(f"Invalidated cached regulation: {regulation_code}")
+    
     def _load_content_type_mapping(self):
         """Load content type IDs for quick lookup"""
         self.cursor.execute("SELECT content_type_id, type_name FROM cfr_content_type")
         for row in self.cursor.fetchall():
             self.content_type_map[row['type_name']] = row['content_type_id']
+        self.conn.commit()
         logger.info(f"Loaded {len(self.content_type_map)} content types: {list(self.content_type_map.keys())}")
     
     def find_or_create_regulation(self, document_metadata: dict) -> int:
         """Find existing regulation or create new one"""
         cfr_citation = document_metadata.get('cfr_citation', '')
         
+        # Cached lookup first; entries are added when this loader finds or
+        # creates a regulation and dropped when a load against them fails
+        if cfr_citation in self.regulation_map:
+            self.regulation_id = self.regulation_map[cfr_citation]
+            logger.info(f"Found cached regulation: {cfr_citation} (ID: {self.regulation_id})")
+            return self.regulation_id
+        
         # Try to find existing regulation
         self.cursor.execute(
             "SELECT regulation_id FROM regulation WHERE regulation_code = %s",
@@ -87,6 +144,7 @@ class CFRContentLoader:
         
         if result:
             self.regulation_id = result['regulation_id']
+            self.regulation_map[cfr_citation] = self.regulation_id
             logger.info(f"Found existing regulation: {cfr_citation} (ID: {self.regulation_id})")
             return self.regulation_id
         
@@ -135,18 +193,15 @@ class CFRContentLoader:
         self.cursor.execute(insert_sql, regulation_record)
         self.regulation_id = self.cursor.fetchone()['regulation_id']
         self.conn.commit()
+        self.regulation_map[cfr_citation] = self.regulation_id
         
         logger.info(f"Created new regulation: {cfr_citation} (ID: {self.regulation_id})")
         return self.regulation_id
     
-    def load_content_item(self, content_item: dict) -> Optional[int]:
-        """Load a single CFR content item"""
+    def _build_content_record(self, content_item: dict) -> dict:
+        """Build the cfr_content record for a content item of a known content type"""
         
         content_type = content_item.get('content_type')
-        if content_type not in self.content_type_map:
-            logger.error(f"Unknown content type: {content_type}")
-            return None
-        
         content_type_id = self.content_type_map[content_type]
         source_location = content_item.get('source_location', {})
         content_data = content_item.get('content', {})
@@ -156,7 +211,7 @@ class CFRContentLoader:
         subsection = source_location.get('subsection', '')
         content_code = f"{section}{subsection}" if subsection else section
         
-        content_record = {
+        return {
             'regulation_id': self.regulation_id,
             'content_type_id': content_type_id,
             'content_code': content_code,
@@ -179,6 +234,18 @@ class CFRContentLoader:
             'created_by': 'cfr_content_loader',
             'updated_by': 'cfr_content_loader'
         }
+    
+    def load_content_item(self, content_item: dict) -> Optional[int]:
+        """Load a single CFR content item"""
+        
+        content_type = content_item.get('content_type')
+        if content_type not in self.content_type_map:
+            logger.error(f"Unknown content type: {content_type}")
+            return None
+        
+        content_record = self._build_content_record(content_item)
+        content_code = content_record['content_code']
+        content_data = content_item.get('content', {})
         
         insert_sql = """
         INSERT INTO cfr_content (
@@ -223,14 +290,14 @@ class CFRContentLoader:
             logger.error(f"Failed to load content {content_code}: {e}")
             return None
     
-    def load_training_details(self, content_id: int, content_item: dict) -> bool:
-        """Load training-specific details"""
+    def _build_training_record(self, content_id: Optional[int], content_item: dict) -> dict:
+        """Build the cfr_training_details record for a content item"""
         
         training_details = content_item.get('training_details', {})
         procedure_steps = content_item.get('procedure_steps', [])
         required_elements = content_item.get('required_elements', [])
         
-        training_record = {
+        return {
             'content_id': content_id,
             'frequency': training_details.get('frequency'),
             'scope': training_details.get('scope'),
@@ -244,6 +311,11 @@ class CFRContentLoader:
             'procedure_steps': self._convert_to_array(procedure_steps),
             'required_elements': self._convert_to_array(required_elements)
         }
+    
+    def load_training_details(self, content_id: int, content_item: dict) -> bool:
+        """Load training-specific details"""
+        
+        training_record = self._build_training_record(content_id, content_item)
         
         insert_sql = """
         INSERT INTO cfr_training_details (
@@ -267,12 +339,12 @@ class CFRContentLoader:
             logger.error(f"Failed to load training details for content_id {content_id}: {e}")
             return False
     
-    def load_reference_details(self, content_id: int, content_item: dict) -> bool:
-        """Load reference-specific details"""
+    def _build_reference_record(self, content_id: Optional[int], content_item: dict) -> dict:
+        """Build the cfr_reference_details record for a content item"""
         
         reference_details = content_item.get('reference_details', {})
         
-        reference_record = {
+        return {
             'content_id': content_id,
             'standard_id': reference_details.get('standard_id'),
             'reference_title': reference_details.get('title'),
@@ -282,6 +354,11 @@ class CFRContentLoader:
             'incorporation_method': reference_details.get('incorporation_method'),
             'publication_title': reference_details.get('publication_title')
         }
+    
+    def load_reference_details(self, content_id: int, content_item: dict) -> bool:
+        """Load reference-specific details"""
+        
+        reference_record = self._build_reference_record(content_id, content_item)
         
         insert_sql = """
         INSERT INTO cfr_reference_details (
@@ -303,12 +380,12 @@ class CFRContentLoader:
             logger.error(f"Failed to load reference details for content_id {content_id}: {e}")
             return False
     
-    def load_appendix_details(self, content_id: int, content_item: dict) -> bool:
-        """Load appendix-specific details"""
+    def _build_appendix_record(self, content_id: Optional[int], content_item: dict) -> dict:
+        """Build the cfr_appendix_details record for a content item"""
         
         appendix_details = content_item.get('appendix_details', {})
         
-        appendix_record = {
+        return {
             'content_id': content_id,
             'appendix_type': appendix_details.get('type'),
             'purpose': appendix_details.get('purpose'),
@@ -319,6 +396,11 @@ class CFRContentLoader:
             'test_methods': self._convert_to_array(appendix_details.get('test_methods', [])),
             'includes': self._convert_to_array(appendix_details.get('includes', []))
         }
+    
+    def load_appendix_details(self, content_id: int, content_item: dict) -> bool:
+        """Load appendix-specific details"""
+        
+        appendix_record = self._build_appendix_record(content_id, content_item)
         
         insert_sql = """
         INSERT INTO cfr_appendix_details (
@@ -349,8 +431,11 @@ class CFRContentLoader:
         else:
             return []
     
-    def cleanup_existing_content(self, regulation_id: int):
-        """Clean up existing CFR content for this regulation"""
+    def cleanup_existing_content(self, regulation_id: int, commit: bool = True):
+        """
+        Clean up existing CFR content for this regulation
+        With commit=False the deletes join the caller's transaction
+        """
         try:
             # Delete detail tables first (foreign key constraints)
             self.cursor.execute("""
@@ -371,43 +456,230 @@ class CFRContentLoader:
             # Delete main content
             self.cursor.execute("DELETE FROM cfr_content WHERE regulation_id = %s", (regulation_id,))
             
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
             logger.info(f"Cleaned up existing CFR content for regulation_id {regulation_id}")
             
         except Exception as e:
-            self.conn.rollback()
+            if commit:
+                self.conn.rollback()
             logger.error(f"Failed to cleanup existing content: {e}")
             raise
     
-    def load_cfr_dataset(self, json_file_path: str, clean_existing: bool = True):
-        """Main method to load CFR dataset"""
+    BATCH_SIZE = 200
+    
+    def _stream_json_items(self, json_file_path: str, prefix: str) -> Iterator[Any]:
+        """Yield objects under a JSON path prefix one at a time without loading the whole file"""
+        with open(json_file_path, 'rb') as f:
+            yield from ijson.items(f, prefix, use_float=True)
+    
+    def _batched(self, items: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+        """Group an iterable into lists of at most batch_size items"""
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    CONTENT_COLUMNS = [
+        'regulation_id', 'content_type_id', 'content_code', 'title',
+        'section_number', 'subsection', 'paragraph', 'page_number', 'line_reference',
+        'hierarchy_path', 'content_text', 'summary', 'category', 'status',
+        'source_location', 'cross_references', 'related_terms', 'rule_id',
+        'source_data', 'created_by', 'updated_by'
+    ]
+    
+    # content_type -> (JSON details key, detail table, record builder name, columns)
+    DETAIL_TABLES = {
+        'training': ('training_details', 'cfr_training_details', '_build_training_record', [
+            'content_id', 'frequency', 'scope', 'trainer_requirements', 'audience',
+            'quality_benchmark', 'example_institutions', 'industry_specific',
+            'trigger_condition', 'performance_standard', 'procedure_steps', 'required_elements'
+        ]),
+        'reference': ('reference_details', 'cfr_reference_details', '_build_reference_record', [
+            'content_id', 'standard_id', 'reference_title', 'organization',
+            'publication_year', 'purpose', 'incorporation_method', 'publication_title'
+        ]),
+        'appendix': ('appendix_details', 'cfr_appendix_details', '_build_appendix_record', [
+            'content_id', 'appendix_type', 'purpose', 'scope', 'content_areas',
+            'organizations', 'coverage', 'test_methods', 'includes'
+        ])
+    }
+    
+    def _execute_values_isolated(self, sql: str, rows: List[tuple], labels: List[str]) -> List[dict]:
+        """
+        Run a multi-row execute_values statement under a savepoint. If the
+        statement fails, roll back to the savepoint and retry row by row,
+        each under its own savepoint, so one bad item only loses itself.
+        Returns: RETURNING rows of everything that was written
+        """
+        if not rows:
+            return []
         
-        logger.info(f"Starting CFR content load from: {json_file_path}")
+        self.cursor.execute("SAVEPOINT cfr_batch")
+        try:
+            returned = psycopg2.extras.execute_values(self.cursor, sql, rows, page_size=len(rows), fetch=True)
+            self.cursor.execute("RELEASE SAVEPOINT cfr_batch")
+            return returned
+        except Exception as e:
+            self.cursor.execute("ROLLBACK TO SAVEPOINT cfr_batch")
+            logger.warning(f"Multi-row insert failed, isolating items: {e}")
+        
+        returned = []
+        for row, label in zip(rows, labels):
+            self.cursor.execute("SAVEPOINT cfr_item")
+            try:
+                returned.extend(psycopg2.extras.execute_values(self.cursor, sql, [row], fetch=True))
+                self.cursor.execute("RELEASE SAVEPOINT cfr_item")
+            except Exception as e:
+                self.cursor.execute("ROLLBACK TO SAVEPOINT cfr_item")
+                logger.error(f"Failed to load {label}: {e}")
+        self.cursor.execute("RELEASE SAVEPOINT cfr_batch")
+        return returned
+    
+    def load_content_batch(self, batch: List[dict], loaded_counts: Dict[str, int], detail_counts: Dict[str, int],
+                           commit: bool = True):
+        """
+        Load a batch of content items and their specialized details in one
+        transaction: one multi-row cfr_content upsert returning content_ids,
+        then one multi-row insert per detail table. Updates the counters.
+        With commit=False the batch joins the caller's transaction
+        """
+        # Later items win for duplicate content codes, as with sequential upserts
+        items_by_code = {}
+        item_codes = []
+        for content_item in batch:
+            content_type = content_item.get('content_type')
+            if content_type not in self.content_type_map:
+                logger.error(f"Unknown content type: {content_type}")
+                continue
+            content_record = self._build_content_record(content_item)
+            items_by_code.pop(content_record['content_code'], None)
+            items_by_code[content_record['content_code']] = (content_item, content_record)
+            item_codes.append((content_type, content_record['content_code']))
+        
+        if not items_by_code:
+            return
+        
+        content_sql = f"""
+        INSERT INTO cfr_content ({', '.join(self.CONTENT_COLUMNS)})
+        VALUES %s
+        ON CONFLICT (content_code) WHERE is_current = TRUE AND is_deleted = FALSE
+        DO UPDATE SET
+            title = EXCLUDED.title,
+            content_text = EXCLUDED.content_text,
+            summary = EXCLUDED.summary,
+            category = EXCLUDED.category,
+            status = EXCLUDED.status,
+            source_location = EXCLUDED.source_location,
+            cross_references = EXCLUDED.cross_references,
+            related_terms = EXCLUDED.related_terms,
+            source_data = EXCLUDED.source_data,
+            updated_by = EXCLUDED.updated_by,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING content_id, content_code
+        """
         
         try:
-            # Load JSON
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
+            content_rows = [
+                tuple(content_record[column] for column in self.CONTENT_COLUMNS)
+                for _, content_record in items_by_code.values()
+            ]
+            returned = self._execute_values_isolated(
+                content_sql, content_rows,
+                [f"content {content_code}" for content_code in items_by_code]
+            )
+            content_ids = {row['content_code']: row['content_id'] for row in returned}
             
-            # Validate structure
-            if 'document_metadata' not in json_data or 'extracted_content' not in json_data:
-                raise ValueError("Invalid JSON structure - missing document_metadata or extracted_content")
+            for content_type, content_code in item_codes:
+                if content_code in content_ids:
+                    loaded_counts[content_type] = loaded_counts.get(content_type, 0) + 1
             
-            # Connect to database
+            detail_rows = {content_type: ([], []) for content_type in self.DETAIL_TABLES}
+            for content_code, content_id in content_ids.items():
+                content_item, _ = items_by_code[content_code]
+                content_type = content_item.get('content_type')
+                
+                # Load specialized details for specific content types
+                if content_type in self.DETAIL_TABLES:
+                    details_key, _, builder_name, columns = self.DETAIL_TABLES[content_type]
+                    if details_key in content_item:
+                        detail_record = getattr(self, builder_name)(content_id, content_item)
+                        rows, labels = detail_rows[content_type]
+                        rows.append(tuple(detail_record[column] for column in columns))
+                        labels.append(f"{details_key} for content_id {content_id}")
+            
+            for content_type, (rows, labels) in detail_rows.items():
+                details_key, table, _, columns = self.DETAIL_TABLES[content_type]
+                detail_sql = f"""
+                INSERT INTO {table} ({', '.join(columns)})
+                VALUES %s
+                ON CONFLICT (content_id) DO NOTHING
+                RETURNING content_id
+                """
+                detail_counts[details_key] += len(self._execute_values_isolated(detail_sql, rows, labels))
+            
+            if commit:
+                self.conn.commit()
+            logger.info(f"Loaded batch of {len(content_ids)} content items")
+            
+        except Exception as e:
+            if commit:
+                self.conn.rollback()
+            logger.error(f"Failed to load content batch: {e}")
+            raise
+    
+    def load_cfr_dataset(self, json_file_path: str, clean_existing: bool = True, stream: bool = False):
+        """
+        Main method to load CFR dataset
+        Cleanup and every batch of BATCH_SIZE content items share one transaction
+        with savepoint-based per-item error isolation, so a failure partway
+        through the file leaves the old content in place
+        With stream=True the file is parsed incrementally (requires ijson) and
+        batches are written as they are read
+        """
+        
+        logger.info(f"Starting CFR content load from: {json_file_path}")
+        document_metadata = None
+        
+        try:
+            if stream:
+                if not IJSON_AVAILABLE:
+                    raise RuntimeError("Streaming mode requires ijson. Install with: pip install ijson")
+                
+                document_metadata = next(self._stream_json_items(json_file_path, 'document_metadata'), None)
+                if document_metadata is None:
+                    raise ValueError("Invalid JSON structure - missing document_metadata")
+                extracted_content = self._stream_json_items(json_file_path, 'extracted_content.item')
+            else:
+                # Load JSON
+                with open(json_file_path, 'r', encoding='utf-8') as f:
+                    json_data = json.load(f)
+                
+                # Validate structure
+                if 'document_metadata' not in json_data or 'extracted_content' not in json_data:
+                    raise ValueError("Invalid JSON structure - missing document_metadata or extracted_content")
+                
+                document_metadata = json_data['document_metadata']
+                extracted_content = json_data['extracted_content']
+            
+            # Connect to database (no-op inside a session)
             self.connect()
             
             # Find or create regulation
             logger.info("Phase 1: Processing regulation...")
-            regulation_id = self.find_or_create_regulation(json_data['document_metadata'])
+            regulation_id = self.find_or_create_regulation(document_metadata)
             
             # Clean existing content if requested
             if clean_existing:
                 logger.info("Phase 2: Cleaning existing content...")
-                self.cleanup_existing_content(regulation_id)
+                self.cleanup_existing_content(regulation_id, commit=False)
             
             # Load content items
             logger.info("Phase 3: Loading CFR content items...")
-            extracted_content = json_data['extracted_content']
             loaded_counts = {
                 'definition': 0,
                 'training': 0, 
@@ -422,25 +694,15 @@ class CFRContentLoader:
                 'appendix_details': 0
             }
             
-            for content_item in extracted_content:
-                content_type = content_item.get('content_type')
-                content_id = self.load_content_item(content_item)
-                
-                if content_id:
-                    loaded_counts[content_type] = loaded_counts.get(content_type, 0) + 1
-                    
-                    # Load specialized details for specific content types
-                    if content_type == 'training' and 'training_details' in content_item:
-                        if self.load_training_details(content_id, content_item):
-                            detail_counts['training_details'] += 1
-                    
-                    elif content_type == 'reference' and 'reference_details' in content_item:
-                        if self.load_reference_details(content_id, content_item):
-                            detail_counts['reference_details'] += 1
-                    
-                    elif content_type == 'appendix' and 'appendix_details' in content_item:
-                        if self.load_appendix_details(content_id, content_item):
-                            detail_counts['appendix_details'] += 1
+            items_read = 0
+            for batch in self._batched(extracted_content, self.BATCH_SIZE):
+                items_read += len(batch)
+                self.load_content_batch(batch, loaded_counts, detail_counts, commit=False)
+            
+            # A missing or empty streamed extracted_content array must not replace the content
+            if stream and items_read == 0:
+                raise ValueError("Invalid JSON structure - extracted_content produced no items")
+            self.conn.commit()
             
             # Generate summary
             logger.info("=== CFR LOAD SUMMARY ===")
@@ -461,26 +723,70 @@ class CFRContentLoader:
             logger.info("CFR content loading completed successfully!")
             
         except Exception as e:
+            if self.conn is not None and not self.conn.closed:
+                self.conn.rollback()
+            # The regulation may have been deleted outside the session; look it up again next time
+            if document_metadata is not None:
+                self.invalidate_regulation(document_metadata.get('cfr_citation', ''))
             logger.error(f"CFR content loading failed: {e}")
             raise
         finally:
-            self.disconnect()
+            if not self.session_active:
+                self.disconnect()
+    
+    def load_files(self, json_file_paths: List[str], clean_existing: bool = True,
+                   stream: bool = False) -> Dict[str, str]:
+        """
+        Load many extraction files in one session so connection setup and
+        lookups are paid once. A failed file does not stop the rest.
+        Returns: Dictionary mapping file path to 'success' or the error message
+        """
+        results = {}
+        started_here = not self.session_active
+        if started_here:
+            self.start_session()
+        
+        try:
+            for json_file_path in json_file_paths:
+                try:
+                    self.load_cfr_dataset(json_file_path, clean_existing, stream)
+                    results[json_file_path] = 'success'
+                except Exception as e:
+                    results[json_file_path] = str(e)
+        finally:
+            if started_here:
+                self.end_session()
+        
+        succeeded = sum(1 for status in results.values() if status == 'success')
+        logger.info(f"Session loaded {succeeded}/{len(results)} files")
+        return results
 
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Usage: python cfr_content_loader.py <json_file_path> [--keep-existing]")
+        print("Usage: python cfr_content_loader.py <json_file_path> [<json_file_path> ...] [--keep-existing]")
         print("Example: python cfr_content_loader.py cfr_fire_protection_extraction.json")
+        print("Multiple files are loaded in one session (one connection, cached lookups)")
         print("Options:")
         print("  --keep-existing    Don't clean existing content before loading")
+        print("  --stream           Parse the file incrementally and load in bounded batches (needs ijson)")
         sys.exit(1)
     
-    json_file_path = sys.argv[1]
+    json_file_paths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
     clean_existing = '--keep-existing' not in sys.argv
+    stream = '--stream' in sys.argv
     
     try:
         loader = CFRContentLoader(DB_CONFIG)
-        loader.load_cfr_dataset(json_file_path, clean_existing)
+        if len(json_file_paths) > 1:
+            results = loader.load_files(json_file_paths, clean_existing, stream)
+            failed = {path: error for path, error in results.items() if error != 'success'}
+            for path, error in failed.items():
+                print(f"Error loading {path}: {error}")
+            if failed:
+                sys.exit(1)
+        else:
+            loader.load_cfr_dataset(json_file_paths[0], clean_existing, stream)
         print("CFR content loading completed successfully!")
         
     except Exception as e:
@@ -10,9 +10,22 @@ import psycopg2
 import psycopg2.extras
 from datetime import datetime
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 import sys
+import os
+import glob
+import time
 import hashlib
+import io
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# For streaming very large files (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Database configuration
 DB_CONFIG = {
@@ -33,10 +46,14 @@ logger = logging.getLogger(__name__)
 class OSHADataLoader:
     """Loads OSHA JSON data into PostgreSQL database with new schema"""
     
+    LOAD_COUNT_KEYS = ['rules_count', 'conditions_count', 'definitions_count', 'appendices_count']
+    
     def __init__(self, db_config: dict):
         self.db_config = db_config
         self.conn = None
         self.cursor = None
+        # Rows written by the current load, unlike generate_summary_report's regulation totals
+        self.load_counts = dict.fromkeys(self.LOAD_COUNT_KEYS, 0)
         
     def connect(self):
         """Establish database connection"""
@@ -154,55 +171,10 @@ class OSHADataLoader:
             logger.error(f"Failed to load regulation {reg_code}: {e}")
             raise
     
-    def load_rules(self, json_data: dict, regulation_id: int) -> Dict[str, int]:
-        """
-        Load rules from sections->subsections->rules into rule table
-        Returns: Dictionary mapping rule_code to rule_id (primary key)
-        """
-        rule_mapping = {}
-        sections = json_data.get('sections', [])
-        
-        for section in sections:
-            section_number = section.get('section_number')
-            section_title = section.get('title')
-            
-            subsections = section.get('subsections', [])
-            for subsection in subsections:
-                subsection_number = subsection.get('subsection')
-                subsection_title = subsection.get('title')
-                
-                rules = subsection.get('rules', [])
-                for rule_json in rules:
-                    rule_id = self._load_single_rule(
-                        rule_json, regulation_id,
-                        section_number, section_title,
-                        subsection_number, subsection_title
-                    )
-                    
-                    if rule_id:
-                        rule_mapping[rule_json['rule_id']] = rule_id
-        
-        # Load appendices as rules if they exist
-        appendices = json_data.get('appendices', [])
-        for appendix in appendices:
-            key_rule = appendix.get('key_rule')
-            if key_rule:
-                rule_id = self._load_single_rule(
-                    key_rule, regulation_id,
-                    'Appendix', appendix.get('title', 'Appendix'),
-                    appendix.get('appendix_id', 'A'), appendix.get('title', 'Appendix')
-                )
-                
-                if rule_id:
-                    rule_mapping[key_rule['rule_id']] = rule_id
-        
-        logger.info(f"Loaded {len(rule_mapping)} rules")
-        return rule_mapping
-    
-    def _load_single_rule(self, rule_json: dict, regulation_id: int,
-                         section_number: str, section_title: str,
-                         subsection_number: str, subsection_title: str) -> Optional[int]:
-        """Load a single rule into the rule table"""
+    def _build_rule_record(self, rule_json: dict, regulation_id: Optional[int],
+                           section_number: str, section_title: str,
+                           subsection_number: str, subsection_title: str) -> dict:
+        """Build the rule table record for a single JSON rule"""
         
         # Extract trigger and exception expressions
         triggers = rule_json.get('triggers', {})
@@ -214,7 +186,7 @@ class OSHADataLoader:
         # Convert personnel_required field
         personnel_required = rule_json.get('personnel_required')
         
-        rule_record = {
+        return {
             'rule_code': rule_json.get('rule_id'),
             'regulation_id': regulation_id,
             'rule_text': rule_json.get('text'),
@@ -236,102 +208,13 @@ class OSHADataLoader:
             'created_by': 'osha_loader_v2',
             'updated_by': 'osha_loader_v2'
         }
-        
-        insert_sql = """
-        INSERT INTO rule (
-            rule_code, regulation_id, rule_text, rule_type, compliance_requirement, severity,
-            section_number, section_title, subsection, subsection_title,
-            applies_to, work_types, protections, personnel_required,
-            trigger_expression, exception_expression, rule_hash,
-            source_data, created_by, updated_by
-        ) VALUES (
-            %(rule_code)s, %(regulation_id)s, %(rule_text)s, %(rule_type)s, %(compliance_requirement)s, %(severity)s,
-            %(section_number)s, %(section_title)s, %(subsection)s, %(subsection_title)s,
-            %(applies_to)s, %(work_types)s, %(protections)s, %(personnel_required)s,
-            %(trigger_expression)s, %(exception_expression)s, %(rule_hash)s,
-            %(source_data)s, %(created_by)s, %(updated_by)s
-        ) 
-        RETURNING rule_id
-        """
-        
-        try:
-            self.cursor.execute(insert_sql, rule_record)
-            rule_id = self.cursor.fetchone()['rule_id']
-            self.conn.commit()
-            
-            logger.info(f"Loaded rule: {rule_json.get('rule_id')} (ID: {rule_id})")
-            return rule_id
-            
-        except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Failed to load rule {rule_json.get('rule_id')}: {e}")
-            return None
-    
-    def load_conditions(self, json_data: dict, rule_mapping: Dict[str, int]):
-        """Load conditions from rule triggers and exceptions into condition table"""
-        sections = json_data.get('sections', [])
-        conditions_loaded = 0
-        
-        for section in sections:
-            subsections = section.get('subsections', [])
-            for subsection in subsections:
-                rules = subsection.get('rules', [])
-                for rule_json in rules:
-                    rule_code = rule_json.get('rule_id')
-                    rule_id = rule_mapping.get(rule_code)
-                    
-                    if not rule_id:
-                        continue
-                    
-                    # Load trigger conditions
-                    triggers = rule_json.get('triggers', {})
-                    trigger_conditions = triggers.get('conditions', [])
-                    for condition_data in trigger_conditions:
-                        if self._create_condition(rule_id, condition_data, 'trigger'):
-                            conditions_loaded += 1
-                    
-                    # Load exception conditions
-                    exceptions = rule_json.get('exceptions', {})
-                    exception_items = exceptions.get('items', [])
-                    for exception_item in exception_items:
-                        # Create condition for exception logic if it has conditions
-                        if exception_item.get('conditions'):
-                            for condition_data in exception_item['conditions']:
-                                if self._create_condition(rule_id, condition_data, 'exception'):
-                                    conditions_loaded += 1
-                        
-                        # Create description-only condition for the exception
-                        description_condition = {
-                            'id': exception_item.get('id'),
-                            'description': exception_item.get('description')
-                        }
-                        if self._create_condition(rule_id, description_condition, 'description_only'):
-                            conditions_loaded += 1
-        
-        # Load conditions from appendices
-        appendices = json_data.get('appendices', [])
-        for appendix in appendices:
-            key_rule = appendix.get('key_rule')
-            if key_rule:
-                rule_code = key_rule.get('rule_id')
-                rule_id = rule_mapping.get(rule_code)
-                
-                if rule_id:
-                    # Load trigger conditions from appendix
-                    triggers = key_rule.get('triggers', {})
-                    trigger_conditions = triggers.get('conditions', [])
-                    for condition_data in trigger_conditions:
-                        if self._create_condition(rule_id, condition_data, 'trigger'):
-                            conditions_loaded += 1
-        
-        logger.info(f"Loaded {conditions_loaded} conditions")
     
-    def _create_condition(self, rule_id: int, condition_data: dict, condition_type: str) -> bool:
-        """Create a single condition"""
+    def _build_condition_record(self, rule_id: Optional[int], condition_data: dict, condition_type: str) -> dict:
+        """Build the condition table record for a trigger, exception or description-only condition"""
         
         # Handle different condition data structures
         if condition_type == 'description_only':
-            condition_record = {
+            return {
                 'rule_id': rule_id,
                 'condition_key': condition_data.get('id', 'unknown'),
                 'parameter': None,
@@ -345,44 +228,22 @@ class OSHADataLoader:
                 'created_by': 'osha_loader_v2',
                 'updated_by': 'osha_loader_v2'
             }
-        else:
-            # Regular trigger/exception condition with logic
-            condition_record = {
-                'rule_id': rule_id,
-                'condition_key': condition_data.get('id', 'unknown'),
-                'parameter': condition_data.get('condition'),
-                'operator': condition_data.get('operator'),
-                'value': str(condition_data.get('value', '')),
-                'unit': condition_data.get('unit'),
-                'description': condition_data.get('condition', ''),
-                'data_type': self._infer_data_type(condition_data.get('value')),
-                'condition_type': condition_type,
-                'condition_details': json.dumps(condition_data),
-                'created_by': 'osha_loader_v2',
-                'updated_by': 'osha_loader_v2'
-            }
-        
-        insert_sql = """
-        INSERT INTO condition (
-            rule_id, condition_key, parameter, operator, value, unit,
-            description, data_type, condition_type, condition_details,
-            created_by, updated_by
-        ) VALUES (
-            %(rule_id)s, %(condition_key)s, %(parameter)s, %(operator)s, %(value)s, %(unit)s,
-            %(description)s, %(data_type)s, %(condition_type)s, %(condition_details)s,
-            %(created_by)s, %(updated_by)s
-        )
-        """
         
-        try:
-            self.cursor.execute(insert_sql, condition_record)
-            self.conn.commit()
-            return True
-            
-        except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Failed to create condition {condition_data.get('id')}: {e}")
-            return False
+        # Regular trigger/exception condition with logic
+        return {
+            'rule_id': rule_id,
+            'condition_key': condition_data.get('id', 'unknown'),
+            'parameter': condition_data.get('condition'),
+            'operator': condition_data.get('operator'),
+            'value': str(condition_data.get('value', '')),
+            'unit': condition_data.get('unit'),
+            'description': condition_data.get('condition', ''),
+            'data_type': self._infer_data_type(condition_data.get('value')),
+            'condition_type': condition_type,
+            'condition_details': json.dumps(condition_data),
+            'created_by': 'osha_loader_v2',
+            'updated_by': 'osha_loader_v2'
+        }
     
     def _infer_data_type(self, value: Any) -> str:
         """Infer data type from value"""
@@ -413,21 +274,23 @@ class OSHADataLoader:
                 for subsection in subsections:
                     rules = subsection.get('rules', [])
                     for rule_json in rules:
-                        # Extract term from rule_id (e.g., "1926.500(b)-hole" -> "hole")
-                        rule_id = rule_json.get('rule_id', '')
-                        if '-' in rule_id:
-                            term = rule_id.split('-')[-1]
-                        else:
-                            term = rule_json.get('requirement', 'unknown_term')
-                        
+                        term = self._extract_definition_term(rule_json)
                         definition_text = rule_json.get('text', '')
                         context = section.get('section_number', '')
                         
                         if self._create_definition(regulation_id, term, definition_text, context):
                             definitions_loaded += 1
         
+        self.load_counts['definitions_count'] += definitions_loaded
         logger.info(f"Loaded {definitions_loaded} definitions")
     
+    def _extract_definition_term(self, rule_json: dict) -> str:
+        """Extract term from rule_id (e.g., "1926.500(b)-hole" -> "hole")"""
+        rule_id = rule_json.get('rule_id', '')
+        if '-' in rule_id:
+            return rule_id.split('-')[-1]
+        return rule_json.get('requirement', 'unknown_term')
+    
     def _create_definition(self, regulation_id: int, term: str, definition_text: str, context: str) -> bool:
         """Create a single definition"""
         definition_record = {
@@ -457,20 +320,24 @@ class OSHADataLoader:
             logger.error(f"Failed to create definition for term '{term}': {e}")
             return False
     
+    def _build_appendix_record(self, regulation_id: int, appendix: dict) -> dict:
+        """Build the appendix table record for a JSON appendix"""
+        return {
+            'regulation_id': regulation_id,
+            'title': appendix.get('title'),
+            'content_text': appendix.get('purpose'),
+            'appendix_type': 'guidance',
+            'created_by': 'osha_loader_v2',
+            'updated_by': 'osha_loader_v2'
+        }
+    
     def load_appendices(self, json_data: dict, regulation_id: int):
         """Load appendices into appendix table"""
         appendices_loaded = 0
         appendices = json_data.get('appendices', [])
         
         for appendix in appendices:
-            appendix_record = {
-                'regulation_id': regulation_id,
-                'title': appendix.get('title'),
-                'content_text': appendix.get('purpose'),
-                'appendix_type': 'guidance',
-                'created_by': 'osha_loader_v2',
-                'updated_by': 'osha_loader_v2'
-            }
+            appendix_record = self._build_appendix_record(regulation_id, appendix)
             
             insert_sql = """
             INSERT INTO appendix (
@@ -489,8 +356,785 @@ class OSHADataLoader:
                 self.conn.rollback()
                 logger.error(f"Failed to create appendix '{appendix.get('title')}': {e}")
         
+        self.load_counts['appendices_count'] += appendices_loaded
         logger.info(f"Loaded {appendices_loaded} appendices")
     
+    # ===============================
+    # SINGLE-PASS BATCHED LOADING
+    # ===============================
+    
+    BATCH_PAGE_SIZE = 500
+    
+    RULE_INSERT_COLUMNS = [
+        'rule_code', 'regulation_id', 'rule_text', 'rule_type', 'compliance_requirement', 'severity',
+        'section_number', 'section_title', 'subsection', 'subsection_title',
+        'applies_to', 'work_types', 'protections', 'personnel_required',
+        'trigger_expression', 'exception_expression', 'rule_hash',
+        'source_data', 'created_by', 'updated_by'
+    ]
+    
+    CONDITION_INSERT_COLUMNS = [
+        'rule_id', 'condition_key', 'parameter', 'operator', 'value', 'unit',
+        'description', 'data_type', 'condition_type', 'condition_details',
+        'created_by', 'updated_by'
+    ]
+    
+    def load_rules_and_conditions(self, json_data: dict, regulation_id: int) -> Dict[str, int]:
+        """
+        Load rules and their conditions in a single pass.
+        One walk of the rule tree collects rule rows and their trigger,
+        exception and description-only condition rows; both are written
+        with multi-row execute_values in one transaction and condition
+        rule_ids are resolved from the RETURNING (rule_id, rule_code) pairs.
+        Returns: Dictionary mapping rule_code to rule_id (primary key)
+        """
+        rule_rows = []
+        condition_rows = []  # (rule_code, condition_record)
+        seen_rule_codes = set()
+        
+        for (rule_json, section, section_number, section_title,
+             subsection_number, subsection_title, is_appendix) in self._iter_rules(json_data):
+            rule_record = self._build_rule_record(
+                rule_json, regulation_id,
+                section_number, section_title,
+                subsection_number, subsection_title
+            )
+            rule_code = rule_record['rule_code']
+            if rule_code is None or rule_code in seen_rule_codes:
+                logger.error(f"Skipping rule with missing or duplicate rule_id: {rule_code}")
+                continue
+            seen_rule_codes.add(rule_code)
+            rule_rows.append(tuple(rule_record[column] for column in self.RULE_INSERT_COLUMNS))
+            
+            for condition_record in self._collect_rule_conditions(rule_json, is_appendix):
+                if condition_record['condition_key'] is None or condition_record['description'] is None:
+                    logger.error(f"Skipping incomplete condition for rule {rule_code}")
+                    continue
+                condition_rows.append((rule_code, condition_record))
+        
+        rule_insert_sql = f"""
+        INSERT INTO rule ({', '.join(self.RULE_INSERT_COLUMNS)})
+        VALUES %s
+        ON CONFLICT (rule_code) DO NOTHING
+        RETURNING rule_id, rule_code
+        """
+        
+        condition_insert_sql = f"""
+        INSERT INTO condition ({', '.join(self.CONDITION_INSERT_COLUMNS)})
+        VALUES %s
+        ON CONFLICT (rule_id, condition_key) DO NOTHING
+        RETURNING condition_id
+        """
+        
+        try:
+            returned = psycopg2.extras.execute_values(
+                self.cursor, rule_insert_sql, rule_rows,
+                page_size=self.BATCH_PAGE_SIZE, fetch=True
+            )
+            rule_mapping = {row['rule_code']: row['rule_id'] for row in returned}
+            
+            # rule_code is unique across regulations; codes already loaded are not inserted
+            skipped_rules = [code for code in seen_rule_codes if code not in rule_mapping]
+            if skipped_rules:
+                skipped_conditions = sum(1 for rule_code, _ in condition_rows if rule_code not in rule_mapping)
+                logger.error(f"Skipped {len(skipped_rules)} rules whose rule_code already exists "
+                             f"and their {skipped_conditions} conditions: {', '.join(sorted(skipped_rules))}")
+            
+            condition_values = [
+                tuple(
+                    rule_mapping[rule_code] if column == 'rule_id' else condition_record[column]
+                    for column in self.CONDITION_INSERT_COLUMNS
+                )
+                for rule_code, condition_record in condition_rows
+                if rule_code in rule_mapping
+            ]
+            conditions_loaded = 0
+            if condition_values:
+                conditions_loaded = len(psycopg2.extras.execute_values(
+                    self.cursor, condition_insert_sql, condition_values,
+                    page_size=self.BATCH_PAGE_SIZE, fetch=True
+                ))
+            
+            self.conn.commit()
+            
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Failed to load rules and conditions: {e}")
+            raise
+        
+        self.load_counts['rules_count'] += len(rule_mapping)
+        self.load_counts['conditions_count'] += conditions_loaded
+        logger.info(f"Loaded {len(rule_mapping)} rules")
+        logger.info(f"Loaded {conditions_loaded} conditions")
+        return rule_mapping
+    
+    # ===============================
+    # BULK (COPY) LOADING
+    # ===============================
+    
+    BULK_RULE_COLUMNS = [
+        'seq', 'rule_code', 'rule_text', 'rule_type', 'compliance_requirement', 'severity',
+        'section_number', 'section_title', 'subsection', 'subsection_title',
+        'applies_to', 'work_types', 'protections', 'personnel_required',
+        'trigger_expression', 'exception_expression', 'rule_hash', 'source_data'
+    ]
+    
+    BULK_CONDITION_COLUMNS = [
+        'seq', 'rule_code', 'condition_key', 'parameter', 'operator', 'value', 'unit',
+        'description', 'data_type', 'condition_type', 'condition_details'
+    ]
+    
+    BULK_DEFINITION_COLUMNS = ['seq', 'term', 'definition_text', 'context_section']
+    
+    BULK_APPENDIX_COLUMNS = [
+        'regulation_id', 'title', 'content_text', 'appendix_type', 'created_by', 'updated_by'
+    ]
+    
+    def _iter_rules(self, json_data: dict):
+        """
+        Walk sections->subsections->rules and appendix key rules once
+        Yields: (rule_json, section, section_number, section_title,
+                 subsection_number, subsection_title, is_appendix)
+        """
+        for section in json_data.get('sections', []):
+            section_number = section.get('section_number')
+            section_title = section.get('title')
+            
+            for subsection in section.get('subsections', []):
+                subsection_number = subsection.get('subsection')
+                subsection_title = subsection.get('title')
+                
+                for rule_json in subsection.get('rules', []):
+                    yield (rule_json, section, section_number, section_title,
+                           subsection_number, subsection_title, False)
+        
+        for appendix in json_data.get('appendices', []):
+            key_rule = appendix.get('key_rule')
+            if key_rule:
+                yield (key_rule, appendix, 'Appendix', appendix.get('title', 'Appendix'),
+                       appendix.get('appendix_id', 'A'), appendix.get('title', 'Appendix'), True)
+    
+    def flatten_dataset(self, json_data: dict) -> Dict[str, List[dict]]:
+        """
+        Flatten the whole JSON document into in-memory rows for bulk loading.
+        Conditions reference their parent rule by rule_code; rule_id is
+        resolved set-wise in the database.
+        Returns: {'rules': [...], 'conditions': [...], 'definitions': [...], 'appendices': [...]}
+        """
+        flat = {'rules': [], 'conditions': [], 'definitions': [], 'appendices': []}
+        
+        for (rule_json, section, section_number, section_title,
+             subsection_number, subsection_title, is_appendix) in self._iter_rules(json_data):
+            rule_record = self._build_rule_record(
+                rule_json, None,
+                section_number, section_title,
+                subsection_number, subsection_title
+            )
+            rule_record['seq'] = len(flat['rules'])
+            flat['rules'].append(rule_record)
+            rule_code = rule_record['rule_code']
+            
+            for condition_record in self._collect_rule_conditions(rule_json, is_appendix):
+                condition_record['rule_code'] = rule_code
+                condition_record['seq'] = len(flat['conditions'])
+                flat['conditions'].append(condition_record)
+            
+            if not is_appendix and section.get('title') == 'Definitions':
+                flat['definitions'].append({
+                    'seq': len(flat['definitions']),
+                    'term': self._extract_definition_term(rule_json),
+                    'definition_text': rule_json.get('text', ''),
+                    'context_section': section.get('section_number', '')
+                })
+        
+        for appendix in json_data.get('appendices', []):
+            flat['appendices'].append(self._build_appendix_record(None, appendix))
+        
+        logger.info(
+            f"Flattened dataset: {len(flat['rules'])} rules, {len(flat['conditions'])} conditions, "
+            f"{len(flat['definitions'])} definitions, {len(flat['appendices'])} appendices"
+        )
+        return flat
+    
+    def _collect_rule_conditions(self, rule_json: dict, is_appendix: bool) -> List[dict]:
+        """Build trigger, exception and description-only condition records for one rule"""
+        condition_records = []
+        
+        triggers = rule_json.get('triggers', {}) or {}
+        for condition_data in triggers.get('conditions', []):
+            condition_records.append(self._build_condition_record(None, condition_data, 'trigger'))
+        
+        # Appendix key rules only carry trigger conditions
+        if is_appendix:
+            return condition_records
+        
+        exceptions = rule_json.get('exceptions', {}) or {}
+        for exception_item in exceptions.get('items', []):
+            for condition_data in exception_item.get('conditions') or []:
+                condition_records.append(self._build_condition_record(None, condition_data, 'exception'))
+            
+            description_condition = {
+                'id': exception_item.get('id'),
+                'description': exception_item.get('description')
+            }
+            condition_records.append(
+                self._build_condition_record(None, description_condition, 'description_only')
+            )
+        
+        return condition_records
+    
+    @staticmethod
+    def _format_copy_value(value: Any) -> str:
+        """Format a Python value for COPY ... FROM STDIN (text format)"""
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return 't' if value else 'f'
+        if isinstance(value, list):
+            # PostgreSQL array literal; elements are quoted and escaped
+            value = '{' + ','.join(
+                '"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"'
+                for item in value
+            ) + '}'
+        else:
+            value = str(value)
+        return (value.replace('\\', '\\\\')
+                     .replace('\t', '\\t')
+                     .replace('\n', '\\n')
+                     .replace('\r', '\\r'))
+    
+    def _copy_rows(self, table: str, columns: List[str], rows: List[dict]) -> int:
+        """Stream rows into a table with COPY FROM STDIN"""
+        if not rows:
+            return 0
+        
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write('\t'.join(self._format_copy_value(row.get(column)) for column in columns))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        self.cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN",
+            buffer
+        )
+        return len(rows)
+    
+    def _create_bulk_staging_tables(self):
+        """Create transaction-scoped staging tables for the bulk load"""
+        self.cursor.execute("""
+            CREATE TEMP TABLE stg_rule (
+                seq INTEGER NOT NULL,
+                rule_code VARCHAR(300),
+                rule_text TEXT,
+                rule_type VARCHAR(200),
+                compliance_requirement TEXT,
+                severity VARCHAR(100),
+                section_number VARCHAR(200),
+                section_title TEXT,
+                subsection VARCHAR(300),
+                subsection_title TEXT,
+                applies_to TEXT[],
+                work_types TEXT[],
+                protections TEXT[],
+                personnel_required TEXT,
+                trigger_expression TEXT,
+                exception_expression TEXT,
+                rule_hash VARCHAR(500),
+                source_data JSONB
+            ) ON COMMIT DROP
+        """)
+        self.cursor.execute("""
+            CREATE TEMP TABLE stg_condition (
+                seq INTEGER NOT NULL,
+                rule_code VARCHAR(300),
+                condition_key VARCHAR(200),
+                parameter TEXT,
+                operator VARCHAR(100),
+                value TEXT,
+                unit VARCHAR(200),
+                description TEXT,
+                data_type VARCHAR(100),
+                condition_type VARCHAR(100),
+                condition_details JSONB
+            ) ON COMMIT DROP
+        """)
+        self.cursor.execute("""
+            CREATE TEMP TABLE stg_definition (
+                seq INTEGER NOT NULL,
+                term VARCHAR(500),
+                definition_text TEXT,
+                context_section VARCHAR(200)
+            ) ON COMMIT DROP
+        """)
+    
+    def bulk_load_dataset(self, flat: Dict[str, List[dict]], regulation_id: int,
+                          clean_existing: bool = True) -> Dict[str, int]:
+        """
+        Load flattened rows with COPY into staging tables and resolve
+        rule_id foreign keys set-wise. Runs as a single transaction.
+        Returns: counts of inserted rules, conditions, definitions and appendices
+        """
+        try:
+            if clean_existing:
+                self.cleanup_previous_data(regulation_id, commit=False)
+            
+            self._create_bulk_staging_tables()
+            self._stage_flat_rows(flat, regulation_id)
+            counts = self._apply_staged_rows(regulation_id)
+            counts['appendices_count'] = len(flat['appendices'])
+            
+            self.conn.commit()
+            self.load_counts.update(counts)
+            
+            logger.info(
+                f"Bulk loaded {counts['rules_count']} rules, {counts['conditions_count']} conditions, "
+                f"{counts['definitions_count']} definitions, {counts['appendices_count']} appendices"
+            )
+            return counts
+            
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Bulk load failed: {e}")
+            raise
+    
+    def _stage_flat_rows(self, flat: Dict[str, List[dict]], regulation_id: int):
+        """
+        COPY flattened rules, conditions and definitions into the staging
+        tables; appendices have no foreign keys to resolve and go straight
+        into the appendix table
+        """
+        self._copy_rows('stg_rule', self.BULK_RULE_COLUMNS, flat['rules'])
+        self._copy_rows('stg_condition', self.BULK_CONDITION_COLUMNS, flat['conditions'])
+        self._copy_rows('stg_definition', self.BULK_DEFINITION_COLUMNS, flat['definitions'])
+        
+        appendix_rows = [dict(row, regulation_id=regulation_id) for row in flat['appendices']]
+        self._copy_rows('appendix', self.BULK_APPENDIX_COLUMNS, appendix_rows)
+    
+    def _apply_staged_rows(self, regulation_id: int) -> Dict[str, int]:
+        """
+        Insert the staged rows into rule, condition and definition.
+        Does not commit; the caller owns the transaction.
+        Returns: counts of inserted rules, conditions and definitions
+        """
+        # Rules and conditions in one statement: conditions join to the
+        # rules actually inserted, mirroring the per-row rule_mapping.
+        self.cursor.execute("""
+            WITH new_rules AS (
+                INSERT INTO rule (
+                    rule_code, regulation_id, rule_text, rule_type, compliance_requirement, severity,
+                    section_number, section_title, subsection, subsection_title,
+                    applies_to, work_types, protections, personnel_required,
+                    trigger_expression, exception_expression, rule_hash,
+                    source_data, created_by, updated_by
+                )
+                SELECT DISTINCT ON (s.rule_code)
+                    s.rule_code, %(regulation_id)s, s.rule_text, s.rule_type, s.compliance_requirement, s.severity,
+                    s.section_number, s.section_title, s.subsection, s.subsection_title,
+                    s.applies_to, s.work_types, s.protections, s.personnel_required,
+                    s.trigger_expression, s.exception_expression, s.rule_hash,
+                    s.source_data, 'osha_loader_v2', 'osha_loader_v2'
+                FROM stg_rule s
+                WHERE s.rule_code IS NOT NULL
+                ORDER BY s.rule_code, s.seq
+                ON CONFLICT (rule_code) DO NOTHING
+                RETURNING rule_id, rule_code
+            ),
+            new_conditions AS (
+                INSERT INTO condition (
+                    rule_id, condition_key, parameter, operator, value, unit,
+                    description, data_type, condition_type, condition_details,
+                    created_by, updated_by
+                )
+                SELECT DISTINCT ON (nr.rule_id, s.condition_key)
+                    nr.rule_id, s.condition_key, s.parameter, s.operator, s.value, s.unit,
+                    s.description, s.data_type, s.condition_type, s.condition_details,
+                    'osha_loader_v2', 'osha_loader_v2'
+                FROM stg_condition s
+                JOIN new_rules nr ON nr.rule_code = s.rule_code
+                WHERE s.condition_key IS NOT NULL AND s.description IS NOT NULL
+                ORDER BY nr.rule_id, s.condition_key, s.seq
+                ON CONFLICT (rule_id, condition_key) DO NOTHING
+                RETURNING condition_id
+            )
+            SELECT
+                (SELECT COUNT(*) FROM new_rules) AS rules_count,
+                (SELECT COUNT(*) FROM new_conditions) AS conditions_count,
+                ARRAY(
+                    SELECT DISTINCT s.rule_code
+                    FROM stg_rule s
+                    WHERE s.rule_code IS NOT NULL
+                      AND s.rule_code NOT IN (SELECT rule_code FROM new_rules)
+                    ORDER BY s.rule_code
+                ) AS skipped_rule_codes,
+                (SELECT COUNT(*)
+                 FROM stg_condition s
+                 WHERE s.rule_code IN (SELECT rule_code FROM stg_rule)
+                   AND s.rule_code NOT IN (SELECT rule_code FROM new_rules)
+                ) AS skipped_conditions_count
+        """, {'regulation_id': regulation_id})
+        counts = dict(self.cursor.fetchone())
+        
+        # rule_code is unique across regulations; codes already loaded are not inserted
+        skipped_rules = counts.pop('skipped_rule_codes')
+        skipped_conditions = counts.pop('skipped_conditions_count')
+        if skipped_rules:
+            logger.error(f"Skipped {len(skipped_rules)} rules whose rule_code already exists "
+                         f"and their {skipped_conditions} conditions: {', '.join(skipped_rules)}")
+        
+        self.cursor.execute("""
+            INSERT INTO definition (
+                regulation_id, term, definition_text, context_section, created_by, updated_by
+            )
+            SELECT DISTINCT ON (s.term)
+                %s, s.term, s.definition_text, s.context_section, 'osha_loader_v2', 'osha_loader_v2'
+            FROM stg_definition s
+            WHERE s.term IS NOT NULL AND s.definition_text IS NOT NULL
+            ORDER BY s.term, s.seq
+            ON CONFLICT (regulation_id, term) DO NOTHING
+        """, (regulation_id,))
+        counts['definitions_count'] = self.cursor.rowcount
+        return counts
+    
+    # ===============================
+    # INCREMENTAL (HASH DIFF) LOADING
+    # ===============================
+    
+    def fetch_rule_hashes(self, regulation_id: int) -> Dict[str, dict]:
+        """
+        Fetch the existing rule_code -> rule_hash map for a regulation in one query.
+        Soft-deleted rules are included so that a returning rule_code is revived
+        instead of colliding with the rule_code unique constraint.
+        """
+        self.cursor.execute("""
+            SELECT DISTINCT ON (rule_code) rule_id, rule_code, rule_hash, is_deleted
+            FROM rule
+            WHERE regulation_id = %s
+            ORDER BY rule_code, is_deleted, rule_id DESC
+        """, (regulation_id,))
+        return {row['rule_code']: dict(row) for row in self.cursor.fetchall()}
+    
+    def diff_rules(self, flat: Dict[str, List[dict]], existing: Dict[str, dict]) -> Dict[str, list]:
+        """
+        Compare incoming rule hashes against the database.
+        Returns: {'new': [rule_code], 'changed': [rule_id], 'unchanged': [rule_id], 'removed': [rule_id]}
+        """
+        incoming = {}
+        for rule_record in flat['rules']:
+            rule_code = rule_record['rule_code']
+            if rule_code is not None and rule_code not in incoming:
+                incoming[rule_code] = rule_record['rule_hash']
+        
+        diff = {'new': [], 'changed': [], 'unchanged': [], 'removed': []}
+        for rule_code, rule_hash in incoming.items():
+            current = existing.get(rule_code)
+            if current is None:
+                diff['new'].append(rule_code)
+            elif current['is_deleted'] or current['rule_hash'] != rule_hash:
+                diff['changed'].append(current['rule_id'])
+            else:
+                diff['unchanged'].append(current['rule_id'])
+        
+        for rule_code, current in existing.items():
+            if rule_code not in incoming and not current['is_deleted']:
+                diff['removed'].append(current['rule_id'])
+        
+        return diff
+    
+    def incremental_load_dataset(self, flat: Dict[str, List[dict]], regulation_id: int) -> Dict[str, int]:
+        """
+        Apply only the differences between the JSON and the database:
+        insert new rules, update changed rules in place, soft-delete removed
+        rules. Conditions are rewritten only for new and changed rules.
+        Runs as a single transaction.
+        Returns: counts per kind of change
+        """
+        try:
+            existing = self.fetch_rule_hashes(regulation_id)
+            diff = self.diff_rules(flat, existing)
+            logger.info(
+                f"Rule diff: {len(diff['new'])} new, {len(diff['changed'])} changed, "
+                f"{len(diff['unchanged'])} unchanged, {len(diff['removed'])} removed"
+            )
+            
+            self._create_bulk_staging_tables()
+            self._copy_rows('stg_rule', self.BULK_RULE_COLUMNS, flat['rules'])
+            self._copy_rows('stg_condition', self.BULK_CONDITION_COLUMNS, flat['conditions'])
+            self._copy_rows('stg_definition', self.BULK_DEFINITION_COLUMNS, flat['definitions'])
+            
+            counts = {
+                'rules_inserted': 0,
+                'rules_updated': 0,
+                'rules_unchanged': len(diff['unchanged']),
+                'rules_deleted': 0,
+                'conditions_written': 0
+            }
+            touched_rule_ids = list(diff['changed'])
+            
+            if diff['changed']:
+                self.cursor.execute("""
+                    UPDATE rule r SET
+                        rule_text = s.rule_text,
+                        rule_type = s.rule_type,
+                        compliance_requirement = s.compliance_requirement,
+                        severity = s.severity,
+                        section_number = s.section_number,
+                        section_title = s.section_title,
+                        subsection = s.subsection,
+                        subsection_title = s.subsection_title,
+                        applies_to = s.applies_to,
+                        work_types = s.work_types,
+                        protections = s.protections,
+                        personnel_required = s.personnel_required,
+                        trigger_expression = s.trigger_expression,
+                        exception_expression = s.exception_expression,
+                        rule_hash = s.rule_hash,
+                        source_data = s.source_data,
+                        is_current = TRUE,
+                        is_deleted = FALSE,
+                        valid_to = NULL,
+                        updated_by = 'osha_loader_v2'
+                    FROM (
+                        SELECT DISTINCT ON (rule_code) *
+                        FROM stg_rule
+                        ORDER BY rule_code, seq
+                    ) s
+                    WHERE r.rule_id = ANY(%s) AND r.rule_code = s.rule_code
+                """, (diff['changed'],))
+                counts['rules_updated'] = self.cursor.rowcount
+                
+                self.cursor.execute("DELETE FROM condition WHERE rule_id = ANY(%s)", (diff['changed'],))
+            
+            if diff['new']:
+                self.cursor.execute("""
+                    INSERT INTO rule (
+                        rule_code, regulation_id, rule_text, rule_type, compliance_requirement, severity,
+                        section_number, section_title, subsection, subsection_title,
+                        applies_to, work_types, protections, personnel_required,
+                        trigger_expression, exception_expression, rule_hash,
+                        source_data, created_by, updated_by
+                    )
+                    SELECT DISTINCT ON (s.rule_code)
+                        s.rule_code, %s, s.rule_text, s.rule_type, s.compliance_requirement, s.severity,
+                        s.section_number, s.section_title, s.subsection, s.subsection_title,
+                        s.applies_to, s.work_types, s.protections, s.personnel_required,
+                        s.trigger_expression, s.exception_expression, s.rule_hash,
+                        s.source_data, 'osha_loader_v2', 'osha_loader_v2'
+                    FROM stg_rule s
+                    WHERE s.rule_code = ANY(%s)
+                    ORDER BY s.rule_code, s.seq
+                    ON CONFLICT (rule_code) DO NOTHING
+                    RETURNING rule_id, rule_code
+                """, (regulation_id, diff['new']))
+                returned = self.cursor.fetchall()
+                new_rule_ids = [row['rule_id'] for row in returned]
+                counts['rules_inserted'] = len(new_rule_ids)
+                
+                # rule_code is unique across regulations, so a code another
+                # regulation already holds is not inserted here
+                if len(returned) < len(diff['new']):
+                    inserted_codes = {row['rule_code'] for row in returned}
+                    skipped = sorted(code for code in diff['new'] if code not in inserted_codes)
+                    logger.error(f"Skipped {len(skipped)} new rules whose rule_code belongs to "
+                                 f"another regulation: {', '.join(skipped)}")
+                touched_rule_ids.extend(new_rule_ids)
+            
+            if diff['removed']:
+                self.cursor.execute("""
+                    UPDATE rule SET
+                        is_current = FALSE,
+                        is_deleted = TRUE,
+                        valid_to = CURRENT_DATE,
+                        updated_by = 'osha_loader_v2'
+                    WHERE rule_id = ANY(%s)
+                """, (diff['removed'],))
+                counts['rules_deleted'] = self.cursor.rowcount
+            
+            if touched_rule_ids:
+                self.cursor.execute("""
+                    INSERT INTO condition (
+                        rule_id, condition_key, parameter, operator, value, unit,
+                        description, data_type, condition_type, condition_details,
+                        created_by, updated_by
+                    )
+                    SELECT DISTINCT ON (r.rule_id, s.condition_key)
+                        r.rule_id, s.condition_key, s.parameter, s.operator, s.value, s.unit,
+                        s.description, s.data_type, s.condition_type, s.condition_details,
+                        'osha_loader_v2', 'osha_loader_v2'
+                    FROM stg_condition s
+                    JOIN rule r ON r.rule_code = s.rule_code
+                    WHERE r.rule_id = ANY(%s)
+                      AND s.condition_key IS NOT NULL AND s.description IS NOT NULL
+                    ORDER BY r.rule_id, s.condition_key, s.seq
+                    ON CONFLICT (rule_id, condition_key) DO NOTHING
+                """, (touched_rule_ids,))
+                counts['conditions_written'] = self.cursor.rowcount
+            
+            counts.update(self._sync_definitions_and_appendices(flat, regulation_id))
+            
+            self.conn.commit()
+            self.load_counts.update(
+                rules_count=counts['rules_inserted'] + counts['rules_updated'] + counts['rules_deleted'],
+                conditions_count=counts['conditions_written'],
+                definitions_count=counts['definitions_written'] + counts['definitions_deleted'],
+                appendices_count=counts['appendices_written'] + counts['appendices_deleted']
+            )
+            
+            logger.info(
+                f"Incremental load: {counts['rules_inserted']} rules inserted, "
+                f"{counts['rules_updated']} updated, {counts['rules_deleted']} soft-deleted, "
+                f"{counts['rules_unchanged']} unchanged, {counts['conditions_written']} conditions written"
+            )
+            return counts
+            
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Incremental load failed: {e}")
+            raise
+    
+    def _sync_definitions_and_appendices(self, flat: Dict[str, List[dict]], regulation_id: int) -> Dict[str, int]:
+        """Bring definitions and appendices in line with staged rows, touching only differing rows"""
+        counts = {}
+        
+        self.cursor.execute("""
+            INSERT INTO definition (
+                regulation_id, term, definition_text, context_section, created_by, updated_by
+            )
+            SELECT DISTINCT ON (s.term)
+                %(regulation_id)s, s.term, s.definition_text, s.context_section, 'osha_loader_v2', 'osha_loader_v2'
+            FROM stg_definition s
+            WHERE s.term IS NOT NULL AND s.definition_text IS NOT NULL
+            ORDER BY s.term, s.seq
+            ON CONFLICT (regulation_id, term) DO UPDATE SET
+                definition_text = EXCLUDED.definition_text,
+                context_section = EXCLUDED.context_section,
+                updated_by = EXCLUDED.updated_by
+            WHERE (definition.definition_text, definition.context_section)
+                  IS DISTINCT FROM (EXCLUDED.definition_text, EXCLUDED.context_section)
+        """, {'regulation_id': regulation_id})
+        counts['definitions_written'] = self.cursor.rowcount
+        
+        self.cursor.execute("""
+            DELETE FROM definition d
+            WHERE d.regulation_id = %s
+              AND NOT EXISTS (SELECT 1 FROM stg_definition s WHERE s.term = d.term)
+        """, (regulation_id,))
+        counts['definitions_deleted'] = self.cursor.rowcount
+        
+        # Appendices have no business key; (title, content_text) identifies a row
+        self.cursor.execute("""
+            CREATE TEMP TABLE stg_appendix (
+                regulation_id INTEGER,
+                title TEXT,
+                content_text TEXT,
+                appendix_type VARCHAR(200),
+                created_by VARCHAR(200),
+                updated_by VARCHAR(200)
+            ) ON COMMIT DROP
+        """)
+        appendix_rows = [dict(row, regulation_id=regulation_id) for row in flat['appendices']]
+        self._copy_rows('stg_appendix', self.BULK_APPENDIX_COLUMNS, appendix_rows)
+        
+        self.cursor.execute("""
+            DELETE FROM appendix a
+            WHERE a.regulation_id = %s
+              AND NOT EXISTS (
+                  SELECT 1 FROM stg_appendix s
+                  WHERE s.title IS NOT DISTINCT FROM a.title
+                    AND s.content_text IS NOT DISTINCT FROM a.content_text
+              )
+        """, (regulation_id,))
+        counts['appendices_deleted'] = self.cursor.rowcount
+        
+        self.cursor.execute("""
+            INSERT INTO appendix (regulation_id, title, content_text, appendix_type, created_by, updated_by)
+            SELECT s.regulation_id, s.title, s.content_text, s.appendix_type, s.created_by, s.updated_by
+            FROM stg_appendix s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM appendix a
+                WHERE a.regulation_id = s.regulation_id
+                  AND a.title IS NOT DISTINCT FROM s.title
+                  AND a.content_text IS NOT DISTINCT FROM s.content_text
+            )
+        """)
+        counts['appendices_written'] = self.cursor.rowcount
+        
+        return counts
+    
+    # ===============================
+    # STREAMING LOADING
+    # ===============================
+    
+    STREAM_BATCH_RULES = 500
+    
+    def _stream_json_items(self, json_file_path: str, prefix: str):
+        """Yield objects under a JSON path prefix one at a time without loading the whole file"""
+        with open(json_file_path, 'rb') as f:
+            yield from ijson.items(f, prefix, use_float=True)
+    
+    def _count_section_rules(self, section: dict) -> int:
+        """Count rules in a section for batch sizing"""
+        return sum(len(subsection.get('rules', [])) for subsection in section.get('subsections', []))
+    
+    def _stage_stream_batch(self, batch: dict, regulation_id: int, seq_offsets: Dict[str, int]) -> int:
+        """Flatten one bounded batch of sections or appendices into the staging tables"""
+        flat = self.flatten_dataset(batch)
+        # seq orders duplicate rule codes and terms across the whole file, not per batch
+        for key in ('rules', 'conditions', 'definitions'):
+            for row in flat[key]:
+                row['seq'] += seq_offsets[key]
+            seq_offsets[key] += len(flat[key])
+        self._stage_flat_rows(flat, regulation_id)
+        self.load_counts['appendices_count'] += len(flat['appendices'])
+        return len(flat['rules'])
+    
+    def _validate_stream_section(self, section: Any):
+        """Check that a streamed section record has the shape _iter_rules walks"""
+        if not isinstance(section, dict) or not isinstance(section.get('subsections', []), list):
+            raise ValueError(f"Invalid section record: {str(section)[:200]}")
+        for subsection in section.get('subsections', []):
+            if not isinstance(subsection, dict) or not isinstance(subsection.get('rules', []), list):
+                raise ValueError(f"Invalid subsection in section {section.get('section_number')}")
+    
+    def stream_load_dataset(self, json_file_path: str, regulation_id: int,
+                            sections: Optional[Iterator[dict]] = None) -> int:
+        """
+        Stream sections and appendices from the file into bounded batches.
+        Each batch is COPYed into the bulk staging tables and released before
+        the next is parsed, so memory stays flat regardless of file size.
+        Expects the staging tables to exist and does not commit; the caller
+        applies the staged rows with _apply_staged_rows in the same transaction.
+        Returns: number of rules staged
+        """
+        rules_staged = 0
+        seq_offsets = {'rules': 0, 'conditions': 0, 'definitions': 0}
+        
+        if sections is None:
+            sections = self._stream_json_items(json_file_path, 'sections.item')
+        
+        for key, items, size_of in (
+                ('sections', sections, self._count_section_rules),
+                ('appendices', self._stream_json_items(json_file_path, 'appendices.item'), lambda appendix: 1)):
+            pending = []
+            pending_rules = 0
+            
+            for item in items:
+                if key == 'sections':
+                    self._validate_stream_section(item)
+                pending.append(item)
+                pending_rules += size_of(item)
+                
+                if pending_rules >= self.STREAM_BATCH_RULES:
+                    rules_staged += self._stage_stream_batch({key: pending}, regulation_id, seq_offsets)
+                    pending = []
+                    pending_rules = 0
+            
+            if pending:
+                rules_staged += self._stage_stream_batch({key: pending}, regulation_id, seq_offsets)
+        
+        logger.info(f"Streamed {rules_staged} rules from {json_file_path}")
+        return rules_staged
+    
     def validate_json_structure(self, json_data: dict) -> bool:
         """Validate JSON structure before loading"""
         required_fields = ['regulation', 'sections']
@@ -510,8 +1154,11 @@ class OSHADataLoader:
         logger.info("JSON structure validation passed")
         return True
     
-    def cleanup_previous_data(self, regulation_id: int):
-        """Clean up existing data for this regulation before loading new data"""
+    def cleanup_previous_data(self, regulation_id: int, commit: bool = True):
+        """
+        Clean up existing data for this regulation before loading new data
+        With commit=False the deletes join the caller's transaction
+        """
         try:
             # Delete in reverse foreign key order
             self.cursor.execute("DELETE FROM condition WHERE rule_id IN (SELECT rule_id FROM rule WHERE regulation_id = %s)", (regulation_id,))
@@ -521,11 +1168,13 @@ class OSHADataLoader:
             self.cursor.execute("DELETE FROM definition WHERE regulation_id = %s", (regulation_id,))
             self.cursor.execute("DELETE FROM appendix WHERE regulation_id = %s", (regulation_id,))
             
-            self.conn.commit()
+            if commit:
+                self.conn.commit()
             logger.info("Cleaned up previous data for regulation")
             
         except Exception as e:
-            self.conn.rollback()
+            if commit:
+                self.conn.rollback()
             logger.error(f"Failed to cleanup previous data: {e}")
             raise
     
@@ -556,14 +1205,43 @@ class OSHADataLoader:
             logger.info(f"Appendices loaded: {summary['appendices_count']}")
             logger.info("===================")
             
+            return dict(summary)
+            
         except Exception as e:
             logger.error(f"Failed to generate summary report: {e}")
+            return None
     
-    def load_complete_dataset(self, json_file_path: str, clean_existing: bool = True):
+    def lock_regulation(self, json_data: dict):
+        """
+        Take a session-level advisory lock on the regulation code so that
+        concurrent loaders of the same regulation run one after another.
+        Released automatically when the connection closes.
+        """
+        reg_code = self.generate_regulation_code(json_data.get('regulation', {}))
+        self.cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", (reg_code,))
+        self.conn.commit()
+    
+    def load_complete_dataset(self, json_file_path: str, clean_existing: bool = True, bulk: bool = False,
+                              incremental: bool = False, stream: bool = False):
         """
         Main orchestration method to load complete OSHA dataset
+        With bulk=True rows are flattened in memory and loaded with COPY
+        in a single transaction instead of one INSERT + commit per row
+        With incremental=True only rules whose rule_hash differs are written
+        and nothing is cleaned up (clean_existing is ignored)
+        With stream=True the file is parsed incrementally (requires ijson),
+        staged in bounded batches through the bulk COPY path and committed
+        once; it cannot be combined with incremental
+        Returns: summary counts for the regulation; the rows this load
+        wrote are left in self.load_counts
         """
         logger.info(f"Starting OSHA data load from: {json_file_path}")
+        self.load_counts = dict.fromkeys(self.LOAD_COUNT_KEYS, 0)
+        
+        if stream and incremental:
+            raise ValueError("Streaming mode cannot be combined with incremental loading")
+        if stream:
+            return self._load_streamed_dataset(json_file_path, clean_existing)
         
         try:
             # Load and validate JSON
@@ -575,22 +1253,42 @@ class OSHADataLoader:
             
             # Connect to database
             self.connect()
+            self.lock_regulation(json_data)
             
             # Load regulation first to get regulation_id
             logger.info("Phase 1: Loading regulation...")
             regulation_id = self.load_regulation(json_data)
             
+            if incremental:
+                logger.info("Phase 2: Flattening dataset for incremental load...")
+                flat = self.flatten_dataset(json_data)
+                
+                logger.info("Phase 3: Applying rule hash diff...")
+                self.incremental_load_dataset(flat, regulation_id)
+                
+                summary = self.generate_summary_report(regulation_id)
+                logger.info("✅ OSHA data load completed successfully!")
+                return summary
+            
+            if bulk:
+                logger.info("Phase 2: Flattening dataset for bulk load...")
+                flat = self.flatten_dataset(json_data)
+                
+                logger.info("Phase 3: Bulk loading rules, conditions, definitions and appendices...")
+                self.bulk_load_dataset(flat, regulation_id, clean_existing)
+                
+                summary = self.generate_summary_report(regulation_id)
+                logger.info("✅ OSHA data load completed successfully!")
+                return summary
+            
             # Clean existing data if requested
             if clean_existing:
                 logger.info("Phase 1.5: Cleaning existing data...")
                 self.cleanup_previous_data(regulation_id)
             
             # Load data in proper order (respecting foreign key constraints)
-            logger.info("Phase 2: Loading rules...")
-            rule_mapping = self.load_rules(json_data, regulation_id)
-            
-            logger.info("Phase 3: Loading conditions...")
-            self.load_conditions(json_data, rule_mapping)
+            logger.info("Phase 2-3: Loading rules and conditions...")
+            self.load_rules_and_conditions(json_data, regulation_id)
             
             logger.info("Phase 4: Loading definitions...")
             self.load_definitions(json_data, regulation_id)
@@ -599,31 +1297,211 @@ class OSHADataLoader:
             self.load_appendices(json_data, regulation_id)
             
             # Generate summary report
-            self.generate_summary_report(regulation_id)
+            summary = self.generate_summary_report(regulation_id)
+            
+            logger.info("✅ OSHA data load completed successfully!")
+            return summary
+            
+        except Exception as e:
+            logger.error(f"❌ Data load failed: {e}")
+            raise
+        finally:
+            self.disconnect()
+
+    def _load_streamed_dataset(self, json_file_path: str, clean_existing: bool = True):
+        """
+        Streaming variant of load_complete_dataset for very large files.
+        Cleanup and every streamed batch share one transaction, so a failure
+        mid-file leaves the previously loaded regulation untouched.
+        """
+        if not IJSON_AVAILABLE:
+            raise RuntimeError("Streaming mode requires ijson. Install with: pip install ijson")
+        
+        sections = self._stream_json_items(json_file_path, 'sections.item')
+        try:
+            # Validate against the real regulation and first section record;
+            # the remaining sections are checked as they are streamed
+            json_data = {'regulation': next(self._stream_json_items(json_file_path, 'regulation'), None)}
+            first_section = next(sections, None)
+            if first_section is not None:
+                json_data['sections'] = [first_section]
+            if not isinstance(json_data['regulation'], dict) or not self.validate_json_structure(json_data):
+                raise ValueError("Invalid JSON structure")
+            
+            self.connect()
+            self.lock_regulation(json_data)
+            
+            logger.info("Phase 1: Loading regulation...")
+            regulation_id = self.load_regulation(json_data)
+            
+            try:
+                if clean_existing:
+                    logger.info("Phase 1.5: Cleaning existing data...")
+                    self.cleanup_previous_data(regulation_id, commit=False)
+                
+                logger.info("Phase 2: Streaming rules, conditions, definitions and appendices into staging...")
+                self._create_bulk_staging_tables()
+                self.stream_load_dataset(json_file_path, regulation_id,
+                                         itertools.chain([first_section], sections))
+                
+                logger.info("Phase 3: Applying staged rows...")
+                counts = self._apply_staged_rows(regulation_id)
+                self.conn.commit()
+                self.load_counts.update(counts)
+            except Exception:
+                self.conn.rollback()
+                raise
             
+            summary = self.generate_summary_report(regulation_id)
             logger.info("✅ OSHA data load completed successfully!")
+            return summary
             
         except Exception as e:
             logger.error(f"❌ Data load failed: {e}")
             raise
         finally:
+            sections.close()
             self.disconnect()
 
+SUBPART_FILE_PATTERN = '19*_subpart_*_compliance.json'
+
+def _load_file_worker(db_config: dict, json_file_path: str, clean_existing: bool, bulk: bool,
+                      incremental: bool) -> dict:
+    """Process pool worker: load one file on its own connection"""
+    started = time.perf_counter()
+    result = {
+        'file': os.path.basename(json_file_path),
+        'status': 'success',
+        'error': None,
+        'rules_count': 0,
+        'conditions_count': 0,
+        'definitions_count': 0,
+        'appendices_count': 0
+    }
+    
+    try:
+        loader = OSHADataLoader(db_config)
+        loader.load_complete_dataset(json_file_path, clean_existing, bulk, incremental)
+        result.update(loader.load_counts)
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    
+    result['elapsed_seconds'] = time.perf_counter() - started
+    return result
+
+def load_directory(db_config: dict, directory: str, workers: Optional[int] = None,
+                   clean_existing: bool = True, bulk: bool = True, incremental: bool = False,
+                   pattern: str = SUBPART_FILE_PATTERN) -> dict:
+    """
+    Load every subpart compliance JSON in a directory across a process pool.
+    Each file is loaded by its own worker with its own connection; loads of
+    the same regulation are serialized by an advisory lock.
+    Returns: merged summary with per-file results
+    """
+    json_files = sorted(glob.glob(os.path.join(directory, pattern)))
+    if not json_files:
+        raise ValueError(f"No files matching {pattern} in {directory}")
+    
+    workers = workers or min(len(json_files), os.cpu_count() or 1)
+    logger.info(f"Loading {len(json_files)} files from {directory} with {workers} workers")
+    
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_load_file_worker, db_config, json_file_path, clean_existing, bulk, incremental):
+                json_file_path
+            for json_file_path in json_files
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # The worker process itself died (e.g. BrokenProcessPool); its file failed
+                results.append({
+                    'file': os.path.basename(futures[future]),
+                    'status': 'failed',
+                    'error': f"{type(e).__name__}: {e}",
+                    'elapsed_seconds': time.perf_counter() - started,
+                    **dict.fromkeys(OSHADataLoader.LOAD_COUNT_KEYS, 0)
+                })
+    elapsed = time.perf_counter() - started
+    
+    results.sort(key=lambda r: r['file'])
+    count_keys = OSHADataLoader.LOAD_COUNT_KEYS
+    merged = {key: sum(r[key] for r in results) for key in count_keys}
+    merged.update({
+        'files_total': len(results),
+        'files_succeeded': sum(1 for r in results if r['status'] == 'success'),
+        'files_failed': sum(1 for r in results if r['status'] == 'failed'),
+        'elapsed_seconds': elapsed,
+        'files': results
+    })
+    
+    logger.info("=== DIRECTORY LOAD SUMMARY ===")
+    for r in results:
+        rows = sum(r[key] for key in count_keys)
+        rate = rows / r['elapsed_seconds'] if r['elapsed_seconds'] else 0
+        if r['status'] == 'success':
+            logger.info(f"{r['file']}: {rows} rows in {r['elapsed_seconds']:.2f}s ({rate:.0f} rows/s)")
+        else:
+            logger.error(f"{r['file']}: FAILED after {r['elapsed_seconds']:.2f}s - {r['error']}")
+    logger.info(f"Files: {merged['files_succeeded']}/{merged['files_total']} succeeded")
+    logger.info(f"Rules written: {merged['rules_count']}")
+    logger.info(f"Conditions written: {merged['conditions_count']}")
+    logger.info(f"Definitions written: {merged['definitions_count']}")
+    logger.info(f"Appendices written: {merged['appendices_count']}")
+    logger.info(f"Total time: {elapsed:.2f}s")
+    logger.info("==============================")
+    
+    return merged
+
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Usage: python osha_loader_v2.py <json_file_path> [--keep-existing]")
+        print("Usage: python osha_loader_v2.py <json_file_path|directory> [--keep-existing] [--bulk] [--workers N]")
         print("Example: python osha_loader_v2.py SubpartM_Updated.json")
+        print("Example: python osha_loader_v2.py . --workers 4")
         print("Options:")
         print("  --keep-existing    Don't clean existing data before loading")
+        print("  --bulk             Load with COPY into staging tables in one transaction")
+        print("  --incremental      Only write rules whose hash changed; soft-delete removed rules")
+        print("  --stream           Parse a single file incrementally and load it through the --bulk")
+        print("                     staging path in one transaction (needs ijson; not with --incremental)")
+        print("  --workers N        Process pool size for directory loads (default: CPU count)")
         sys.exit(1)
     
     json_file_path = sys.argv[1]
     clean_existing = '--keep-existing' not in sys.argv
+    bulk = '--bulk' in sys.argv
+    incremental = '--incremental' in sys.argv
+    stream = '--stream' in sys.argv
+    
+    if stream and incremental:
+        print("❌ --stream cannot be combined with --incremental")
+        sys.exit(1)
+    if stream and os.path.isdir(json_file_path):
+        print("❌ --stream loads a single file; directory loads always use --bulk")
+        sys.exit(1)
     
     try:
+        if os.path.isdir(json_file_path):
+            workers = None
+            if '--workers' in sys.argv:
+                workers = int(sys.argv[sys.argv.index('--workers') + 1])
+            
+            # Directory loads always use the single-transaction bulk path
+            summary = load_directory(DB_CONFIG, json_file_path, workers, clean_existing,
+                                     bulk=True, incremental=incremental)
+            if summary['files_failed']:
+                print(f"❌ {summary['files_failed']} file(s) failed to load")
+                sys.exit(1)
+            print("✅ Data loading completed successfully!")
+            return
+        
         loader = OSHADataLoader(DB_CONFIG)
-        loader.load_complete_dataset(json_file_path, clean_existing)
+        loader.load_complete_dataset(json_file_path, clean_existing, bulk, incremental, stream)
         print("✅ Data loading completed successfully!")
         
     except Exception as e:
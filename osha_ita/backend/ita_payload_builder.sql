@@ -43,84 +43,122 @@ $$;
 -- CASE DATA (Form 300/301) PAYLOAD BUILDER
 -- ============================================================================
 
+-- Case fields of the payload for one incident row (everything but the
+-- establishment block). Optional fields are left out when they have no value.
+CREATE OR REPLACE FUNCTION osha_ita_v1.build_case_fields_payload(p_incident osha_ita_v1.incidents)
+RETURNS jsonb LANGUAGE sql STABLE AS $$
+  SELECT jsonb_build_object(
+    'case_number', p_incident.case_number,
+    'job_title', p_incident.job_title,
+    'date_of_incident', to_char(p_incident.date_of_incident, 'MM-DD-YYYY'),
+    'incident_location', p_incident.incident_location,
+    'incident_description', p_incident.incident_description,
+    'incident_outcome', osha_ita_v1.map_outcome_to_ita(p_incident.incident_outcome)::text,
+    'type_of_incident', osha_ita_v1.map_type_to_ita(p_incident.type_of_incident)::text,
+    'date_of_birth', to_char(p_incident.date_of_birth, 'MM-DD-YYYY'),
+    'date_of_hire', to_char(p_incident.date_of_hire, 'MM-DD-YYYY'),
+    'treatment_facility_type', p_incident.treatment_facility_type::text,
+    'treatment_in_patient', p_incident.treatment_in_patient::text,
+    'nar_before_incident', p_incident.nar_before_incident,
+    'nar_what_happened', p_incident.nar_what_happened,
+    'nar_injury_illness', p_incident.nar_injury_illness,
+    'nar_object_substance', p_incident.nar_object_substance
+  ) || jsonb_strip_nulls(jsonb_build_object(
+    'dafw_num_away', CASE WHEN p_incident.dafw_num_away > 0 THEN p_incident.dafw_num_away::text END,
+    'djtr_num_tr', CASE WHEN p_incident.djtr_num_tr > 0 THEN p_incident.djtr_num_tr::text END,
+    'sex', p_incident.sex,
+    'time_started_work', to_char(p_incident.time_started_work, 'HH24:MI'),
+    'time_of_incident', to_char(p_incident.time_of_incident, 'HH24:MI'),
+    'time_unknown', CASE WHEN p_incident.time_unknown THEN '1' END,
+    'date_of_death', to_char(p_incident.date_of_death, 'MM-DD-YYYY')
+  ));
+$$;
+
 CREATE OR REPLACE FUNCTION osha_ita_v1.build_case_data_payload(p_incident_id uuid)
 RETURNS jsonb LANGUAGE plpgsql AS $$
 DECLARE
   v_payload jsonb;
-  v_incident osha_ita_v1.incidents%ROWTYPE;
-  v_est_id text;
-  v_est_name text;
 BEGIN
-  -- Get incident data
-  SELECT * INTO v_incident 
-  FROM osha_ita_v1.incidents 
-  WHERE incident_id = p_incident_id;
+  -- Build payload according to ITA API spec
+  SELECT jsonb_build_object(
+           'establishment', jsonb_build_object(
+             'id', e.establishment_id::text,
+             'establishment_name', e.establishment_name
+           )
+         ) || osha_ita_v1.build_case_fields_payload(i)
+  INTO v_payload
+  FROM osha_ita_v1.incidents i
+  LEFT JOIN osha_ita_v1.establishments e ON e.establishment_id = i.establishment_id
+  WHERE i.incident_id = p_incident_id;
   
   IF NOT FOUND THEN
     RAISE EXCEPTION 'Incident % not found', p_incident_id;
   END IF;
   
-  -- Get establishment data
-  SELECT establishment_id::text, establishment_name 
-  INTO v_est_id, v_est_name
-  FROM osha_ita_v1.establishments 
-  WHERE establishment_id = v_incident.establishment_id;
-  
-  -- Build payload according to ITA API spec
-  v_payload := jsonb_build_object(
-    'establishment', jsonb_build_object(
-      'id', v_est_id,
-      'establishment_name', v_est_name
-    ),
-    'case_number', v_incident.case_number,
-    'job_title', v_incident.job_title,
-    'date_of_incident', to_char(v_incident.date_of_incident, 'MM-DD-YYYY'),
-    'incident_location', v_incident.incident_location,
-    'incident_description', v_incident.incident_description,
-    'incident_outcome', osha_ita_v1.map_outcome_to_ita(v_incident.incident_outcome)::text,
-    'type_of_incident', osha_ita_v1.map_type_to_ita(v_incident.type_of_incident)::text,
-    'date_of_birth', to_char(v_incident.date_of_birth, 'MM-DD-YYYY'),
-    'date_of_hire', to_char(v_incident.date_of_hire, 'MM-DD-YYYY'),
-    'treatment_facility_type', v_incident.treatment_facility_type::text,
-    'treatment_in_patient', v_incident.treatment_in_patient::text,
-    'nar_before_incident', v_incident.nar_before_incident,
-    'nar_what_happened', v_incident.nar_what_happened,
-    'nar_injury_illness', v_incident.nar_injury_illness,
-    'nar_object_substance', v_incident.nar_object_substance
-  );
-  
-  -- Add optional fields only if they have values
-  IF v_incident.dafw_num_away IS NOT NULL AND v_incident.dafw_num_away > 0 THEN
-    v_payload := v_payload || jsonb_build_object('dafw_num_away', v_incident.dafw_num_away::text);
-  END IF;
-  
-  IF v_incident.djtr_num_tr IS NOT NULL AND v_incident.djtr_num_tr > 0 THEN
-    v_payload := v_payload || jsonb_build_object('djtr_num_tr', v_incident.djtr_num_tr::text);
-  END IF;
-  
-  IF v_incident.sex IS NOT NULL THEN
-    v_payload := v_payload || jsonb_build_object('sex', v_incident.sex);
-  END IF;
-  
-  IF v_incident.time_started_work IS NOT NULL THEN
-    v_payload := v_payload || jsonb_build_object('time_started_work', to_char(v_incident.time_started_work, 'HH24:MI'));
-  END IF;
-  
-  IF v_incident.time_of_incident IS NOT NULL THEN
-    v_payload := v_payload || jsonb_build_object('time_of_incident', to_char(v_incident.time_of_incident, 'HH24:MI'));
-  END IF;
-  
-  IF v_incident.time_unknown THEN
-    v_payload := v_payload || jsonb_build_object('time_unknown', '1');
-  END IF;
-  
-  IF v_incident.date_of_death IS NOT NULL THEN
-    v_payload := v_payload || jsonb_build_object('date_of_death', to_char(v_incident.date_of_death, 'MM-DD-YYYY'));
-  END IF;
-  
   RETURN v_payload;
 END $$;
 
+-- ============================================================================
+-- CASE PAYLOAD CACHE
+-- Case fields per incident, reused between submission attempts. An entry is
+-- stale once the incident's content_hash differs from the one it was built
+-- from; content_hash only covers the identifying fields, so any update to an
+-- incident also drops its entry.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS osha_ita_v1.case_payload_cache (
+  incident_id uuid PRIMARY KEY REFERENCES osha_ita_v1.incidents(incident_id) ON DELETE CASCADE,
+  content_hash varchar(64) NOT NULL,
+  payload jsonb NOT NULL,
+  built_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE OR REPLACE FUNCTION osha_ita_v1.invalidate_case_payload_cache()
+RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+  DELETE FROM osha_ita_v1.case_payload_cache c
+  USING new_rows n
+  WHERE c.incident_id = n.incident_id;
+  RETURN NULL;
+END $$;
+
+CREATE OR REPLACE TRIGGER trg_case_payload_cache_invalidate
+  AFTER UPDATE ON osha_ita_v1.incidents
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION osha_ita_v1.invalidate_case_payload_cache();
+
+-- Build cache entries for approved incidents that have none or a stale one
+CREATE OR REPLACE FUNCTION osha_ita_v1.refresh_case_payload_cache(
+  p_establishment_id uuid,
+  p_filing_year int
+)
+RETURNS int LANGUAGE plpgsql AS $$
+DECLARE
+  v_count int;
+BEGIN
+  INSERT INTO osha_ita_v1.case_payload_cache(incident_id, content_hash, payload)
+  SELECT i.incident_id, i.content_hash, osha_ita_v1.build_case_fields_payload(i)
+  FROM osha_ita_v1.incidents i
+  WHERE i.establishment_id = p_establishment_id
+    AND i.filing_year = p_filing_year
+    AND i.current_state = 'approved'
+    AND i.content_hash IS NOT NULL
+    AND NOT EXISTS (
+      SELECT 1 
+      FROM osha_ita_v1.case_payload_cache c
+      WHERE c.incident_id = i.incident_id
+        AND c.content_hash = i.content_hash
+    )
+  ON CONFLICT (incident_id) DO UPDATE
+  SET content_hash = EXCLUDED.content_hash,
+      payload = EXCLUDED.payload,
+      built_at = now();
+
+  GET DIAGNOSTICS v_count = ROW_COUNT;
+  RETURN v_count;
+END $$;
+
 -- ============================================================================
 -- FORM 300A PAYLOAD BUILDER
 -- ============================================================================
@@ -216,20 +254,29 @@ CREATE OR REPLACE FUNCTION osha_ita_v1.build_batch_case_data_payload(
 )
 RETURNS jsonb LANGUAGE plpgsql AS $$
 DECLARE
-  v_cases jsonb := '[]'::jsonb;
-  v_incident_id uuid;
+  v_cases jsonb;
 BEGIN
-  -- Get all approved incidents for this establishment/year
-  FOR v_incident_id IN
-    SELECT incident_id 
-    FROM osha_ita_v1.incidents
-    WHERE establishment_id = p_establishment_id
-      AND filing_year = p_filing_year
-      AND current_state = 'approved'
-    ORDER BY case_number
-  LOOP
-    v_cases := v_cases || osha_ita_v1.build_case_data_payload(v_incident_id);
-  END LOOP;
+  PERFORM osha_ita_v1.refresh_case_payload_cache(p_establishment_id, p_filing_year);
+
+  -- All approved incidents for this establishment/year in one aggregate
+  SELECT COALESCE(jsonb_agg(
+           jsonb_build_object(
+             'establishment', jsonb_build_object(
+               'id', e.establishment_id::text,
+               'establishment_name', e.establishment_name
+             )
+           ) || COALESCE(c.payload, osha_ita_v1.build_case_fields_payload(i))
+           ORDER BY i.case_number
+         ), '[]'::jsonb)
+  INTO v_cases
+  FROM osha_ita_v1.incidents i
+  LEFT JOIN osha_ita_v1.establishments e ON e.establishment_id = i.establishment_id
+  LEFT JOIN osha_ita_v1.case_payload_cache c 
+    ON c.incident_id = i.incident_id
+   AND c.content_hash = i.content_hash
+  WHERE i.establishment_id = p_establishment_id
+    AND i.filing_year = p_filing_year
+    AND i.current_state = 'approved';
   
   RETURN v_cases;
 END $$;
@@ -289,47 +336,60 @@ END $$;
 -- Validates that an incident is ready for ITA submission
 -- ============================================================================
 
+-- Readiness of every incident, with each rule as a column expression so
+-- whole establishments (or many of them) are checked in one scan
+CREATE OR REPLACE VIEW osha_ita_v1.v_incident_ita_readiness AS
+SELECT
+  r.incident_id,
+  r.establishment_id,
+  r.filing_year,
+  r.case_number,
+  r.current_state,
+  (jsonb_array_length(r.errors) = 0) AS is_valid,
+  r.errors
+FROM (
+  SELECT
+    i.incident_id,
+    i.establishment_id,
+    i.filing_year,
+    i.case_number,
+    i.current_state,
+    -- Check required fields
+    CASE WHEN i.case_number IS NULL THEN
+      jsonb_build_array(jsonb_build_object('field', 'case_number', 'message', 'Required'))
+    ELSE '[]'::jsonb END
+    || CASE WHEN i.job_title IS NULL THEN
+      jsonb_build_array(jsonb_build_object('field', 'job_title', 'message', 'Required'))
+    ELSE '[]'::jsonb END
+    || CASE WHEN i.date_of_incident IS NULL THEN
+      jsonb_build_array(jsonb_build_object('field', 'date_of_incident', 'message', 'Required'))
+    ELSE '[]'::jsonb END
+    -- Validate outcome-specific fields
+    || CASE WHEN i.incident_outcome = 'death' AND i.date_of_death IS NULL THEN
+      jsonb_build_array(jsonb_build_object('field', 'date_of_death', 'message', 'Required for death outcomes'))
+    ELSE '[]'::jsonb END
+    || CASE WHEN i.incident_outcome = 'days_away' AND (i.dafw_num_away IS NULL OR i.dafw_num_away = 0) THEN
+      jsonb_build_array(jsonb_build_object('field', 'dafw_num_away', 'message', 'Must be > 0 for days away outcome'))
+    ELSE '[]'::jsonb END
+    -- Check state
+    || CASE WHEN i.current_state != 'approved' THEN
+      jsonb_build_array(jsonb_build_object('field', 'current_state', 'message', 'Incident must be approved before submission'))
+    ELSE '[]'::jsonb END
+    AS errors
+  FROM osha_ita_v1.incidents i
+) r;
+
 CREATE OR REPLACE FUNCTION osha_ita_v1.validate_incident_for_ita(p_incident_id uuid)
 RETURNS TABLE(is_valid boolean, errors jsonb) LANGUAGE plpgsql AS $$
-DECLARE
-  v_incident osha_ita_v1.incidents%ROWTYPE;
-  v_errors jsonb := '[]'::jsonb;
 BEGIN
-  SELECT * INTO v_incident FROM osha_ita_v1.incidents WHERE incident_id = p_incident_id;
+  RETURN QUERY
+  SELECT r.is_valid, r.errors
+  FROM osha_ita_v1.v_incident_ita_readiness r
+  WHERE r.incident_id = p_incident_id;
   
   IF NOT FOUND THEN
     RETURN QUERY SELECT false, jsonb_build_array(jsonb_build_object('error', 'Incident not found'));
-    RETURN;
-  END IF;
-  
-  -- Check required fields
-  IF v_incident.case_number IS NULL THEN
-    v_errors := v_errors || jsonb_build_object('field', 'case_number', 'message', 'Required');
-  END IF;
-  
-  IF v_incident.job_title IS NULL THEN
-    v_errors := v_errors || jsonb_build_object('field', 'job_title', 'message', 'Required');
-  END IF;
-  
-  IF v_incident.date_of_incident IS NULL THEN
-    v_errors := v_errors || jsonb_build_object('field', 'date_of_incident', 'message', 'Required');
-  END IF;
-  
-  -- Validate outcome-specific fields
-  IF v_incident.incident_outcome = 'death' AND v_incident.date_of_death IS NULL THEN
-    v_errors := v_errors || jsonb_build_object('field', 'date_of_death', 'message', 'Required for death outcomes');
-  END IF;
-  
-  IF v_incident.incident_outcome = 'days_away' AND (v_incident.dafw_num_away IS NULL OR v_incident.dafw_num_away = 0) THEN
-    v_errors := v_errors || jsonb_build_object('field', 'dafw_num_away', 'message', 'Must be > 0 for days away outcome');
-  END IF;
-  
-  -- Check state
-  IF v_incident.current_state != 'approved' THEN
-    v_errors := v_errors || jsonb_build_object('field', 'current_state', 'message', 'Incident must be approved before submission');
   END IF;
-  
-  RETURN QUERY SELECT (jsonb_array_length(v_errors) = 0), v_errors;
 END $$;
 
 -- ============================================================================
@@ -349,16 +409,42 @@ RETURNS TABLE(
 BEGIN
   RETURN QUERY
   SELECT 
-    i.incident_id,
-    i.case_number,
-    v.is_valid,
-    v.errors
-  FROM osha_ita_v1.incidents i
-  CROSS JOIN LATERAL osha_ita_v1.validate_incident_for_ita(i.incident_id) v
-  WHERE i.establishment_id = p_establishment_id
-    AND i.filing_year = p_filing_year
-    AND i.current_state = 'approved'
-  ORDER BY i.case_number;
+    r.incident_id,
+    r.case_number,
+    r.is_valid,
+    r.errors
+  FROM osha_ita_v1.v_incident_ita_readiness r
+  WHERE r.establishment_id = p_establishment_id
+    AND r.filing_year = p_filing_year
+    AND r.current_state = 'approved'
+  ORDER BY r.case_number;
+END $$;
+
+-- Same check for many establishments in one call
+CREATE OR REPLACE FUNCTION osha_ita_v1.get_incidents_ready_for_ita_bulk(
+  p_establishment_ids uuid[],
+  p_filing_year int
+)
+RETURNS TABLE(
+  establishment_id uuid,
+  incident_id uuid,
+  case_number text,
+  is_valid boolean,
+  validation_errors jsonb
+) LANGUAGE plpgsql AS $$
+BEGIN
+  RETURN QUERY
+  SELECT 
+    r.establishment_id,
+    r.incident_id,
+    r.case_number,
+    r.is_valid,
+    r.errors
+  FROM osha_ita_v1.v_incident_ita_readiness r
+  WHERE r.establishment_id = ANY(p_establishment_ids)
+    AND r.filing_year = p_filing_year
+    AND r.current_state = 'approved'
+  ORDER BY r.establishment_id, r.case_number;
 END $$;
 
 
@@ -376,5 +462,8 @@ SELECT osha_ita_v1.build_batch_case_data_payload(establishment_id, 2024);
 -- Validate before submission
 SELECT * FROM osha_ita_v1.get_incidents_ready_for_ita(establishment_id, 2024);
 
+-- Validate several establishments at once
+SELECT * FROM osha_ita_v1.get_incidents_ready_for_ita_bulk(ARRAY[establishment_id, other_establishment_id], 2024);
+
 -- Complete submission payload
 SELECT osha_ita_v1.build_complete_submission_payload(establishment_id, 2024, 'Correcting data per OSHA feedback');
\ No newline at end of file
@@ -363,6 +363,12 @@ CREATE INDEX idx_form300a_estab_year
   ON osha_ita_v1.form_300a_summaries(establishment_id, filing_year) 
   WHERE is_current;
 
+-- Incidents whose projections are out of date, drained by process_projection_queue
+CREATE TABLE osha_ita_v1.projection_queue (
+  incident_id uuid PRIMARY KEY REFERENCES osha_ita_v1.incidents(incident_id) ON DELETE CASCADE,
+  queued_at timestamptz NOT NULL DEFAULT now()
+);
+
 -- ============================================================================
 -- PERIOD LOCKS
 -- ============================================================================
@@ -538,6 +544,30 @@ BEGIN
   RETURN NEW;
 END $$;
 
+-- Queue approved incidents (or ones leaving approved) for re-projection
+CREATE OR REPLACE FUNCTION osha_ita_v1.queue_incident_projection() 
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    INSERT INTO osha_ita_v1.projection_queue(incident_id)
+    SELECT n.incident_id
+    FROM new_rows n
+    WHERE n.current_state = 'approved'
+    ON CONFLICT (incident_id) DO NOTHING;
+  ELSE
+    INSERT INTO osha_ita_v1.projection_queue(incident_id)
+    SELECT n.incident_id
+    FROM new_rows n
+    JOIN old_rows o ON o.incident_id = n.incident_id
+    WHERE n.current_state = 'approved' 
+       OR o.current_state = 'approved'
+    ON CONFLICT (incident_id) DO NOTHING;
+  END IF;
+
+  RETURN NULL;
+END $$;
+
 -- ============================================================================
 -- CREATE TRIGGERS
 -- ============================================================================
@@ -571,6 +601,19 @@ CREATE TRIGGER trg_touch_incidents
   FOR EACH ROW 
   EXECUTE FUNCTION osha_ita_v1.touch_updated_at();
 
+-- Projection queue triggers
+CREATE TRIGGER trg_queue_projection_insert
+  AFTER INSERT ON osha_ita_v1.incidents
+  REFERENCING NEW TABLE AS new_rows
+  FOR EACH STATEMENT 
+  EXECUTE FUNCTION osha_ita_v1.queue_incident_projection();
+
+CREATE TRIGGER trg_queue_projection_update
+  AFTER UPDATE ON osha_ita_v1.incidents
+  REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+  FOR EACH STATEMENT 
+  EXECUTE FUNCTION osha_ita_v1.queue_incident_projection();
+
 -- ============================================================================
 -- IMPORT VALIDATION FUNCTION
 -- ============================================================================
@@ -641,6 +684,102 @@ BEGIN
   );
 END $$;
 
+-- Validate a whole import batch with the same rules as validate_import_row.
+-- Rows still awaiting promotion (pending/valid/invalid) are checked and
+-- updated in one statement, and the batch valid_rows/invalid_rows counters
+-- are adjusted by the change. For very large imports run one call per chunk
+-- from separate sessions, e.g. validate_import_batch(batch, n, 4) for n in 0..3;
+-- chunks split on row_number so they never touch the same rows.
+CREATE OR REPLACE FUNCTION osha_ita_v1.validate_import_batch(
+  p_batch_id uuid,
+  p_chunk int DEFAULT 0,
+  p_chunks int DEFAULT 1
+)
+RETURNS jsonb
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_checked int;
+  v_valid int;
+  v_invalid int;
+  v_valid_delta int;
+  v_invalid_delta int;
+BEGIN
+  IF p_chunks < 1 OR p_chunk < 0 OR p_chunk >= p_chunks THEN
+    RAISE EXCEPTION 'Invalid chunk % of %', p_chunk, p_chunks;
+  END IF;
+
+  WITH estab AS (
+    SELECT DISTINCT ON (establishment_name) establishment_name, establishment_id
+    FROM osha_ita_v1.establishments
+    WHERE is_active = true
+    ORDER BY establishment_name, created_at
+  ),
+  checked AS (
+    SELECT
+      r.row_id,
+      r.status AS old_status,
+      e.establishment_id,
+      (
+        CASE WHEN r.raw_data->>'establishment_name' IS NULL THEN
+          jsonb_build_array(jsonb_build_object('field', 'establishment_name', 'message', 'Required'))
+        ELSE '[]'::jsonb END
+        || CASE WHEN r.raw_data->>'year_of_filing' IS NULL OR
+                     (r.raw_data->>'year_of_filing') !~ '^\d{4}$' THEN
+          jsonb_build_array(jsonb_build_object('field', 'year_of_filing', 'message', '4-digit year required'))
+        ELSE '[]'::jsonb END
+        || CASE WHEN r.raw_data->>'case_number' IS NULL THEN
+          jsonb_build_array(jsonb_build_object('field', 'case_number', 'message', 'Required'))
+        ELSE '[]'::jsonb END
+        || CASE WHEN e.establishment_id IS NULL THEN
+          jsonb_build_array(jsonb_build_object('field', 'establishment_name', 'message', 'Unknown establishment'))
+        ELSE '[]'::jsonb END
+      ) AS errors
+    FROM osha_ita_v1.import_rows r
+    LEFT JOIN estab e ON e.establishment_name = r.raw_data->>'establishment_name'
+    WHERE r.batch_id = p_batch_id
+      AND r.status IN ('pending', 'valid', 'invalid')
+      AND r.row_number % p_chunks = p_chunk
+  ),
+  updated AS (
+    UPDATE osha_ita_v1.import_rows r
+    SET validation_errors = c.errors,
+        validation_warnings = '[]'::jsonb,
+        establishment_id = c.establishment_id,
+        status = CASE
+          WHEN jsonb_array_length(c.errors) = 0 THEN 'valid'::osha_ita_v1.row_status
+          ELSE 'invalid'::osha_ita_v1.row_status
+        END,
+        processed_at = now()
+    FROM checked c
+    WHERE r.row_id = c.row_id
+    RETURNING c.old_status, r.status
+  )
+  SELECT
+    count(*),
+    count(*) FILTER (WHERE status = 'valid'),
+    count(*) FILTER (WHERE status = 'invalid'),
+    count(*) FILTER (WHERE status = 'valid') - count(*) FILTER (WHERE old_status = 'valid'),
+    count(*) FILTER (WHERE status = 'invalid') - count(*) FILTER (WHERE old_status = 'invalid')
+  INTO v_checked, v_valid, v_invalid, v_valid_delta, v_invalid_delta
+  FROM updated;
+
+  -- Deltas rather than recounts so concurrent chunks add up correctly
+  UPDATE osha_ita_v1.import_batches
+  SET valid_rows = COALESCE(valid_rows, 0) + v_valid_delta,
+      invalid_rows = COALESCE(invalid_rows, 0) + v_invalid_delta
+  WHERE batch_id = p_batch_id
+    AND (v_valid_delta <> 0 OR v_invalid_delta <> 0);
+
+  RETURN jsonb_build_object(
+    'batch_id', p_batch_id,
+    'chunk', p_chunk,
+    'chunks', p_chunks,
+    'checked_rows', v_checked,
+    'valid_rows', v_valid,
+    'invalid_rows', v_invalid
+  );
+END $$;
+
 -- ============================================================================
 -- FORM PROJECTION FUNCTIONS
 -- ============================================================================
@@ -782,7 +921,8 @@ BEGIN
     total_deaths, total_dafw_cases, total_djtr_cases, total_other_cases,
     total_dafw_days, total_djtr_days,
     total_injuries, total_skin_disorders, total_respiratory_conditions,
-    total_poisonings, total_hearing_loss, total_other_illnesses
+    total_poisonings, total_hearing_loss, total_other_illnesses,
+    projection_version
   )
   SELECT
     p_establishment_id,
@@ -809,7 +949,11 @@ BEGIN
     COUNT(*) FILTER (WHERE type_of_incident = 'respiratory_condition'),
     COUNT(*) FILTER (WHERE type_of_incident = 'poisoning'),
     COUNT(*) FILTER (WHERE type_of_incident = 'hearing_loss'),
-    COUNT(*) FILTER (WHERE type_of_incident = 'other_illness')
+    COUNT(*) FILTER (WHERE type_of_incident = 'other_illness'),
+    (SELECT COALESCE(MAX(s.projection_version), 0) + 1
+     FROM osha_ita_v1.form_300a_summaries s
+     WHERE s.establishment_id = p_establishment_id
+       AND s.filing_year = p_year)
   FROM osha_ita_v1.incidents
   WHERE establishment_id = p_establishment_id
     AND filing_year = p_year
@@ -828,6 +972,370 @@ BEGIN
   PERFORM osha_ita_v1.rebuild_form_301(p_establishment_id, p_year);
   PERFORM osha_ita_v1.rebuild_form_300(p_establishment_id, p_year);
   PERFORM osha_ita_v1.rebuild_form_300a(p_establishment_id, p_year);
+
+  -- Everything queued for this period is now up to date
+  DELETE FROM osha_ita_v1.projection_queue q
+  USING osha_ita_v1.incidents i
+  WHERE i.incident_id = q.incident_id
+    AND i.establishment_id = p_establishment_id
+    AND i.filing_year = p_year;
+END $$;
+
+-- Re-project only queued incidents, across all establishments in one pass.
+-- Form 300/301 rows are superseded and re-inserted per incident; current
+-- Form 300A summaries get a new version adjusted by the change in Form 300
+-- entries (employment figures carry over). Periods without a current 300A
+-- get a full one. Workers run one at a time so summary deltas never race.
+CREATE OR REPLACE FUNCTION osha_ita_v1.process_projection_queue(p_limit int DEFAULT NULL)
+RETURNS jsonb 
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_incidents int;
+  v_adjusted int;
+  v_created int;
+BEGIN
+  PERFORM pg_advisory_xact_lock(hashtext('osha_ita_v1.process_projection_queue'));
+
+  CREATE TEMP TABLE IF NOT EXISTS projection_batch (
+    incident_id uuid PRIMARY KEY
+  ) ON COMMIT DELETE ROWS;
+  TRUNCATE projection_batch;
+
+  CREATE TEMP TABLE IF NOT EXISTS projection_periods (
+    establishment_id uuid,
+    filing_year int,
+    PRIMARY KEY (establishment_id, filing_year)
+  ) ON COMMIT DELETE ROWS;
+  TRUNCATE projection_periods;
+
+  -- Form 300 entries removed (sign -1) and added (sign +1) by this pass
+  CREATE TEMP TABLE IF NOT EXISTS projection_300_delta (
+    establishment_id uuid,
+    filing_year int,
+    sign int,
+    death boolean,
+    days_away_from_work boolean,
+    job_transfer_restriction boolean,
+    other_recordable boolean,
+    days_away_count int,
+    days_restricted_count int,
+    is_injury boolean,
+    is_skin_disorder boolean,
+    is_respiratory boolean,
+    is_poisoning boolean,
+    is_hearing_loss boolean,
+    is_other_illness boolean
+  ) ON COMMIT DELETE ROWS;
+  TRUNCATE projection_300_delta;
+
+  WITH claimed AS (
+    DELETE FROM osha_ita_v1.projection_queue q
+    WHERE q.incident_id IN (
+      SELECT incident_id
+      FROM osha_ita_v1.projection_queue
+      ORDER BY queued_at
+      LIMIT p_limit
+    )
+    RETURNING q.incident_id
+  )
+  INSERT INTO projection_batch
+  SELECT incident_id FROM claimed;
+
+  GET DIAGNOSTICS v_incidents = ROW_COUNT;
+  IF v_incidents = 0 THEN
+    RETURN jsonb_build_object('incidents', 0, 'summaries_adjusted', 0, 'summaries_created', 0);
+  END IF;
+
+  -- Periods the incidents are in now, and were projected into before
+  INSERT INTO projection_periods
+  SELECT i.establishment_id, i.filing_year
+  FROM osha_ita_v1.incidents i
+  JOIN projection_batch b ON b.incident_id = i.incident_id
+  UNION
+  SELECT l.establishment_id, l.filing_year
+  FROM osha_ita_v1.form_300_log l
+  JOIN projection_batch b ON b.incident_id = l.incident_id
+  WHERE l.is_current;
+
+  -- Periods without a current summary are projected in full
+  INSERT INTO projection_batch
+  SELECT i.incident_id
+  FROM projection_periods p
+  JOIN osha_ita_v1.incidents i
+    ON i.establishment_id = p.establishment_id
+   AND i.filing_year = p.filing_year
+   AND i.current_state = 'approved'
+  WHERE NOT EXISTS (
+    SELECT 1
+    FROM osha_ita_v1.form_300a_summaries s
+    WHERE s.establishment_id = p.establishment_id
+      AND s.filing_year = p.filing_year
+      AND s.is_current = true
+  )
+  ON CONFLICT (incident_id) DO NOTHING;
+
+  -- Form 301
+  WITH superseded AS (
+    UPDATE osha_ita_v1.form_301_reports r
+    SET is_current = false,
+        superseded_at = now()
+    FROM projection_batch b
+    WHERE r.incident_id = b.incident_id
+      AND r.is_current = true
+    RETURNING r.incident_id, r.projection_version
+  )
+  INSERT INTO osha_ita_v1.form_301_reports(
+    incident_id, snapshot_data,
+    establishment_name, year_of_filing, case_number, job_title,
+    date_of_incident, incident_location, incident_description,
+    incident_outcome, dafw_num_away, djtr_num_tr, type_of_incident,
+    date_of_birth, date_of_hire, sex, 
+    treatment_facility_type, treatment_in_patient,
+    time_started_work, time_of_incident, time_unknown,
+    nar_before_incident, nar_what_happened, nar_injury_illness, nar_object_substance,
+    date_of_death, projected_by, projection_version
+  )
+  SELECT
+    i.incident_id,
+    to_jsonb(i.*) - 'content_hash' - 'created_by' - 'updated_by' AS snapshot_data,
+    e.establishment_name, i.filing_year, i.case_number, i.job_title,
+    i.date_of_incident, i.incident_location, i.incident_description,
+    i.incident_outcome, i.dafw_num_away, i.djtr_num_tr, i.type_of_incident,
+    i.date_of_birth, i.date_of_hire, i.sex, 
+    i.treatment_facility_type, i.treatment_in_patient,
+    i.time_started_work, i.time_of_incident, i.time_unknown,
+    i.nar_before_incident, i.nar_what_happened, i.nar_injury_illness, i.nar_object_substance,
+    i.date_of_death, NULL::uuid,
+    COALESCE(s.projection_version, 0) + 1
+  FROM projection_batch b
+  JOIN osha_ita_v1.incidents i ON i.incident_id = b.incident_id
+  JOIN osha_ita_v1.establishments e ON e.establishment_id = i.establishment_id
+  LEFT JOIN (
+    SELECT incident_id, MAX(projection_version) AS projection_version
+    FROM superseded
+    GROUP BY incident_id
+  ) s ON s.incident_id = i.incident_id
+  WHERE i.current_state = 'approved';
+
+  -- Form 300
+  WITH superseded AS (
+    UPDATE osha_ita_v1.form_300_log l
+    SET is_current = false,
+        superseded_at = now()
+    FROM projection_batch b
+    WHERE l.incident_id = b.incident_id
+      AND l.is_current = true
+    RETURNING l.*
+  ),
+  removed AS (
+    INSERT INTO projection_300_delta
+    SELECT
+      establishment_id, filing_year, -1,
+      death, days_away_from_work, job_transfer_restriction, other_recordable,
+      days_away_count, days_restricted_count,
+      is_injury, is_skin_disorder, is_respiratory, is_poisoning, is_hearing_loss, is_other_illness
+    FROM superseded
+  ),
+  added AS (
+    INSERT INTO osha_ita_v1.form_300_log(
+      establishment_id, incident_id, filing_year, snapshot_data,
+      case_number, employee_name, job_title, date_of_injury, where_event_occurred,
+      injury_description, death, days_away_from_work, job_transfer_restriction, other_recordable,
+      days_away_count, days_restricted_count,
+      is_injury, is_skin_disorder, is_respiratory, is_poisoning, is_hearing_loss, is_other_illness,
+      projection_version
+    )
+    SELECT
+      i.establishment_id, i.incident_id, i.filing_year,
+      to_jsonb(i.*) - 'content_hash' - 'created_by' - 'updated_by',
+      i.case_number,
+      CASE WHEN i.is_privacy_case THEN 'Privacy Case' ELSE NULL END AS employee_name,
+      i.job_title,
+      i.date_of_incident AS date_of_injury,
+      i.incident_location AS where_event_occurred,
+      i.incident_description AS injury_description,
+      (i.incident_outcome = 'death') AS death,
+      (i.incident_outcome = 'days_away') AS days_away_from_work,
+      (i.incident_outcome = 'job_transfer_restriction') AS job_transfer_restriction,
+      (i.incident_outcome = 'other_recordable') AS other_recordable,
+      COALESCE(i.dafw_num_away, 0) AS days_away_count,
+      COALESCE(i.djtr_num_tr, 0) AS days_restricted_count,
+      (i.type_of_incident = 'injury'),
+      (i.type_of_incident = 'skin_disorder'),
+      (i.type_of_incident = 'respiratory_condition'),
+      (i.type_of_incident = 'poisoning'),
+      (i.type_of_incident = 'hearing_loss'),
+      (i.type_of_incident = 'other_illness'),
+      COALESCE(s.projection_version, 0) + 1
+    FROM projection_batch b
+    JOIN osha_ita_v1.incidents i ON i.incident_id = b.incident_id
+    LEFT JOIN (
+      SELECT incident_id, MAX(projection_version) AS projection_version
+      FROM superseded
+      GROUP BY incident_id
+    ) s ON s.incident_id = i.incident_id
+    WHERE i.current_state = 'approved'
+      AND i.incident_outcome IN ('death', 'days_away', 'job_transfer_restriction', 'other_recordable')
+    RETURNING *
+  )
+  INSERT INTO projection_300_delta
+  SELECT
+    establishment_id, filing_year, 1,
+    death, days_away_from_work, job_transfer_restriction, other_recordable,
+    days_away_count, days_restricted_count,
+    is_injury, is_skin_disorder, is_respiratory, is_poisoning, is_hearing_loss, is_other_illness
+  FROM added;
+
+  -- Form 300A: new version of each current summary whose totals moved
+  WITH delta AS (
+    SELECT
+      establishment_id,
+      filing_year,
+      SUM(sign * death::int) AS deaths,
+      SUM(sign * days_away_from_work::int) AS dafw_cases,
+      SUM(sign * job_transfer_restriction::int) AS djtr_cases,
+      SUM(sign * other_recordable::int) AS other_cases,
+      SUM(sign * CASE WHEN days_away_from_work THEN days_away_count ELSE 0 END) AS dafw_days,
+      SUM(sign * CASE WHEN days_away_from_work OR job_transfer_restriction 
+                      THEN days_restricted_count ELSE 0 END) AS djtr_days,
+      SUM(sign * is_injury::int) AS injuries,
+      SUM(sign * is_skin_disorder::int) AS skin_disorders,
+      SUM(sign * is_respiratory::int) AS respiratory_conditions,
+      SUM(sign * is_poisoning::int) AS poisonings,
+      SUM(sign * is_hearing_loss::int) AS hearing_loss,
+      SUM(sign * is_other_illness::int) AS other_illnesses
+    FROM projection_300_delta
+    GROUP BY establishment_id, filing_year
+  ),
+  changed AS (
+    SELECT *
+    FROM delta
+    WHERE (deaths, dafw_cases, djtr_cases, other_cases, dafw_days, djtr_days,
+           injuries, skin_disorders, respiratory_conditions, poisonings, hearing_loss, other_illnesses)
+          IS DISTINCT FROM (0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+  ),
+  superseded AS (
+    UPDATE osha_ita_v1.form_300a_summaries s
+    SET is_current = false,
+        superseded_at = now()
+    FROM changed c
+    WHERE s.establishment_id = c.establishment_id
+      AND s.filing_year = c.filing_year
+      AND s.is_current = true
+    RETURNING s.*
+  )
+  INSERT INTO osha_ita_v1.form_300a_summaries(
+    establishment_id, filing_year,
+    establishment_name, street_address, city, state, zip,
+    naics_code, industry_description, establishment_type,
+    annual_average_employees, total_hours_worked,
+    no_injuries_illnesses,
+    total_deaths, total_dafw_cases, total_djtr_cases, total_other_cases,
+    total_dafw_days, total_djtr_days,
+    total_injuries, total_skin_disorders, total_respiratory_conditions,
+    total_poisonings, total_hearing_loss, total_other_illnesses,
+    projection_version
+  )
+  SELECT
+    s.establishment_id,
+    s.filing_year,
+    e.establishment_name,
+    e.street_address,
+    e.city,
+    e.state,
+    e.zip,
+    e.naics_code,
+    e.industry_description,
+    e.establishment_type,
+    s.annual_average_employees,
+    s.total_hours_worked,
+    (s.total_deaths + s.total_dafw_cases + s.total_djtr_cases + s.total_other_cases
+      + c.deaths + c.dafw_cases + c.djtr_cases + c.other_cases) = 0,
+    s.total_deaths + c.deaths,
+    s.total_dafw_cases + c.dafw_cases,
+    s.total_djtr_cases + c.djtr_cases,
+    s.total_other_cases + c.other_cases,
+    s.total_dafw_days + c.dafw_days,
+    s.total_djtr_days + c.djtr_days,
+    s.total_injuries + c.injuries,
+    s.total_skin_disorders + c.skin_disorders,
+    s.total_respiratory_conditions + c.respiratory_conditions,
+    s.total_poisonings + c.poisonings,
+    s.total_hearing_loss + c.hearing_loss,
+    s.total_other_illnesses + c.other_illnesses,
+    s.projection_version + 1
+  FROM superseded s
+  JOIN changed c ON c.establishment_id = s.establishment_id AND c.filing_year = s.filing_year
+  JOIN osha_ita_v1.establishments e ON e.establishment_id = s.establishment_id;
+
+  GET DIAGNOSTICS v_adjusted = ROW_COUNT;
+
+  -- Form 300A: full aggregate for touched periods that have no summary yet
+  INSERT INTO osha_ita_v1.form_300a_summaries(
+    establishment_id, filing_year,
+    establishment_name, street_address, city, state, zip,
+    naics_code, industry_description, establishment_type,
+    annual_average_employees, total_hours_worked,
+    no_injuries_illnesses,
+    total_deaths, total_dafw_cases, total_djtr_cases, total_other_cases,
+    total_dafw_days, total_djtr_days,
+    total_injuries, total_skin_disorders, total_respiratory_conditions,
+    total_poisonings, total_hearing_loss, total_other_illnesses,
+    projection_version
+  )
+  SELECT
+    p.establishment_id,
+    p.filing_year,
+    e.establishment_name,
+    e.street_address,
+    e.city,
+    e.state,
+    e.zip,
+    e.naics_code,
+    e.industry_description,
+    e.establishment_type,
+    0 AS annual_average_employees,
+    0 AS total_hours_worked,
+    (COUNT(i.incident_id) = 0) AS no_injuries_illnesses,
+    COUNT(*) FILTER (WHERE i.incident_outcome = 'death'),
+    COUNT(*) FILTER (WHERE i.incident_outcome = 'days_away'),
+    COUNT(*) FILTER (WHERE i.incident_outcome = 'job_transfer_restriction'),
+    COUNT(*) FILTER (WHERE i.incident_outcome = 'other_recordable'),
+    COALESCE(SUM(i.dafw_num_away) FILTER (WHERE i.incident_outcome = 'days_away'), 0),
+    COALESCE(SUM(i.djtr_num_tr) FILTER (WHERE i.incident_outcome IN ('days_away', 'job_transfer_restriction')), 0),
+    COUNT(*) FILTER (WHERE i.type_of_incident = 'injury'),
+    COUNT(*) FILTER (WHERE i.type_of_incident = 'skin_disorder'),
+    COUNT(*) FILTER (WHERE i.type_of_incident = 'respiratory_condition'),
+    COUNT(*) FILTER (WHERE i.type_of_incident = 'poisoning'),
+    COUNT(*) FILTER (WHERE i.type_of_incident = 'hearing_loss'),
+    COUNT(*) FILTER (WHERE i.type_of_incident = 'other_illness'),
+    (SELECT COALESCE(MAX(s.projection_version), 0) + 1
+     FROM osha_ita_v1.form_300a_summaries s
+     WHERE s.establishment_id = p.establishment_id
+       AND s.filing_year = p.filing_year)
+  FROM projection_periods p
+  JOIN osha_ita_v1.establishments e ON e.establishment_id = p.establishment_id
+  LEFT JOIN osha_ita_v1.incidents i 
+    ON i.establishment_id = p.establishment_id
+   AND i.filing_year = p.filing_year
+   AND i.current_state = 'approved'
+   AND i.incident_outcome IN ('death', 'days_away', 'job_transfer_restriction', 'other_recordable')
+  WHERE NOT EXISTS (
+    SELECT 1
+    FROM osha_ita_v1.form_300a_summaries s
+    WHERE s.establishment_id = p.establishment_id
+      AND s.filing_year = p.filing_year
+      AND s.is_current = true
+  )
+  GROUP BY p.establishment_id, p.filing_year, e.establishment_id;
+
+  GET DIAGNOSTICS v_created = ROW_COUNT;
+
+  RETURN jsonb_build_object(
+    'incidents', v_incidents,
+    'summaries_adjusted', v_adjusted,
+    'summaries_created', v_created
+  );
 END $$;
 
 -- ============================================================================
@@ -889,93 +1397,95 @@ END $$;
 -- ============================================================================
 
 -- Promote valid rows to incidents
+-- Set-based: hashes the batch, dedupes against incidents.content_hash, inserts
+-- the new incidents and back-fills import_rows.incident_id in two statements.
+-- Incident ids are generated up front so each inserted incident can be tied
+-- back to its import row.
 CREATE OR REPLACE FUNCTION osha_ita_v1.promote_valid_rows(p_batch_id uuid)
 RETURNS int 
 LANGUAGE plpgsql AS $$
 DECLARE 
-  v_row osha_ita_v1.import_rows%ROWTYPE;
-  v_count int := 0;
-  v_incident_id uuid;
+  v_count int;
 BEGIN
-  FOR v_row IN
-    SELECT * 
-    FROM osha_ita_v1.import_rows
-    WHERE batch_id = p_batch_id 
-      AND status = 'valid'::osha_ita_v1.row_status
-  LOOP
-    -- Generate content hash if missing
-    IF v_row.content_hash IS NULL THEN
-      UPDATE osha_ita_v1.import_rows
-      SET content_hash = encode(
-        digest(coalesce(v_row.mapped_data::text, v_row.raw_data::text), 'sha256'), 
-        'hex'
-      )
-      WHERE row_id = v_row.row_id;
-      
-      SELECT * INTO v_row 
-      FROM osha_ita_v1.import_rows 
-      WHERE row_id = v_row.row_id;
-    END IF;
-
-    -- Check for duplicate
-    SELECT i.incident_id INTO v_incident_id
-    FROM osha_ita_v1.incidents i
-    WHERE i.content_hash = v_row.content_hash
-    LIMIT 1;
-
-    IF v_incident_id IS NULL THEN
-      -- Create new incident
-      INSERT INTO osha_ita_v1.incidents(
-        establishment_id, case_number, filing_year, current_state, is_privacy_case,
-        date_of_incident, time_of_incident, time_unknown, time_started_work,
-        incident_location, incident_description,
-        job_title, date_of_birth, date_of_hire, sex,
-        incident_outcome, type_of_incident,
-        dafw_num_away, djtr_num_tr, date_of_death,
-        treatment_facility_type, treatment_in_patient,
-        nar_before_incident, nar_what_happened, nar_injury_illness, nar_object_substance
-      )
-      VALUES (
-        v_row.establishment_id,
-        v_row.mapped_data->>'case_number',
-        (v_row.mapped_data->>'filing_year')::int,
-        'draft',
-        COALESCE((v_row.mapped_data->>'is_privacy_case')::boolean, false),
-        (v_row.mapped_data->>'date_of_incident')::date,
-        (v_row.mapped_data->>'time_of_incident')::time,
-        COALESCE((v_row.mapped_data->>'time_unknown')::boolean, false),
-        (v_row.mapped_data->>'time_started_work')::time,
-        v_row.mapped_data->>'incident_location',
-        v_row.mapped_data->>'incident_description',
-        v_row.mapped_data->>'job_title',
-        (v_row.mapped_data->>'date_of_birth')::date,
-        (v_row.mapped_data->>'date_of_hire')::date,
-        NULLIF(v_row.mapped_data->>'sex', '')::char(1),
-        v_row.mapped_data->>'incident_outcome',
-        v_row.mapped_data->>'type_of_incident',
-        NULLIF(v_row.mapped_data->>'dafw_num_away', '')::int,
-        NULLIF(v_row.mapped_data->>'djtr_num_tr', '')::int,
-        NULLIF(v_row.mapped_data->>'date_of_death', '')::date,
-        NULLIF(v_row.mapped_data->>'treatment_facility_type', '')::int,
-        NULLIF(v_row.mapped_data->>'treatment_in_patient', '')::int,
-        v_row.mapped_data->>'nar_before_incident',
-        v_row.mapped_data->>'nar_what_happened',
-        v_row.mapped_data->>'nar_injury_illness',
-        v_row.mapped_data->>'nar_object_substance'
-      )
-      RETURNING incident_id INTO v_incident_id;
-    END IF;
-
-    -- Update import row
-    UPDATE osha_ita_v1.import_rows
-    SET status = 'promoted'::osha_ita_v1.row_status,
-        incident_id = v_incident_id,
-        processed_at = now()
-    WHERE row_id = v_row.row_id;
-
-    v_count := v_count + 1;
-  END LOOP;
+  -- Generate content hashes where missing
+  UPDATE osha_ita_v1.import_rows
+  SET content_hash = encode(
+    digest(coalesce(mapped_data::text, raw_data::text), 'sha256'), 
+    'hex'
+  )
+  WHERE batch_id = p_batch_id 
+    AND status = 'valid'::osha_ita_v1.row_status
+    AND content_hash IS NULL;
+
+  WITH candidates AS MATERIALIZED (
+    SELECT 
+      r.row_id,
+      r.establishment_id,
+      r.mapped_data,
+      dup.incident_id AS existing_incident_id,
+      gen_random_uuid() AS new_incident_id
+    FROM osha_ita_v1.import_rows r
+    LEFT JOIN LATERAL (
+      SELECT i.incident_id
+      FROM osha_ita_v1.incidents i
+      WHERE i.content_hash = r.content_hash
+      LIMIT 1
+    ) dup ON true
+    WHERE r.batch_id = p_batch_id 
+      AND r.status = 'valid'::osha_ita_v1.row_status
+  ),
+  inserted AS (
+    INSERT INTO osha_ita_v1.incidents(
+      incident_id,
+      establishment_id, case_number, filing_year, current_state, is_privacy_case,
+      date_of_incident, time_of_incident, time_unknown, time_started_work,
+      incident_location, incident_description,
+      job_title, date_of_birth, date_of_hire, sex,
+      incident_outcome, type_of_incident,
+      dafw_num_away, djtr_num_tr, date_of_death,
+      treatment_facility_type, treatment_in_patient,
+      nar_before_incident, nar_what_happened, nar_injury_illness, nar_object_substance
+    )
+    SELECT
+      c.new_incident_id,
+      c.establishment_id,
+      c.mapped_data->>'case_number',
+      (c.mapped_data->>'filing_year')::int,
+      'draft',
+      COALESCE((c.mapped_data->>'is_privacy_case')::boolean, false),
+      (c.mapped_data->>'date_of_incident')::date,
+      (c.mapped_data->>'time_of_incident')::time,
+      COALESCE((c.mapped_data->>'time_unknown')::boolean, false),
+      (c.mapped_data->>'time_started_work')::time,
+      c.mapped_data->>'incident_location',
+      c.mapped_data->>'incident_description',
+      c.mapped_data->>'job_title',
+      (c.mapped_data->>'date_of_birth')::date,
+      (c.mapped_data->>'date_of_hire')::date,
+      NULLIF(c.mapped_data->>'sex', '')::char(1),
+      c.mapped_data->>'incident_outcome',
+      c.mapped_data->>'type_of_incident',
+      NULLIF(c.mapped_data->>'dafw_num_away', '')::int,
+      NULLIF(c.mapped_data->>'djtr_num_tr', '')::int,
+      NULLIF(c.mapped_data->>'date_of_death', '')::date,
+      NULLIF(c.mapped_data->>'treatment_facility_type', '')::int,
+      NULLIF(c.mapped_data->>'treatment_in_patient', '')::int,
+      c.mapped_data->>'nar_before_incident',
+      c.mapped_data->>'nar_what_happened',
+      c.mapped_data->>'nar_injury_illness',
+      c.mapped_data->>'nar_object_substance'
+    FROM candidates c
+    WHERE c.existing_incident_id IS NULL
+  )
+  -- Point every promoted row at its existing or new incident
+  UPDATE osha_ita_v1.import_rows r
+  SET status = 'promoted'::osha_ita_v1.row_status,
+      incident_id = COALESCE(c.existing_incident_id, c.new_incident_id),
+      processed_at = now()
+  FROM candidates c
+  WHERE r.row_id = c.row_id;
 
+  GET DIAGNOSTICS v_count = ROW_COUNT;
   RETURN v_count;
 END $$;
 
@@ -1032,6 +1542,82 @@ BEGIN
   WHERE submission_id = p_submission_id;
 END $$;
 
+-- Claim pending submissions for a dispatcher (ita_submission_dispatcher.py).
+-- Claimed rows move to in_progress so concurrent dispatchers skip them. Rows
+-- left in_progress longer than p_stale_after by a dispatcher that died are
+-- claimed again; the idempotency key is fixed on first claim, so resending
+-- is safe.
+CREATE OR REPLACE FUNCTION osha_ita_v1.claim_pending_submissions(
+  p_limit int,
+  p_stale_after interval DEFAULT interval '15 minutes'
+)
+RETURNS TABLE(
+  submission_id uuid,
+  establishment_id uuid,
+  filing_year int,
+  submission_type varchar,
+  payload jsonb,
+  idempotency_key varchar
+)
+LANGUAGE plpgsql AS $$
+BEGIN
+  RETURN QUERY
+  UPDATE osha_ita_v1.ita_submissions s
+  SET status = 'in_progress'::osha_ita_v1.submission_status,
+      request_sent_at = now(),
+      idempotency_key = COALESCE(
+        s.idempotency_key,
+        'ita-' || s.submission_id::text || '-' || COALESCE(s.payload_hash, '')
+      )
+  WHERE s.submission_id IN (
+    SELECT c.submission_id
+    FROM osha_ita_v1.ita_submissions c
+    WHERE c.status = 'pending'::osha_ita_v1.submission_status
+       OR (c.status = 'in_progress'::osha_ita_v1.submission_status
+           AND c.request_sent_at < now() - p_stale_after)
+    ORDER BY c.created_at
+    LIMIT p_limit
+    FOR UPDATE SKIP LOCKED
+  )
+  RETURNING s.submission_id, s.establishment_id, s.filing_year,
+            s.submission_type, s.payload, s.idempotency_key;
+END $$;
+
+-- Record many submission attempts in one statement. p_results is a JSON
+-- array of {submission_id, http_status, response, success, retry_count,
+-- error_message, received_at}.
+CREATE OR REPLACE FUNCTION osha_ita_v1.record_submission_attempts(p_results jsonb)
+RETURNS int
+LANGUAGE plpgsql AS $$
+DECLARE
+  v_count int;
+BEGIN
+  UPDATE osha_ita_v1.ita_submissions s
+  SET status = CASE WHEN r.success THEN 'succeeded'::osha_ita_v1.submission_status
+                    ELSE 'failed'::osha_ita_v1.submission_status END,
+      http_status_code = r.http_status,
+      response_body = r.response,
+      request_sent_at = COALESCE(s.request_sent_at, now()),
+      response_received_at = COALESCE(r.received_at, now()),
+      ita_submission_id = COALESCE(r.response->>'submissionId', s.ita_submission_id),
+      ita_confirmation_number = COALESCE(r.response->>'confirmationNumber', s.ita_confirmation_number),
+      retry_count = COALESCE(s.retry_count, 0) + COALESCE(r.retry_count, 0),
+      error_message = r.error_message
+  FROM jsonb_to_recordset(p_results) AS r(
+    submission_id uuid,
+    http_status int,
+    response jsonb,
+    success boolean,
+    retry_count int,
+    error_message text,
+    received_at timestamptz
+  )
+  WHERE s.submission_id = r.submission_id;
+
+  GET DIAGNOSTICS v_count = ROW_COUNT;
+  RETURN v_count;
+END $$;
+
 -- ============================================================================
 -- CERTIFICATION FUNCTION
 -- ============================================================================
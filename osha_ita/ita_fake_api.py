@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+OSHA ITA Fake API
+Local stand-in for the OSHA ITA submission API, for exercising
+ita_submission_dispatcher.py without touching the real service
+- POST /oshaApi/v1/forms/form300A, /forms/caseData and /submissions
+- Replays the stored response for a repeated Idempotency-Key
+- Answers 429 with Retry-After above the configured request rate
+- Optional latency and random transient 503 failures
+- GET /stats returns request counters as JSON
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+import logging
+import argparse
+from typing import Any
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def setup_logging(log_level: str = "INFO"):
+    """Setup logging"""
+    logging.basicConfig(
+        level=getattr(logging, log_level.upper()),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    return logging.getLogger(__name__)
+
+
+class FakeITAState:
+    """Shared state for the fake API: idempotency store, rate limiter, counters"""
+
+    API_PREFIX = '/oshaApi/v1'
+    FORM_PATHS = ('/forms/form300A', '/forms/caseData')
+    SUBMISSION_PATH = '/submissions'
+
+    def __init__(self, rate_limit: float = 0, failure_rate: float = 0.0,
+                 latency_ms: int = 0, seed: int = None):
+        self.rate_limit = rate_limit
+        self.failure_rate = failure_rate
+        self.latency_ms = latency_ms
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.responses = {}
+        self.tokens = float(rate_limit)
+        self.last_refill = time.monotonic()
+        self.stats = {
+            'requests': 0,
+            'accepted': 0,
+            'replayed': 0,
+            'rate_limited': 0,
+            'failed': 0,
+            'rejected': 0,
+            'submissions': 0
+        }
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def take_token(self) -> bool:
+        """One request's worth of the per-second rate limit"""
+        if not self.rate_limit:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate_limit, self.tokens + (now - self.last_refill) * self.rate_limit)
+            self.last_refill = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def transient_failure(self) -> bool:
+        with self.lock:
+            return self.random.random() < self.failure_rate
+
+    def handle(self, path: str, body: Any, idempotency_key: str):
+        """Return (status, response body, replayed) for a POST"""
+        with self.lock:
+            if idempotency_key in self.responses:
+                status, response = self.responses[idempotency_key]
+                return status, response, True
+
+        if path in self.FORM_PATHS:
+            status, response = 200, {
+                'success': True,
+                'id': str(uuid.uuid4()),
+                'message': 'Form data received'
+            }
+        elif path == self.SUBMISSION_PATH:
+            if not isinstance(body, dict) or not body.get('establishment_id') or not body.get('year_filing_for'):
+                status, response = 400, {
+                    'success': False,
+                    'message': 'establishment_id and year_filing_for are required'
+                }
+            else:
+                year = body['year_filing_for']
+                with self.lock:
+                    self.stats['submissions'] += 1
+                    number = self.stats['submissions']
+                status, response = 200, {
+                    'success': True,
+                    'submissionId': f"ITA-{year}-{number:06d}",
+                    'confirmationNumber': f"CONF-{year}-{uuid.uuid4().hex[:10].upper()}",
+                    'status': 'processed',
+                    'message': 'Submission received and accepted'
+                }
+        else:
+            return 404, {'success': False, 'message': f'Unknown endpoint {path}'}, False
+
+        # Only settled outcomes are replayed; transient errors are not stored.
+        # A concurrent duplicate that got here first wins.
+        with self.lock:
+            stored = self.responses.setdefault(idempotency_key, (status, response))
+        return stored[0], stored[1], stored != (status, response)
+
+
+class FakeITAHandler(BaseHTTPRequestHandler):
+    """Request handler bound to a FakeITAState via the server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        logging.getLogger(__name__).debug("%s - %s", self.address_string(), format % args)
+
+    def _reply(self, status: int, body: dict, headers: dict = None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        state = self.server.state
+        if self.path == '/stats':
+            with state.lock:
+                stats = dict(state.stats)
+            self._reply(200, stats)
+        else:
+            self._reply(404, {'success': False, 'message': 'Not found'})
+
+    def do_POST(self):
+        state = self.server.state
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        state.count('requests')
+
+        if state.latency_ms:
+            time.sleep(state.latency_ms / 1000.0)
+
+        if not self.path.startswith(state.API_PREFIX):
+            self._reply(404, {'success': False, 'message': 'Not found'})
+            return
+        path = self.path[len(state.API_PREFIX):]
+
+        idempotency_key = self.headers.get('Idempotency-Key')
+        if not idempotency_key:
+            state.count('rejected')
+            self._reply(400, {'success': False, 'message': 'Idempotency-Key header is required'})
+            return
+
+        if not state.take_token():
+            state.count('rate_limited')
+            self._reply(429, {'success': False, 'message': 'Rate limit exceeded'}, {'Retry-After': '1'})
+            return
+
+        if state.transient_failure():
+            state.count('failed')
+            self._reply(503, {'success': False, 'message': 'Service temporarily unavailable'})
+            return
+
+        try:
+            body = json.loads(raw or b'null')
+        except ValueError:
+            state.count('rejected')
+            self._reply(400, {'success': False, 'message': 'Request body must be JSON'})
+            return
+
+        status, response, replayed = state.handle(path, body, idempotency_key)
+        state.count('replayed' if replayed else ('accepted' if status < 300 else 'rejected'))
+        self._reply(status, response, {'Idempotent-Replayed': 'true'} if replayed else None)
+
+
+def make_server(host: str, port: int, state: FakeITAState) -> ThreadingHTTPServer:
+    """Create (but do not start) a fake ITA server; port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), FakeITAHandler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def main():
+    """Run the fake ITA API until interrupted"""
+    parser = argparse.ArgumentParser(
+        description='Fake OSHA ITA API for local submission testing',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve on http://127.0.0.1:8085/oshaApi/v1
+  python ita_fake_api.py
+
+  # Allow 20 requests/second and fail 5% of requests with 503
+  python ita_fake_api.py --rate-limit 20 --failure-rate 0.05 --latency-ms 50
+
+  # Point the dispatcher at it
+  python ita_submission_dispatcher.py --api-url http://127.0.0.1:8085/oshaApi/v1
+        """
+    )
+    parser.add_argument('--host', default='127.0.0.1',
+                       help='Address to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8085,
+                       help='Port to listen on (default: 8085)')
+    parser.add_argument('--rate-limit', type=float, default=0,
+                       help='Requests per second before answering 429 (default: unlimited)')
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                       help='Fraction of requests answered with a transient 503 (default: 0)')
+    parser.add_argument('--latency-ms', type=int, default=0,
+                       help='Added latency per request in milliseconds (default: 0)')
+    parser.add_argument('--seed', type=int,
+                       help='Random seed for reproducible failures')
+    parser.add_argument('--log-level', '-l',
+                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       default='INFO',
+                       help='Set logging level (default: INFO)')
+    args = parser.parse_args()
+
+    logger = setup_logging(args.log_level)
+    state = FakeITAState(args.rate_limit, args.failure_rate, args.latency_ms, args.seed)
+    server = make_server(args.host, args.port, state)
+    logger.info(f"Fake ITA API listening on http://{args.host}:{server.server_port}{FakeITAState.API_PREFIX}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping fake ITA API")
+    finally:
+        server.server_close()
+        logger.info(f"Stats: {json.dumps(state.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+OSHA ITA Submission Dispatcher
+Sends pending osha_ita_v1.ita_submissions to the ITA API at volume
+- Claims pending submissions in batches (claim_pending_submissions)
+- Posts each form payload, then the build_complete_submission_payload body
+- Bounded concurrency and a token-bucket rate limit shared by all requests
+- Retries 429/5xx/network errors with exponential backoff and jitter,
+  honouring Retry-After, under a stable per-submission idempotency key
+- Records responses in bulk (record_submission_attempts)
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+import psycopg2
+import psycopg2.extras
+
+# Database configuration - UPDATE THESE VALUES (or set the PG* environment variables)
+DB_CONFIG = {
+    'host': os.environ.get('PGHOST', 'localhost'),
+    'username': os.environ.get('PGUSER', 'postgres'),
+    'password': os.environ.get('PGPASSWORD', ''),
+    'database': os.environ.get('PGDATABASE', 'compliease_sbx'),
+    'schema': 'osha_ita_v1, public',
+    'port': int(os.environ.get('PGPORT', 5432))
+}
+
+# ITA API configuration - UPDATE THESE VALUES
+API_CONFIG = {
+    'url': os.environ.get('ITA_API_URL', 'https://www.osha.gov/injuryreporting/oshaApi/v1'),
+    'token': os.environ.get('ITA_API_TOKEN')
+}
+
+
+def setup_logging(log_level: str = "INFO", log_file: str = None):
+    """Setup logging with configurable level and optional file output"""
+    numeric_level = getattr(logging, log_level.upper(), None)
+    if not isinstance(numeric_level, int):
+        raise ValueError(f'Invalid log level: {log_level}')
+
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+
+    logging.basicConfig(
+        level=numeric_level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+    return logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it (waiters are served in order)"""
+        if not self.rate:
+            return
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ITASubmissionDispatcher:
+    """Claims pending ITA submissions and sends them concurrently within API limits"""
+
+    # Form data endpoint per ita_submissions.submission_type
+    FORM_ENDPOINTS = {
+        'form_300a': '/forms/form300A',
+        'form_300_301': '/forms/caseData'
+    }
+    SUBMISSION_ENDPOINT = '/submissions'
+    RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+    def __init__(self, db_config: dict, api_url: str, api_token: str = None,
+                 concurrency: int = 16, rate_limit: float = 10.0, burst: float = None,
+                 max_retries: int = 5, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 batch_size: int = 200, flush_size: int = 100, flush_interval: float = 2.0,
+                 timeout: float = 30.0, limit: int = None, stale_after_minutes: int = 15):
+        self.db_config = db_config
+        self.api_url = api_url.rstrip('/')
+        self.api_token = api_token
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.batch_size = batch_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.limit = limit
+        self.stale_after_minutes = stale_after_minutes
+        self.conn = None
+        self.cursor = None
+        self.logger = logging.getLogger(__name__)
+        self.pending_results = []
+        self.statistics = {
+            'claimed': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'requests': 0,
+            'retries': 0,
+            'recorded': 0
+        }
+
+    def connect(self):
+        """Establish database connection"""
+        try:
+            self.conn = psycopg2.connect(
+                host=self.db_config['host'],
+                user=self.db_config['username'],
+                password=self.db_config['password'],
+                database=self.db_config['database'],
+                port=self.db_config.get('port', 5432)
+            )
+            self.cursor = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+
+            if self.db_config.get('schema'):
+                self.cursor.execute(f"SET search_path TO {self.db_config['schema']}")
+                self.conn.commit()
+
+            self.logger.info(f"Connected to database: {self.db_config['database']}")
+        except Exception as e:
+            self.logger.error(f"Database connection failed: {e}")
+            raise
+
+    def disconnect(self):
+        """Close database connection"""
+        if self.cursor:
+            self.cursor.close()
+        if self.conn:
+            self.conn.close()
+        self.logger.info("Database connection closed")
+
+    def claim_submissions(self, count: int) -> List[Dict[str, Any]]:
+        """Claim up to `count` pending submissions together with their completion payloads"""
+        try:
+            self.cursor.execute("""
+                SELECT c.*,
+                       osha_ita_v1.build_complete_submission_payload(c.establishment_id, c.filing_year)
+                           AS completion_payload
+                FROM osha_ita_v1.claim_pending_submissions(%s, make_interval(mins => %s)) c
+            """, (count, self.stale_after_minutes))
+            claimed = self.cursor.fetchall()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return claimed
+
+    def record_results(self, results: List[Dict[str, Any]]) -> int:
+        """Write a batch of attempt results with one statement"""
+        if not results:
+            return 0
+        try:
+            self.cursor.execute(
+                "SELECT osha_ita_v1.record_submission_attempts(%s::jsonb) AS recorded",
+                (json.dumps(results, default=str),)
+            )
+            recorded = self.cursor.fetchone()['recorded']
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return recorded
+
+    def _send(self, path: str, body: Any, idempotency_key: str) -> Tuple[int, Any, Dict[str, str]]:
+        """Blocking POST; returns (HTTP status, parsed body, headers)"""
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Idempotency-Key': idempotency_key
+        }
+        if self.api_token:
+            headers['Authorization'] = f'Bearer {self.api_token}'
+
+        request = urllib.request.Request(
+            self.api_url + path,
+            data=json.dumps(body).encode('utf-8'),
+            headers=headers,
+            method='POST'
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, raw, response_headers = response.status, response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            status, raw, response_headers = e.code, e.read(), e.headers
+
+        try:
+            parsed = json.loads(raw) if raw else None
+        except ValueError:
+            parsed = {'raw': raw.decode('utf-8', 'replace')}
+        return status, parsed, dict(response_headers or {})
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Delay before retry `attempt` (1-based): Retry-After if given, else full jitter"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def _post(self, path: str, body: Any, idempotency_key: str) -> Tuple[Optional[int], Any, int, Optional[str]]:
+        """POST with rate limiting and retries; returns (status, body, retries, error)"""
+        loop = asyncio.get_running_loop()
+        retries = 0
+        while True:
+            await self.bucket.acquire()
+            self.statistics['requests'] += 1
+            try:
+                status, response, headers = await loop.run_in_executor(
+                    self.http_executor, self._send, path, body, idempotency_key
+                )
+                error = None if status < 300 else f"HTTP {status}"
+                retryable = status in self.RETRYABLE_STATUS
+                retry_after = headers.get('Retry-After')
+            except (urllib.error.URLError, OSError) as e:
+                status, response, error = None, None, f"{type(e).__name__}: {e}"
+                retryable, retry_after = True, None
+
+            if error is None or not retryable or retries >= self.max_retries:
+                return status, response, retries, error
+
+            retries += 1
+            self.statistics['retries'] += 1
+            delay = self._backoff(retries, retry_after)
+            self.logger.debug(f"{path} {error}; retry {retries}/{self.max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def _dispatch(self, submission: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one submission's form data and completion request"""
+        key = submission['idempotency_key']
+        retries = 0
+        status, response, error = None, None, None
+
+        form_path = self.FORM_ENDPOINTS.get(submission['submission_type'])
+        if form_path is None:
+            error = f"Unknown submission type {submission['submission_type']}"
+        else:
+            status, response, form_retries, error = await self._post(
+                form_path, submission['payload'], f"{key}:form"
+            )
+            retries += form_retries
+
+        if error is None:
+            status, response, completion_retries, error = await self._post(
+                self.SUBMISSION_ENDPOINT, submission['completion_payload'], f"{key}:complete"
+            )
+            retries += completion_retries
+
+        success = error is None
+        self.statistics['succeeded' if success else 'failed'] += 1
+        if not success:
+            self.logger.warning(f"Submission {submission['submission_id']} failed: {error}")
+
+        return {
+            'submission_id': str(submission['submission_id']),
+            'http_status': status,
+            'response': response if response is not None else {'error': error},
+            'success': success,
+            'retry_count': retries,
+            'error_message': error,
+            'received_at': datetime.now(timezone.utc).isoformat()
+        }
+
+    async def _db(self, func, *args):
+        """Run a database call on the single database thread"""
+        return await asyncio.get_running_loop().run_in_executor(self.db_executor, func, *args)
+
+    async def flush(self):
+        """Record all buffered results"""
+        results, self.pending_results = self.pending_results, []
+        if results:
+            self.statistics['recorded'] += await self._db(self.record_results, results)
+            self.logger.info(f"Recorded {len(results)} submission results")
+
+    async def _flush_periodically(self, stopped: asyncio.Event):
+        # Stopped via the event rather than cancel(): cancelling a queued
+        # executor call would drop the results it was about to record
+        while not stopped.is_set():
+            try:
+                await asyncio.wait_for(stopped.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            submission = await queue.get()
+            if submission is None:
+                return
+            result = await self._dispatch(submission)
+            self.pending_results.append(result)
+            if len(self.pending_results) >= self.flush_size:
+                await self.flush()
+
+    async def run(self) -> Dict[str, int]:
+        """Dispatch until nothing is pending (or `limit` submissions were claimed)"""
+        self.bucket = TokenBucket(self.rate_limit, self.burst)
+        self.http_executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self.db_executor = ThreadPoolExecutor(max_workers=1)
+        queue = asyncio.Queue(maxsize=self.batch_size)
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+        stopped = asyncio.Event()
+        flusher = asyncio.create_task(self._flush_periodically(stopped))
+        started = time.monotonic()
+
+        try:
+            while self.limit is None or self.statistics['claimed'] < self.limit:
+                count = self.batch_size
+                if self.limit is not None:
+                    count = min(count, self.limit - self.statistics['claimed'])
+                claimed = await self._db(self.claim_submissions, count)
+                if not claimed:
+                    break
+                self.statistics['claimed'] += len(claimed)
+                self.logger.info(f"Claimed {len(claimed)} submissions")
+                for submission in claimed:
+                    await queue.put(submission)
+
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            stopped.set()
+            await flusher
+            # Claimed but unsent submissions stay in_progress and are reclaimed later
+            self.http_executor.shutdown(wait=False)
+            self.db_executor.shutdown(wait=True)
+
+        self.statistics['elapsed_seconds'] = round(time.monotonic() - started, 2)
+        return self.statistics
+
+    def generate_report(self) -> str:
+        """Summary of a dispatch run"""
+        stats = self.statistics
+        lines = [
+            "=" * 60,
+            "OSHA ITA SUBMISSION DISPATCH REPORT",
+            "=" * 60,
+            f"API: {self.api_url}",
+            f"Concurrency: {self.concurrency}, rate limit: {self.rate_limit}/s",
+            f"Submissions claimed: {stats['claimed']:,}",
+            f"Succeeded: {stats['succeeded']:,}",
+            f"Failed: {stats['failed']:,}",
+            f"HTTP requests: {stats['requests']:,} ({stats['retries']:,} retries)",
+            f"Results recorded: {stats['recorded']:,}",
+            f"Elapsed: {stats.get('elapsed_seconds', 0)}s",
+            "=" * 60
+        ]
+        return "\n".join(lines)
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(
+        description='OSHA ITA Submission Dispatcher - send pending submissions to the ITA API',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Send everything pending, 16 at a time, at most 10 requests/second
+  python ita_submission_dispatcher.py
+
+  # Filing season: more concurrency within a 50 requests/second API limit
+  python ita_submission_dispatcher.py --concurrency 64 --rate-limit 50
+
+  # Against the local fake API
+  python ita_fake_api.py --rate-limit 20 --failure-rate 0.05 &
+  python ita_submission_dispatcher.py --api-url http://127.0.0.1:8085/oshaApi/v1 --rate-limit 20
+
+  # Send at most 100 submissions
+  python ita_submission_dispatcher.py --limit 100
+        """
+    )
+
+    # API options
+    parser.add_argument('--api-url', default=API_CONFIG['url'],
+                       help=f'ITA API base URL (default: {API_CONFIG["url"]})')
+    parser.add_argument('--api-token', default=API_CONFIG['token'],
+                       help='ITA API bearer token (default: ITA_API_TOKEN environment variable)')
+    parser.add_argument('--concurrency', '-c', type=int, default=16,
+                       help='Requests in flight at once (default: 16)')
+    parser.add_argument('--rate-limit', type=float, default=10.0,
+                       help='Requests per second across all workers, 0 for none (default: 10)')
+    parser.add_argument('--burst', type=float,
+                       help='Token bucket size (default: one second of --rate-limit)')
+    parser.add_argument('--max-retries', type=int, default=5,
+                       help='Retries per request for 429/5xx/network errors (default: 5)')
+    parser.add_argument('--backoff-base', type=float, default=0.5,
+                       help='Base retry backoff in seconds, doubled per retry (default: 0.5)')
+    parser.add_argument('--timeout', type=float, default=30.0,
+                       help='HTTP request timeout in seconds (default: 30)')
+
+    # Batching options
+    parser.add_argument('--batch-size', type=int, default=200,
+                       help='Submissions claimed per database round trip (default: 200)')
+    parser.add_argument('--flush-size', type=int, default=100,
+                       help='Record results once this many are buffered (default: 100)')
+    parser.add_argument('--limit', type=int,
+                       help='Stop after claiming this many submissions')
+    parser.add_argument('--stale-after', type=int, default=15,
+                       help='Reclaim in_progress submissions older than this many minutes (default: 15)')
+
+    # Database configuration (uses DB_CONFIG by default)
+    parser.add_argument('--host', default=DB_CONFIG['host'],
+                       help=f'PostgreSQL host (default: {DB_CONFIG["host"]})')
+    parser.add_argument('--port', type=int, default=DB_CONFIG['port'],
+                       help=f'PostgreSQL port (default: {DB_CONFIG["port"]})')
+    parser.add_argument('--database', default=DB_CONFIG['database'],
+                       help=f'Database name (default: {DB_CONFIG["database"]})')
+    parser.add_argument('--username', default=DB_CONFIG['username'],
+                       help=f'Database username (default: {DB_CONFIG["username"]})')
+    parser.add_argument('--password', default=DB_CONFIG['password'],
+                       help='Database password (uses config default if not provided)')
+
+    # Logging options
+    parser.add_argument('--log-level', '-l',
+                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       default='INFO',
+                       help='Set logging level (default: INFO)')
+    parser.add_argument('--log-file',
+                       help='Write logs to file (in addition to console)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Suppress console output (except errors)')
+
+    args = parser.parse_args()
+
+    logger = setup_logging('ERROR' if args.quiet else args.log_level, args.log_file)
+
+    db_config = {
+        'host': args.host,
+        'port': args.port,
+        'database': args.database,
+        'username': args.username,
+        'password': args.password,
+        'schema': DB_CONFIG['schema']
+    }
+
+    dispatcher = ITASubmissionDispatcher(
+        db_config=db_config,
+        api_url=args.api_url,
+        api_token=args.api_token,
+        concurrency=args.concurrency,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        max_retries=args.max_retries,
+        backoff_base=args.backoff_base,
+        batch_size=args.batch_size,
+        flush_size=args.flush_size,
+        timeout=args.timeout,
+        limit=args.limit,
+        stale_after_minutes=args.stale_after
+    )
+
+    try:
+        dispatcher.connect()
+        asyncio.run(dispatcher.run())
+
+        if not args.quiet:
+            print(dispatcher.generate_report())
+        logger.info("Submission dispatch completed")
+
+    except KeyboardInterrupt:
+        logger.info("Submission dispatch interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Submission dispatch failed: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        sys.exit(1)
+    finally:
+        dispatcher.disconnect()
+
+
+if __name__ == "__main__":
+    main()
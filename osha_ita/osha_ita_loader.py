@@ -6,7 +6,9 @@ Supports both 300A Summary Data and Case Detail Data with full versioning
 """
 
 import os
+import io
 import json
+import numpy as np
 import pandas as pd
 import psycopg2
 import psycopg2.extras
@@ -17,11 +19,22 @@ import sys
 import hashlib
 import argparse
 from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import uuid
 import re
+import shutil
+import pickle
 from pathlib import Path
 import openpyxl
 
+# For the columnar parsed-file cache (optional, falls back to pickle)
+try:
+    import pyarrow
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 # Database configuration - UPDATE THESE VALUES
 DB_CONFIG = {
     'host': 'rds-dev-compliease-pg.cm9ok286yrdx.us-east-1.rds.amazonaws.com',
@@ -56,19 +69,279 @@ def setup_logging(log_level: str = "INFO", log_file: str = None):
     )
     return logging.getLogger(__name__)
 
+class ParsedFileCache:
+    """On-disk cache of parsed sheets keyed by source file hash and schema version
+    
+    Each entry is a directory holding one Parquet file per sheet (pickle when
+    pyarrow is missing or a column mixes types) plus a manifest. Entries are
+    evicted least recently used first once the cache exceeds max_bytes.
+    """
+    
+    # Bump when read_excel_file/read_csv_file change what they return
+    SCHEMA_VERSION = 1
+    MANIFEST = 'manifest.json'
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.version = f"v{self.SCHEMA_VERSION}-pd{pd.__version__}"
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _entry_dir(self, file_hash: str) -> Path:
+        return self.cache_dir / f"{file_hash}-{self.version}"
+    
+    def get(self, file_hash: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """Return the cached sheets for a file hash, or None on a miss"""
+        entry = self._entry_dir(file_hash)
+        manifest_path = entry / self.MANIFEST
+        if not manifest_path.exists():
+            return None
+        
+        try:
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            sheets = {}
+            for sheet in manifest['sheets']:
+                sheet_path = entry / sheet['file']
+                if sheet['format'] == 'parquet':
+                    sheets[sheet['name']] = pd.read_parquet(sheet_path)
+                else:
+                    sheets[sheet['name']] = pd.read_pickle(sheet_path)
+            os.utime(manifest_path)  # mark as recently used
+            return sheets
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache entry {entry.name}: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+    
+    def put(self, file_hash: str, sheets: Dict[str, pd.DataFrame]):
+        """Store parsed sheets for a file hash and evict old entries"""
+        entry = self._entry_dir(file_hash)
+        staging = self.cache_dir / f".{entry.name}.{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        
+        try:
+            manifest = {'source_hash': file_hash, 'version': self.version, 'sheets': []}
+            for index, (name, df) in enumerate(sheets.items()):
+                sheet_format = self._write_sheet(df, staging, index)
+                manifest['sheets'].append({'name': name, 'file': f"{index}.{sheet_format}",
+                                           'format': sheet_format})
+            with open(staging / self.MANIFEST, 'w') as f:
+                json.dump(manifest, f)
+            
+            # Publish atomically; a parallel worker may have stored it first
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+        except Exception as e:
+            self.logger.warning(f"Could not cache parsed file {file_hash[:12]}: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        
+        self.evict()
+    
+    def _write_sheet(self, df: pd.DataFrame, directory: Path, index: int) -> str:
+        """Write one sheet as Parquet if possible, otherwise pickle; return the format"""
+        if PARQUET_AVAILABLE:
+            try:
+                df.to_parquet(directory / f"{index}.parquet")
+                return 'parquet'
+            except Exception:
+                (directory / f"{index}.parquet").unlink(missing_ok=True)
+        df.to_pickle(directory / f"{index}.pickle", protocol=pickle.HIGHEST_PROTOCOL)
+        return 'pickle'
+    
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        total = 0
+        for entry in self.cache_dir.iterdir():
+            manifest_path = entry / self.MANIFEST
+            if entry.name.startswith('.') or not manifest_path.exists():
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((manifest_path.stat().st_mtime, size, entry))
+            total += size
+        
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            self.logger.debug(f"Evicted cache entry {entry.name}")
+
 class OSHAITADataLoader:
     """Main data loader for OSHA ITA data with versioning and audit support"""
     
+    # (target column, source column, type, default) for the typed columns of a
+    # 300A row; datetime/date/time columns go through the _parse_* helpers
+    SUMMARY_300A_FIELDS = [
+        ('ita_id', 'id', int, None),
+        ('ita_establishment_id', 'establishment_id', int, None),
+        ('annual_average_employees', 'annual_average_employees', int, None),
+        ('total_hours_worked', 'total_hours_worked', int, None),
+        ('no_injuries_illnesses', 'no_injuries_illnesses', int, None),
+        ('total_deaths', 'total_deaths', int, 0),
+        ('total_dafw_cases', 'total_dafw_cases', int, 0),
+        ('total_djtr_cases', 'total_djtr_cases', int, 0),
+        ('total_other_cases', 'total_other_cases', int, 0),
+        ('total_dafw_days', 'total_dafw_days', int, 0),
+        ('total_djtr_days', 'total_djtr_days', int, 0),
+        ('total_injuries', 'total_injuries', int, 0),
+        ('total_skin_disorders', 'total_skin_disorders', int, 0),
+        ('total_respiratory_conditions', 'total_respiratory_conditions', int, 0),
+        ('total_poisonings', 'total_poisonings', int, 0),
+        ('total_hearing_loss', 'total_hearing_loss', int, 0),
+        ('total_other_illnesses', 'total_other_illnesses', int, 0),
+        ('created_timestamp', 'created_timestamp', str, None),
+        ('ita_created_at', 'created_timestamp', datetime, None),
+        ('change_reason', 'change_reason', str, None),
+        ('sector', 'sector', str, None),
+        ('zipcode', 'zipcode', str, None),
+        ('naics_char', 'naics_char', str, None),
+    ]
+    
+    CASE_DETAIL_FIELDS = [
+        ('ita_id', 'id', int, None),
+        ('ita_establishment_id', 'establishment_id', int, None),
+        ('case_number', 'case_number', str, None),
+        ('job_description', 'job_description', str, None),
+        ('soc_code', 'soc_code', str, None),
+        ('soc_description', 'soc_description', str, None),
+        ('soc_reviewed', 'soc_reviewed', int, None),
+        ('soc_probability', 'soc_probability', float, None),
+        ('date_of_incident', 'date_of_incident', date, None),
+        ('time_started_work', 'time_started_work', time, None),
+        ('time_of_incident', 'time_of_incident', time, None),
+        ('time_unknown', 'time_unknown', bool, False),
+        ('incident_outcome', 'incident_outcome', int, None),
+        ('type_of_incident', 'type_of_incident', int, None),
+        ('dafw_num_away', 'dafw_num_away', int, None),
+        ('djtr_num_tr', 'djtr_num_tr', int, None),
+        ('date_of_death', 'date_of_death', date, None),
+        ('incident_location', 'new_incident_location', str, None),
+        ('incident_description', 'NEW_INCIDENT_DESCRIPTION', str, None),
+        ('narrative_before_incident', 'new_nar_before_incident', str, None),
+        ('narrative_what_happened', 'new_nar_what_happened', str, None),
+        ('narrative_injury_illness', 'new_nar_injury_illness', str, None),
+        ('narrative_object_substance', 'new_nar_object_substance', str, None),
+        ('created_timestamp', 'created_timestamp', str, None),
+        ('ita_created_at', 'created_timestamp', datetime, None),
+    ]
+    
+    ESTABLISHMENT_FIELDS = [
+        ('establishment_id', 'establishment_id', int, None),
+        ('establishment_name', 'establishment_name', str, None),
+        ('ein', 'ein', str, None),
+        ('company_name', 'company_name', str, None),
+        ('street_address', 'street_address', str, None),
+        ('city', 'city', str, None),
+        ('state_code', 'state', str, None),
+        ('zip_code', 'zip_code', str, None),
+        ('primary_naics_code', 'naics_code', str, None),
+        ('naics_year', 'naics_year', int, 2012),
+        ('industry_description', 'industry_description', str, None),
+        ('establishment_type', 'establishment_type', int, 1),
+        ('size_category', 'size', int, None),
+    ]
+    
+    ESTABLISHMENT_INSERT_COLUMNS = [
+        'establishment_id', 'establishment_name', 'ein', 'company_name',
+        'current_address', 'street_address', 'city', 'state_code', 'zip_code',
+        'current_naics', 'primary_naics_code', 'naics_year', 'industry_description',
+        'establishment_type', 'size_category', 'first_seen_year', 'last_seen_year'
+    ]
+    
+    # Formats the column parsers convert in one vectorized pass each
+    ITA_TIMESTAMP_PATTERN = r'\d{2}[A-Z]{3}\d{2}:\d{2}:\d{2}:\d{2}'
+    ISO_UTC_PATTERN = r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d{3}|\.\d{6})?Z'
+    EXCEL_DAY_PATTERN = r'\d+(?:\.0*)?'
+    ISO_DATE_PATTERN = r'\d{4}-\d{2}-\d{2}'
+    US_DATE_PATTERN = r'\d{1,2}/\d{1,2}/\d{4}'
+    EXCEL_EPOCH = pd.Timestamp('1899-12-30')
+    EXCEL_MAX_DAYS = 106751  # largest whole-day serial a pd.Timedelta can hold
+    
+    # Columns an ON CONFLICT upsert refreshes, as the row path's UPDATE does
+    ESTABLISHMENT_UPDATE_COLUMNS = [
+        'establishment_id', 'current_address', 'street_address', 'city', 'state_code',
+        'zip_code', 'current_naics', 'primary_naics_code', 'naics_year',
+        'industry_description', 'establishment_type', 'size_category'
+    ]
+    
+    # Chunked mode reads every column the loader consumes with one fixed dtype
+    # (see _csv_dtype_schema) instead of letting each chunk infer its own.
+    # These are always text, so codes such as '02134' or '311111' stay verbatim.
+    CSV_TEXT_COLUMNS = [
+        'establishment_name', 'ein', 'company_name', 'street_address', 'city', 'state',
+        'zip_code', 'zipcode', 'naics_code', 'naics_char', 'industry_description', 'sector',
+        'case_number', 'job_description', 'soc_code', 'soc_description', 'created_timestamp',
+        'change_reason', 'new_incident_location', 'new_incident_description',
+        'new_nar_before_incident', 'new_nar_what_happened', 'new_nar_injury_illness',
+        'new_nar_object_substance'
+    ]
+    
+    # Advisory lock taken by a file's transaction when it swaps in year partitions
+    PARTITION_SWAP_LOCK_KEY = 'osha_ita.partition_swap'
+    
+    # Times a file that lost a deadlock to another worker is loaded again
+    DEADLOCK_RETRIES = 5
+    
+    # Namespace for the establishment_uuid a replacing load assigns a new (ein, name)
+    ESTABLISHMENT_UUID_NAMESPACE = uuid.UUID('6f1c1c3e-5b0e-4c8e-9a43-0d1e7b9a2f51')
+    
+    # Most (ein, establishment_name) -> establishment_uuid entries kept in memory
+    ESTABLISHMENT_CACHE_SIZE = 100000
+    
+    # Session setting that switches the audit triggers to one entry per load
+    AUDIT_LOAD_SETTING = 'osha_ita.audit_load_id'
+    
+    # Largest the parsed-file cache may grow before old entries are evicted
+    DEFAULT_CACHE_MAX_MB = 2048
+    
+    # incident_narratives keys and the case_detail_data column holding each one
+    NARRATIVE_KEYS = [
+        ('location', 'incident_location'),
+        ('description', 'incident_description'),
+        ('before_incident', 'narrative_before_incident'),
+        ('what_happened', 'narrative_what_happened'),
+        ('injury_illness', 'narrative_injury_illness'),
+        ('object_substance', 'narrative_object_substance'),
+    ]
+    
     def __init__(self, db_config: dict, load_mode: LoadMode = LoadMode.INCREMENTAL, 
-                 dry_run: bool = False):
+                 dry_run: bool = False, bulk: bool = False, chunksize: int = None,
+                 cache_dir: str = None, cache_max_mb: int = DEFAULT_CACHE_MAX_MB,
+                 force: bool = False, audit_mode: str = 'row', replace_years: bool = False):
         self.db_config = db_config
         self.load_mode = load_mode
         self.dry_run = dry_run
+        self.bulk = bulk or replace_years  # partitions are only staged by the bulk path
+        self.chunksize = chunksize
+        self.cache_dir = cache_dir
+        self.cache_max_mb = cache_max_mb
+        self.parsed_cache = ParsedFileCache(cache_dir, cache_max_mb * 1024 * 1024) if cache_dir else None
+        self.file_hashes = {}
+        self.force = force
+        self.audit_mode = audit_mode
+        self.audit_load_id = None
+        self.replace_years = replace_years
+        self.staged_partitions = {}
+        self.replaced_partitions = set()
+        self.file_load_ids = []
+        self.deferred_load_records = {}
+        self.deferred_establishments = {}
+        self.file_errors_start = 0
+        self.file_status = {'new': [], 'changed': [], 'unchanged': []}
+        self.establishment_cache = OrderedDict()
         self.conn = None
         self.cursor = None
         self.logger = logging.getLogger(__name__)
         self.load_statistics = {
             'files_processed': 0,
+            'files_skipped': 0,
             'establishments_created': 0,
             'establishments_updated': 0,
             'summary_records_loaded': 0,
@@ -80,13 +353,7 @@ class OSHAITADataLoader:
         """Establish database connection"""
         try:
             # Connect with autocommit initially set based on dry_run mode
-            self.conn = psycopg2.connect(
-                host=self.db_config['host'],
-                user=self.db_config['username'],
-                password=self.db_config['password'],
-                database=self.db_config['database'],
-                port=self.db_config.get('port', 5432)
-            )
+            self.conn = self._open_connection()
             
             # Set autocommit mode before creating cursor
             if self.dry_run:
@@ -111,6 +378,16 @@ class OSHAITADataLoader:
             self.logger.error(f"Database connection failed: {e}")
             raise
     
+    def _open_connection(self):
+        """Open a new connection from db_config"""
+        return psycopg2.connect(
+            host=self.db_config['host'],
+            user=self.db_config['username'],
+            password=self.db_config['password'],
+            database=self.db_config['database'],
+            port=self.db_config.get('port', 5432)
+        )
+    
     def disconnect(self):
         """Close database connection"""
         if self.cursor:
@@ -248,10 +525,437 @@ class OSHAITADataLoader:
         except:
             return None
     
+    def _map_column(self, series: pd.Series, func, null_value=None) -> np.ndarray:
+        """Apply a scalar converter once per distinct value and broadcast the results"""
+        def convert(value):
+            try:
+                return func(value)
+            except Exception as e:
+                self.logger.debug(f"Conversion failed for value '{value}': {e}")
+                return null_value
+        
+        if (pd.api.types.is_numeric_dtype(series) or
+                pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty')):
+            codes, uniques = pd.factorize(series)
+            lookup = np.empty(len(uniques) + 1, dtype=object)
+            lookup[:-1] = [convert(value) for value in uniques.tolist()]
+            lookup[-1] = null_value  # code -1 marks missing values
+            return lookup[codes]
+        
+        # Mixed object columns: key on type too so 1, 1.0 and True stay distinct
+        cache = {}
+        result = np.empty(len(series), dtype=object)
+        for i, value in enumerate(series.tolist()):
+            if pd.isna(value):
+                result[i] = null_value
+                continue
+            key = (type(value), value)
+            if key not in cache:
+                cache[key] = convert(value)
+            result[i] = cache[key]
+        return result
+    
+    def _convert_column(self, df: pd.DataFrame, column: str, target_type, default=None) -> np.ndarray:
+        """Column-wise equivalent of _safe_convert / _parse_* for one source column"""
+        parsers = {datetime: self._parse_timestamp, date: self._parse_date, time: self._parse_time}
+        if target_type in parsers:
+            func, default = parsers[target_type], None
+        else:
+            func = lambda value: self._safe_convert(value, target_type, default)
+        
+        if column not in df.columns:
+            result = np.empty(len(df), dtype=object)
+            result[:] = [default] * len(df)
+            return result
+        
+        series = df[column]
+        column_parsers = {datetime: self._parse_timestamp_column, date: self._parse_date_column,
+                          time: self._parse_time_column}
+        if target_type in column_parsers:
+            if not (pd.api.types.is_numeric_dtype(series) or
+                    pd.api.types.infer_dtype(series, skipna=True) in ('string', 'empty')):
+                return column_parsers[target_type](series)
+            # Repeated stamps are common, so parse each distinct value once
+            codes, uniques = pd.factorize(series)
+            lookup = np.empty(len(uniques) + 1, dtype=object)
+            lookup[:-1] = column_parsers[target_type](pd.Series(uniques))
+            lookup[-1] = None
+            return lookup[codes]
+        
+        if (target_type in (int, float) and pd.api.types.is_numeric_dtype(series)
+                and not pd.api.types.is_bool_dtype(series)):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            valid = np.isfinite(values) if target_type == int else ~np.isnan(values)
+            result = np.empty(len(values), dtype=object)
+            result[:] = [default] * len(values)
+            converted = np.trunc(values[valid]).astype(np.int64) if target_type == int else values[valid]
+            result[valid] = converted.tolist()
+            return result
+        
+        return self._map_column(series, func, default)
+    
+    def _parse_class(self, values: np.ndarray, pending: np.ndarray, result: np.ndarray,
+                     pattern: str, convert):
+        """Convert every pending value matching pattern in one call
+        
+        convert takes the matching values and returns (converted, ok); values it
+        cannot convert stay pending for the next class or the scalar fallback.
+        """
+        matches = pd.Series(values, dtype=object).str.fullmatch(pattern)
+        positions = np.flatnonzero(pending & matches.fillna(False).to_numpy(dtype=bool))
+        if len(positions) == 0:
+            return
+        converted, ok = convert(values[positions])
+        result[positions[ok]] = converted[ok]
+        pending[positions[ok]] = False
+    
+    def _finish_with_scalar(self, series: pd.Series, pending: np.ndarray, result: np.ndarray, func):
+        """Run the scalar parser, once per distinct value, over whatever is still pending"""
+        positions = np.flatnonzero(pending)
+        if len(positions):
+            result[positions] = self._map_column(series.iloc[positions], func)
+        return result
+    
+    @staticmethod
+    def _to_datetimes(parsed: pd.DatetimeIndex) -> Tuple[np.ndarray, np.ndarray]:
+        """Split a coerced DatetimeIndex into datetime objects and a parsed mask"""
+        ok = ~parsed.isna()
+        converted = np.empty(len(parsed), dtype=object)
+        converted[ok] = list(parsed[ok].to_pydatetime())
+        return converted, ok
+    
+    def _excel_serial_datetimes(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Whole-day Excel serials as datetimes; huge serials are left to the scalar path"""
+        days = values.astype(float)
+        ok = days <= self.EXCEL_MAX_DAYS
+        converted = np.empty(len(values), dtype=object)
+        converted[ok] = list((self.EXCEL_EPOCH + pd.to_timedelta(days[ok], unit='D')).to_pydatetime())
+        return converted, ok
+    
+    def _string_values(self, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Object array of a text column plus a mask of the non-empty values"""
+        values = series.to_numpy(dtype=object, na_value=None)
+        pending = series.notna().to_numpy() & (values != '')
+        return values, pending
+    
+    def _parse_timestamp_column(self, series: pd.Series) -> np.ndarray:
+        """Vectorized _parse_timestamp
+        
+        Text columns are classified once: ITA '01JAN25:15:03:00' stamps, ISO UTC
+        '...Z' stamps and whole-day Excel serials are each parsed in one pass; any
+        other value goes through _parse_timestamp itself, so results are identical.
+        """
+        if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+            return self._map_column(series, self._parse_timestamp)
+        
+        values, pending = self._string_values(series.str.strip())
+        result = np.full(len(series), None, dtype=object)
+        self._parse_class(values, pending, result, self.ITA_TIMESTAMP_PATTERN, lambda v: self._to_datetimes(
+            pd.to_datetime(v, format='%d%b%y:%H:%M:%S', errors='coerce')))
+        self._parse_class(values, pending, result, self.ISO_UTC_PATTERN, lambda v: self._to_datetimes(
+            pd.to_datetime(v, format='ISO8601', utc=True, errors='coerce')))
+        self._parse_class(values, pending, result, self.EXCEL_DAY_PATTERN, self._excel_serial_datetimes)
+        return self._finish_with_scalar(series, pending, result, self._parse_timestamp)
+    
+    def _parse_date_column(self, series: pd.Series) -> np.ndarray:
+        """Vectorized _parse_date, falling back to the scalar parser for free text"""
+        if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+            return self._map_column(series, self._parse_date)
+        
+        values, pending = self._string_values(series)
+        result = np.full(len(series), None, dtype=object)
+        
+        # Anything with a 'T' is parsed as a timestamp and truncated, as _parse_date does
+        with_t = np.flatnonzero(pending & series.str.contains('T', regex=False).fillna(False).to_numpy(dtype=bool))
+        if len(with_t):
+            result[with_t] = [dt.date() if dt else None
+                              for dt in self._parse_timestamp_column(series.iloc[with_t])]
+            pending[with_t] = False
+        
+        def as_dates(convert):
+            def wrapped(v):
+                converted, ok = convert(v)
+                converted[ok] = [value.date() for value in converted[ok]]
+                return converted, ok
+            return wrapped
+        
+        self._parse_class(values, pending, result, self.EXCEL_DAY_PATTERN, as_dates(self._excel_serial_datetimes))
+        self._parse_class(values, pending, result, self.ISO_DATE_PATTERN, as_dates(lambda v: self._to_datetimes(
+            pd.to_datetime(v, format='%Y-%m-%d', errors='coerce'))))
+        self._parse_class(values, pending, result, self.US_DATE_PATTERN, as_dates(lambda v: self._to_datetimes(
+            pd.to_datetime(v, format='%m/%d/%Y', errors='coerce'))))
+        return self._finish_with_scalar(series, pending, result, self._parse_date)
+    
+    def _parse_time_column(self, series: pd.Series) -> np.ndarray:
+        """Vectorized _parse_time, falling back to the scalar parser for free text"""
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            # Excel times are fractions of a day; same arithmetic as _parse_time
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            # Beyond int64 seconds the scalar parser's Python ints take over
+            ok = np.isfinite(values) & (np.abs(values) < 1e13)
+            if pd.api.types.is_integer_dtype(series):
+                total_seconds = series[ok].to_numpy(dtype=np.int64) * 24 * 60 * 60
+            else:
+                total_seconds = np.trunc(values[ok] * 24 * 60 * 60).astype(np.int64)
+            
+            seconds_of_day, inverse = np.unique(total_seconds % 86400, return_inverse=True)
+            times = np.empty(len(seconds_of_day), dtype=object)
+            times[:] = [time(int(k) // 3600, (int(k) % 3600) // 60, int(k) % 60) for k in seconds_of_day]
+            result = np.full(len(series), None, dtype=object)
+            result[ok] = times[inverse]
+            return self._finish_with_scalar(series, ~ok & ~np.isnan(values), result, self._parse_time)
+        
+        if pd.api.types.infer_dtype(series, skipna=True) != 'string':
+            return self._map_column(series, self._parse_time)
+        
+        values, pending = self._string_values(series)
+        result = np.full(len(series), None, dtype=object)
+        
+        with_t = np.flatnonzero(pending & series.str.contains('T', regex=False).fillna(False).to_numpy(dtype=bool))
+        if len(with_t):
+            result[with_t] = [dt.time() if dt else None
+                              for dt in self._parse_timestamp_column(series.iloc[with_t])]
+            pending[with_t] = False
+        
+        def as_times(time_format):
+            def convert(v):
+                converted, ok = self._to_datetimes(pd.to_datetime(v, format=time_format, errors='coerce'))
+                converted[ok] = [value.time() for value in converted[ok]]
+                return converted, ok
+            return convert
+        
+        # pandas' strptime takes leap seconds that pd.to_datetime('12:00:60') rejects
+        self._parse_class(values, pending, result, r'\d{1,2}:[0-5]\d', as_times('%H:%M'))
+        self._parse_class(values, pending, result, r'\d{1,2}:[0-5]\d:[0-5]\d', as_times('%H:%M:%S'))
+        return self._finish_with_scalar(series, pending, result, self._parse_time)
+    
+    def _build_snapshot_column(self, df: pd.DataFrame, year: int) -> List[str]:
+        """Build the establishment_snapshot JSON for every row of a frame"""
+        fields = ['establishment_name', 'company_name', 'street_address', 'city',
+                  'state', 'zip_code', 'naics_code', 'industry_description']
+        values = {field: self._convert_column(df, field, str) for field in fields}
+        naics_years = self._convert_column(df, 'naics_year', int)
+        
+        return [
+            json.dumps({
+                'establishment_name': name,
+                'company_name': company,
+                'address': {'street': street, 'city': city, 'state': state, 'zip': zip_code},
+                'naics': {'code': naics_code, 'year': naics_year, 'description': description},
+                'filing_year': year
+            })
+            for name, company, street, city, state, zip_code, naics_code, description, naics_year
+            in zip(*(values[field] for field in fields), naics_years)
+        ]
+    
+    def _resolve_establishments(self, df: pd.DataFrame, year: int) -> np.ndarray:
+        """Upsert the establishments of a frame set-based, returning a uuid (or None) per row
+        
+        Rows sharing (ein, establishment_name) are collapsed to the last one, as the
+        row path would leave them, and written with one multi-row INSERT ... ON
+        CONFLICT. Keys are sorted so parallel workers lock shared establishments
+        in the same order. Rows without an ein cannot conflict and are inserted as-is.
+        When replacing years the upsert is deferred to swap_staged_partitions().
+        """
+        records = pd.DataFrame({
+            target: self._convert_column(df, source, target_type, default)
+            for target, source, target_type, default in self.ESTABLISHMENT_FIELDS
+        }, dtype=object)
+        records['row_position'] = np.arange(len(records))
+        records = records[records['establishment_name'].notna()]
+        
+        keyed = records['ein'].notna()
+        pending = pd.concat([
+            records[keyed].drop_duplicates(['ein', 'establishment_name'], keep='last')
+                          .sort_values(['ein', 'establishment_name']),
+            records[~keyed]
+        ])
+        
+        rows = [
+            (establishment_id, name, ein, company,
+             json.dumps({'street_address': street, 'city': city, 'state': state, 'zip_code': zip_code}),
+             street, city, state, zip_code,
+             json.dumps({'code': naics_code, 'year': naics_year, 'description': description}),
+             naics_code, naics_year, description, establishment_type, size, year, year)
+            for establishment_id, name, ein, company, street, city, state, zip_code,
+                naics_code, naics_year, description, establishment_type, size
+            in zip(*(pending[target] for target, _, _, _ in self.ESTABLISHMENT_FIELDS))
+        ]
+        
+        if self.replace_years:
+            returned = self._defer_establishments(pending, rows)
+        elif self.dry_run:
+            self.logger.debug(f"DRY RUN - Would upsert {len(rows)} establishments")
+            returned = [{'establishment_uuid': str(uuid.uuid4())} for _ in rows]
+        else:
+            returned = self._upsert_establishments(self.ESTABLISHMENT_INSERT_COLUMNS, rows)
+        
+        # Map every input row to the uuid of its key (keyed rows) or its own insert
+        key_uuids = {}
+        establishment_uuids = np.empty(len(df), dtype=object)
+        for (position, ein, name), result in zip(
+                zip(pending['row_position'], pending['ein'], pending['establishment_name']), returned):
+            establishment_uuid = str(result['establishment_uuid'])
+            if ein is None:
+                establishment_uuids[position] = establishment_uuid
+            else:
+                key_uuids[(ein, name)] = establishment_uuid
+                if ein and not self.dry_run and not self.replace_years:
+                    self._cache_establishment((ein, name), establishment_uuid)
+        
+        keyed_records = records[keyed]
+        for position, ein, name in zip(keyed_records['row_position'], keyed_records['ein'],
+                                       keyed_records['establishment_name']):
+            establishment_uuids[position] = key_uuids[(ein, name)]
+        
+        return establishment_uuids
+    
+    def _upsert_establishments(self, columns: List[str], rows: List[tuple]) -> List[dict]:
+        """Write establishment rows with one INSERT ... ON CONFLICT, returning each row's uuid"""
+        returned = psycopg2.extras.execute_values(self.cursor, f"""
+                INSERT INTO establishments ({', '.join(columns)})
+                VALUES %s
+                ON CONFLICT (ein, establishment_name) DO UPDATE SET
+                    establishment_id = EXCLUDED.establishment_id,
+                    current_address = EXCLUDED.current_address,
+                    street_address = EXCLUDED.street_address,
+                    city = EXCLUDED.city,
+                    state_code = EXCLUDED.state_code,
+                    zip_code = EXCLUDED.zip_code,
+                    current_naics = EXCLUDED.current_naics,
+                    primary_naics_code = EXCLUDED.primary_naics_code,
+                    naics_year = EXCLUDED.naics_year,
+                    industry_description = EXCLUDED.industry_description,
+                    establishment_type = EXCLUDED.establishment_type,
+                    size_category = EXCLUDED.size_category,
+                    last_seen_year = GREATEST(establishments.last_seen_year, EXCLUDED.last_seen_year),
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING establishment_uuid, ein, establishment_name, (xmax = 0) AS inserted
+            """, rows, page_size=max(len(rows), 1), fetch=True)
+        
+        created = sum(1 for result in returned if result['inserted'])
+        self.load_statistics['establishments_created'] += created
+        self.load_statistics['establishments_updated'] += len(returned) - created
+        return returned
+    
+    def _defer_establishments(self, pending: pd.DataFrame, rows: List[tuple]) -> List[dict]:
+        """Assign uuids to a frame's establishments and queue them for swap_staged_partitions()
+        
+        Writing establishments while staging would hold locks that another
+        worker's partition attach waits on, so a replacing load only reads them
+        here: known keys take their stored uuid, new ones a uuid derived from the key.
+        """
+        keys = [(ein, name) for ein, name in zip(pending['ein'], pending['establishment_name'])
+                if ein is not None]
+        known = {}
+        for key in keys:
+            known_uuid = self.deferred_establishments.get(key, (None,))[0] or self._cached_establishment(key)
+            if known_uuid:
+                known[key] = known_uuid
+        missing = [key for key in keys if key not in known]
+        if missing and not self.dry_run:
+            self.cursor.execute("""
+                SELECT establishment_uuid, ein, establishment_name
+                FROM establishments
+                WHERE (ein, establishment_name) IN (SELECT * FROM unnest(%s::text[], %s::text[]))
+            """, ([ein for ein, _ in missing], [name for _, name in missing]))
+            for result in self.cursor.fetchall():
+                known[(result['ein'], result['establishment_name'])] = str(result['establishment_uuid'])
+        
+        returned = []
+        for ein, name, row in zip(pending['ein'], pending['establishment_name'], rows):
+            if ein is None:
+                key, establishment_uuid = (None, len(self.deferred_establishments)), str(uuid.uuid4())
+            else:
+                key = (ein, name)
+                establishment_uuid = known.get(key) or str(
+                    uuid.uuid5(self.ESTABLISHMENT_UUID_NAMESPACE, f"{ein}\x1f{name}"))
+            self.deferred_establishments[key] = (establishment_uuid, row)
+            returned.append({'establishment_uuid': establishment_uuid})
+        return returned
+    
+    def _write_deferred_establishments(self):
+        """Upsert the establishments a replacing load queued, fixing staged rows whose uuid changed
+        
+        A key another worker inserted after this file looked it up keeps the
+        stored uuid, so staged rows pointing at the assigned one are updated.
+        """
+        if not self.deferred_establishments:
+            return
+        entries = sorted((key, entry) for key, entry in self.deferred_establishments.items()
+                         if key[0] is not None)
+        entries += [(key, entry) for key, entry in self.deferred_establishments.items() if key[0] is None]
+        returned = self._upsert_establishments(
+            ['establishment_uuid'] + self.ESTABLISHMENT_INSERT_COLUMNS,
+            [(establishment_uuid,) + row for _, (establishment_uuid, row) in entries]
+        )
+        
+        remapped = []
+        for result in returned:
+            if result['ein'] is None:
+                continue
+            key = (result['ein'], result['establishment_name'])
+            establishment_uuid = str(result['establishment_uuid'])
+            if establishment_uuid != self.deferred_establishments[key][0]:
+                remapped.append((self.deferred_establishments[key][0], establishment_uuid))
+            if result['ein']:
+                self._cache_establishment(key, establishment_uuid)
+        
+        if remapped:
+            self.logger.debug(f"Re-pointing staged rows of {len(remapped)} establishments")
+            for staging in self.staged_partitions.values():
+                psycopg2.extras.execute_values(self.cursor, f"""
+                    UPDATE {staging} s SET establishment_uuid = m.stored::uuid
+                    FROM (VALUES %s) AS m (assigned, stored)
+                    WHERE s.establishment_uuid = m.assigned::uuid
+                """, remapped, page_size=max(len(remapped), 1))
+        self.deferred_establishments = {}
+    
+    def _copy_frame(self, table: str, frame: pd.DataFrame) -> bool:
+        """Stream a converted frame into table with COPY, isolating a failed chunk
+        
+        When replacing years a failed chunk is re-raised instead, so the file
+        rolls back rather than swapping in a partition that is missing rows.
+        """
+        if self.dry_run:
+            self.logger.debug(f"DRY RUN - Would COPY {len(frame)} rows into {table}")
+            return True
+        
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, header=False, na_rep='\\N')
+        buffer.seek(0)
+        
+        self.cursor.execute("SAVEPOINT ita_copy")
+        try:
+            self.cursor.copy_expert(
+                f"COPY {table} ({', '.join(frame.columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer
+            )
+        except psycopg2.Error as e:
+            self.cursor.execute("ROLLBACK TO SAVEPOINT ita_copy")
+            self.logger.error(f"COPY into {table} failed for {len(frame)} rows: {e}")
+            if self.replace_years:
+                raise
+            return False
+        self.cursor.execute("RELEASE SAVEPOINT ita_copy")
+        return True
+    
     def create_data_load_record(self, source_file: str, load_type: str, data_year: int) -> str:
         """Create a data load record and return load_id"""
         file_hash = self._calculate_file_hash(source_file)
         
+        if self.replace_years:
+            # Written by swap_staged_partitions(), see _defer_establishments()
+            load_id = str(uuid.uuid4())
+            self.deferred_load_records[load_id] = {
+                'load_type': load_type, 'source_file_name': source_file, 'source_file_hash': file_hash,
+                'data_year': data_year, 'load_status': 'in_progress',
+                'records_loaded': 0, 'records_updated': 0, 'records_failed': 0
+            }
+            self.file_load_ids.append(load_id)
+            self._set_audit_load(load_id)
+            return load_id
+        
         query = """
             INSERT INTO data_loads (
                 load_type, source_file_name, source_file_hash, data_year, 
@@ -266,19 +970,53 @@ class OSHAITADataLoader:
             fetch_one=True
         )
         
-        return str(result['load_id'])
+        load_id = str(result['load_id'])
+        self.file_load_ids.append(load_id)
+        self._set_audit_load(load_id)
+        return load_id
+    
+    def _set_audit_load(self, load_id: str):
+        """Point batch-mode audit triggers at a load"""
+        if self.audit_mode == 'batch' and not self.dry_run:
+            # Audit triggers now add row counts to one entry per table for this load
+            self.cursor.execute("SELECT set_config(%s, %s, false)", (self.AUDIT_LOAD_SETTING, load_id))
+            self.audit_load_id = load_id
+    
+    def _write_deferred_load_records(self):
+        """Insert the data_loads rows a replacing load queued"""
+        if self.deferred_load_records and not self.dry_run:
+            columns = ['load_id', 'load_type', 'source_file_name', 'source_file_hash', 'data_year',
+                       'load_status', 'records_loaded', 'records_updated', 'records_failed']
+            psycopg2.extras.execute_values(self.cursor, f"""
+                INSERT INTO data_loads ({', '.join(columns)}, loaded_by) VALUES %s
+            """, [(load_id,) + tuple(record[column] for column in columns[1:]) + ('python_loader',)
+                  for load_id, record in self.deferred_load_records.items()])
+        self.deferred_load_records = {}
     
     def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of file"""
+        """Calculate SHA256 hash of file, reusing it while the file is unchanged"""
         try:
-            with open(file_path, 'rb') as f:
-                return hashlib.sha256(f.read()).hexdigest()
+            stat = os.stat(file_path)
+            key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+            if key not in self.file_hashes:
+                digest = hashlib.sha256()
+                with open(file_path, 'rb') as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(block)
+                self.file_hashes[key] = digest.hexdigest()
+            return self.file_hashes[key]
         except:
             return hashlib.sha256(str(datetime.now()).encode()).hexdigest()
     
     def update_load_record(self, load_id: str, status: str = 'completed', 
                           loaded: int = 0, updated: int = 0, failed: int = 0):
         """Update data load record with final statistics"""
+        if load_id in self.deferred_load_records:
+            self.deferred_load_records[load_id].update(
+                load_status=status, records_loaded=loaded, records_updated=updated, records_failed=failed
+            )
+            return
+        
         query = """
             UPDATE data_loads 
             SET load_status = %s, records_loaded = %s, records_updated = %s, 
@@ -288,6 +1026,11 @@ class OSHAITADataLoader:
         
         self._execute_query(query, (status, loaded, updated, failed, load_id))
     
+    def finish_load_record(self, load_id: str, loaded: int):
+        """Close a file's load record, marking it partial when the file recorded errors"""
+        failed = self.load_statistics['errors'] - self.file_errors_start
+        self.update_load_record(load_id, 'partial' if failed else 'completed', loaded, failed=failed)
+    
     def upsert_establishment(self, row_data: dict, year: int) -> str:
         """Upsert establishment and return establishment_uuid"""
         
@@ -323,19 +1066,20 @@ class OSHAITADataLoader:
         }
         
         # First, try to find existing establishment
+        establishment_key = (establishment_data['ein'], establishment_data['establishment_name'])
         if establishment_data['ein'] and establishment_data['establishment_name']:
-            query = """
-                SELECT establishment_uuid FROM establishments 
-                WHERE ein = %s AND establishment_name = %s
-            """
-            result = self._execute_query(
-                query, 
-                (establishment_data['ein'], establishment_data['establishment_name']),
-                fetch_one=True
-            )
+            establishment_uuid = self._cached_establishment(establishment_key)
+            if establishment_uuid is None:
+                query = """
+                    SELECT establishment_uuid FROM establishments 
+                    WHERE ein = %s AND establishment_name = %s
+                """
+                result = self._execute_query(query, establishment_key, fetch_one=True)
+                if result and not self.dry_run:
+                    establishment_uuid = str(result['establishment_uuid'])
+                    self._cache_establishment(establishment_key, establishment_uuid)
             
-            if result and not self.dry_run:
-                establishment_uuid = str(result['establishment_uuid'])
+            if establishment_uuid and not self.dry_run:
                 
                 # Update existing establishment
                 update_query = """
@@ -413,12 +1157,31 @@ class OSHAITADataLoader:
             establishment_uuid = str(uuid.uuid4())
         else:
             establishment_uuid = str(result['establishment_uuid'])
+            if establishment_data['ein'] and establishment_data['establishment_name']:
+                self._cache_establishment(establishment_key, establishment_uuid)
         
         self.load_statistics['establishments_created'] += 1
         return establishment_uuid
     
+    def _cached_establishment(self, key: tuple) -> Optional[str]:
+        """Return a cached establishment_uuid for (ein, establishment_name)"""
+        establishment_uuid = self.establishment_cache.get(key)
+        if establishment_uuid is not None:
+            self.establishment_cache.move_to_end(key)
+        return establishment_uuid
+    
+    def _cache_establishment(self, key: tuple, establishment_uuid: str):
+        """Remember an establishment_uuid, evicting the least recently used entry"""
+        self.establishment_cache[key] = establishment_uuid
+        self.establishment_cache.move_to_end(key)
+        if len(self.establishment_cache) > self.ESTABLISHMENT_CACHE_SIZE:
+            self.establishment_cache.popitem(last=False)
+    
     def load_300a_summary_data(self, df: pd.DataFrame, load_id: str, year: int):
         """Load 300A summary data from DataFrame"""
+        if self.bulk:
+            return self.bulk_load_300a_summary_data(df, load_id, year)
+        
         self.logger.info(f"Loading 300A summary data: {len(df)} records for year {year}")
         
         for index, row in df.iterrows():
@@ -498,6 +1261,9 @@ class OSHAITADataLoader:
     
     def load_case_detail_data(self, df: pd.DataFrame, load_id: str, year: int):
         """Load case detail data from DataFrame"""
+        if self.bulk:
+            return self.bulk_load_case_detail_data(df, load_id, year)
+        
         self.logger.info(f"Loading case detail data: {len(df)} records for year {year}")
         
         for index, row in df.iterrows():
@@ -590,8 +1356,199 @@ class OSHAITADataLoader:
                 self.load_statistics['errors'] += 1
                 continue
     
+    def bulk_load_300a_summary_data(self, df: pd.DataFrame, load_id: str, year: int):
+        """Load 300A summary data with column-wise conversion and a single COPY"""
+        self.logger.info(f"Bulk loading 300A summary data: {len(df)} records for year {year}")
+        started = datetime.now()
+        
+        columns = {
+            'establishment_uuid': self._resolve_establishments(df, year),
+            'load_id': load_id,
+            'establishment_snapshot': self._build_snapshot_column(df, year),
+            'year_filing_for': year,
+        }
+        for target, source, target_type, default in self.SUMMARY_300A_FIELDS:
+            columns[target] = self._convert_column(df, source, target_type, default)
+        frame = pd.DataFrame(columns, dtype=object)
+        
+        loaded = self._write_bulk_frame(self._bulk_target('summary_300a_data', year), frame,
+                                        ['establishment_uuid'])
+        self.load_statistics['summary_records_loaded'] += loaded
+        self._log_bulk_rate('300A', loaded, started)
+    
+    def bulk_load_case_detail_data(self, df: pd.DataFrame, load_id: str, year: int):
+        """Load case detail data with column-wise conversion and a single COPY"""
+        self.logger.info(f"Bulk loading case detail data: {len(df)} records for year {year}")
+        started = datetime.now()
+        
+        columns = {
+            'establishment_uuid': self._resolve_establishments(df, year),
+            'load_id': load_id,
+            'establishment_snapshot': self._build_snapshot_column(df, year),
+            'year_filing_for': year,
+        }
+        for target, source, target_type, default in self.CASE_DETAIL_FIELDS:
+            columns[target] = self._convert_column(df, source, target_type, default)
+        columns['incident_narratives'] = [
+            json.dumps(dict(zip([key for key, _ in self.NARRATIVE_KEYS], values)))
+            for values in zip(*(columns[column] for _, column in self.NARRATIVE_KEYS))
+        ]
+        frame = pd.DataFrame(columns, dtype=object)
+        
+        loaded = self._write_bulk_frame(self._bulk_target('case_detail_data', year), frame,
+                                        ['establishment_uuid', 'incident_outcome', 'type_of_incident'])
+        self.load_statistics['case_records_loaded'] += loaded
+        self._log_bulk_rate('case detail', loaded, started)
+    
+    def _bulk_target(self, table: str, year: int) -> str:
+        """Table a bulk load COPYs into: the fact table, or a year staging table when replacing years
+        
+        The first file of each year replaces that year's partition: it loads an
+        unindexed staging table that swap_staged_partitions() attaches in place
+        of the old partition. Later files of the year stage too and are appended
+        to the new partition. The staging table is declared from the catalog, as
+        LIKE would hold a lock on the fact table that other workers' swaps wait on.
+        """
+        if not self.replace_years:
+            return table
+        if (table, year) not in self.staged_partitions:
+            staging = f"{table}_y{year}_load"
+            if not self.dry_run:
+                result = self._execute_query("""
+                    SELECT string_agg(format('%%I %%s%%s%%s', a.attname, format_type(a.atttypid, a.atttypmod),
+                                             CASE WHEN a.attnotnull THEN ' NOT NULL' ELSE '' END,
+                                             ' DEFAULT ' || pg_get_expr(d.adbin, d.adrelid)),
+                                      ', ' ORDER BY a.attnum) AS columns
+                    FROM pg_attribute a
+                    LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                    WHERE a.attrelid = %s::regclass AND a.attnum > 0 AND NOT a.attisdropped
+                """, (table,), fetch_one=True)
+                self._execute_query(f"""
+                    CREATE TABLE {staging} ({result['columns']},
+                        CONSTRAINT {staging}_year CHECK (year_filing_for = {int(year)}))
+                """)
+            self.staged_partitions[(table, year)] = staging
+        return self.staged_partitions[(table, year)]
+    
+    def swap_staged_partitions(self) -> List[int]:
+        """Write a replacing file's deferred rows and put its staging tables in place
+        
+        Staging tables attach in place of their year partitions, or are appended
+        when this run already replaced the year. Refuses to swap when the file
+        recorded errors, or when a staging table is empty but the partition it
+        would replace is not. Returns the years whose partitions were replaced.
+        """
+        if not self.replace_years or self.dry_run:
+            self.staged_partitions.clear()
+            return []
+        
+        file_errors = self.load_statistics['errors'] - self.file_errors_start
+        if file_errors and self.staged_partitions:
+            raise ValueError(f"Not replacing partitions for {sorted({y for _, y in self.staged_partitions})}: "
+                             f"file recorded {file_errors} errors")
+        
+        # Detaching and attaching locks data_loads and establishments, so only the
+        # file holding this lock writes them; staging happens outside it
+        self._execute_query("SELECT pg_advisory_xact_lock(hashtext(%s))", (self.PARTITION_SWAP_LOCK_KEY,))
+        for (table, year), staging in self.staged_partitions.items():
+            if (table, year) in self.replaced_partitions:
+                continue
+            result = self._execute_query(f"""
+                SELECT EXISTS (SELECT 1 FROM {staging}) AS staged,
+                       EXISTS (SELECT 1 FROM {table} WHERE year_filing_for = %s) AS existing
+            """, (year,), fetch_one=True)
+            if result['existing'] and not result['staged']:
+                raise ValueError(f"Not replacing {table} partition for {year} with an empty load")
+        
+        self._write_deferred_load_records()
+        self._write_deferred_establishments()
+        
+        years = []
+        for (table, year), staging in self.staged_partitions.items():
+            if (table, year) in self.replaced_partitions:
+                self._execute_query(f"INSERT INTO {table} SELECT * FROM {staging}")
+                self._execute_query(f"DROP TABLE {staging}")
+                continue
+            result = self._execute_query("SELECT swap_year_partition(%s, %s, %s) AS row_count",
+                                         (table, year, staging), fetch_one=True)
+            self.logger.info(f"Replaced {table} partition for {year} with {result['row_count']} rows")
+            self.replaced_partitions.add((table, year))
+            years.append(year)
+        self.staged_partitions.clear()
+        return sorted(set(years))
+    
+    def refresh_establishment_rollup(self, replaced_years: List[int] = None):
+        """Update establishment_year_rollup for this file's loads and any replaced years"""
+        if self.file_load_ids or replaced_years:
+            result = self._execute_query(
+                "SELECT refresh_establishment_rollup(%s::uuid[], %s::integer[]) AS refreshed",
+                (self.file_load_ids, replaced_years or []), fetch_one=True
+            )
+            if not self.dry_run:
+                self.logger.debug(f"Refreshed {result['refreshed']} establishment rollup rows")
+        self.file_load_ids = []
+    
+    def rebuild_establishment_rollup(self) -> int:
+        """Recompute establishment_year_rollup from the fact tables"""
+        result = self._execute_query("SELECT rebuild_establishment_rollup() AS refreshed", fetch_one=True)
+        if self.dry_run:
+            return 0
+        self.logger.info(f"Rebuilt establishment rollup: {result['refreshed']} rows")
+        return result['refreshed']
+    
+    def drop_retired_partitions(self) -> int:
+        """Drop the partitions replaced by --replace-years once no file is loading"""
+        result = self._execute_query("SELECT drop_retired_partitions() AS dropped", fetch_one=True)
+        if self.dry_run:
+            return 0
+        self.conn.commit()
+        if result['dropped']:
+            self.logger.info(f"Dropped {result['dropped']} replaced partitions")
+        return result['dropped']
+    
+    def _write_bulk_frame(self, table: str, frame: pd.DataFrame, required: List[str]) -> int:
+        """Drop rows missing NOT NULL values, COPY the rest and return the rows written"""
+        complete = frame[required].notna().all(axis=1)
+        rejected = int((~complete).sum())
+        if rejected:
+            self.logger.error(f"Skipping {rejected} {table} rows missing one of {', '.join(required)}")
+            self.load_statistics['errors'] += rejected
+        
+        frame = frame[complete]
+        if len(frame) == 0:
+            return 0
+        if not self._copy_frame(table, frame):
+            self.load_statistics['errors'] += len(frame)
+            return 0
+        return len(frame)
+    
+    def _log_bulk_rate(self, label: str, rows: int, started: datetime):
+        """Log throughput for a bulk load step"""
+        elapsed = (datetime.now() - started).total_seconds()
+        rate = rows / elapsed if elapsed > 0 else float(rows)
+        self.logger.info(f"Loaded {rows} {label} records in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+    
+    def _read_cached(self, file_path: str, reader) -> Dict[str, pd.DataFrame]:
+        """Return a file's parsed sheets from the cache, parsing and storing them on a miss"""
+        if self.parsed_cache is None:
+            return reader(file_path)
+        
+        file_hash = self._calculate_file_hash(file_path)
+        sheets = self.parsed_cache.get(file_hash)
+        if sheets is not None:
+            self.logger.debug(f"Parsed-file cache hit for {file_path}")
+            return sheets
+        
+        sheets = reader(file_path)
+        self.parsed_cache.put(file_hash, sheets)
+        return sheets
+    
     def read_excel_file(self, file_path: str) -> Dict[str, pd.DataFrame]:
         """Read Excel file and return dictionary of DataFrames by sheet name"""
+        return self._read_cached(file_path, self._parse_excel_file)
+    
+    def _parse_excel_file(self, file_path: str) -> Dict[str, pd.DataFrame]:
+        """Parse every sheet of an Excel file into cleaned DataFrames"""
         try:
             # Use openpyxl engine for better compatibility
             excel_file = pd.ExcelFile(file_path, engine='openpyxl')
@@ -618,6 +1575,10 @@ class OSHAITADataLoader:
     
     def read_csv_file(self, file_path: str) -> pd.DataFrame:
         """Read CSV file and return DataFrame"""
+        return self._read_cached(file_path, lambda path: {'csv': self._parse_csv_file(path)})['csv']
+    
+    def _parse_csv_file(self, file_path: str) -> pd.DataFrame:
+        """Parse a CSV file into a cleaned DataFrame"""
         try:
             df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
             
@@ -634,6 +1595,80 @@ class OSHAITADataLoader:
             self.logger.error(f"Error reading CSV file {file_path}: {e}")
             raise
     
+    @classmethod
+    def _csv_dtype_schema(cls) -> Dict[str, type]:
+        """
+        Source column -> dtype for chunked reads, taken from the field maps:
+        int/float columns are float64, everything else (text, bool and the
+        date/time columns the _parse_* helpers read) is str
+        """
+        schema = {}
+        for _, source, target_type, _ in cls.SUMMARY_300A_FIELDS + cls.CASE_DETAIL_FIELDS + cls.ESTABLISHMENT_FIELDS:
+            schema[source.lower()] = float if target_type in (int, float) else str
+        schema.update((column, str) for column in cls.CSV_TEXT_COLUMNS)
+        return schema
+    
+    def read_csv_chunks(self, file_path: str, chunksize: int):
+        """Yield cleaned DataFrame chunks of a CSV file using the dtype schema"""
+        header = pd.read_csv(file_path, encoding='utf-8', nrows=0).columns
+        schema = self._csv_dtype_schema()
+        # Everything is read as text; numeric columns are then coerced, so a stray
+        # non-numeric value becomes NaN (the converters' default) in every chunk
+        # rather than turning that one chunk's column into objects
+        dtypes = {column: str for column in header if column.lower().strip() in schema}
+        numeric_columns = [column.lower().strip() for column in header
+                           if schema.get(column.lower().strip()) is float]
+        # Excel times are day fractions, which an unchunked read infers as numbers
+        # when the whole column is numeric; _parse_time only converts numbers
+        time_sources = {source.lower() for _, source, target_type, _ in self.CASE_DETAIL_FIELDS
+                        if target_type is time}
+        time_columns = [column.lower().strip() for column in header if column.lower().strip() in time_sources]
+        
+        try:
+            for chunk in pd.read_csv(file_path, encoding='utf-8', dtype=dtypes, chunksize=chunksize):
+                chunk.columns = chunk.columns.str.lower().str.strip()
+                chunk = chunk.dropna(how='all')
+                for column in numeric_columns:
+                    chunk[column] = pd.to_numeric(chunk[column].str.strip(), errors='coerce').astype('float64')
+                for column in time_columns:
+                    numeric = pd.to_numeric(chunk[column].str.strip(), errors='coerce')
+                    if numeric.notna().sum() == chunk[column].notna().sum():
+                        chunk[column] = numeric.astype('float64')
+                yield chunk
+        except Exception as e:
+            self.logger.error(f"Error reading CSV file {file_path}: {e}")
+            raise
+    
+    def process_csv_chunks(self, file_path: Path, data_year: int):
+        """Load a CSV file chunk by chunk under a single data load record"""
+        load_id = None
+        load_type = None
+        loaded_key = None
+        
+        for chunk_number, chunk in enumerate(self.read_csv_chunks(str(file_path), self.chunksize), 1):
+            if len(chunk) == 0:
+                continue
+            
+            if load_id is None:
+                columns = set(chunk.columns)
+                if self._is_300a_summary_data(columns):
+                    load_type, loaded_key = '300A_summary', 'summary_records_loaded'
+                elif self._is_case_detail_data(columns):
+                    load_type, loaded_key = 'case_detail', 'case_records_loaded'
+                else:
+                    self.logger.warning(f"Unknown data type in CSV file {file_path}")
+                    return
+                load_id = self.create_data_load_record(str(file_path), load_type, data_year)
+            
+            self.logger.info(f"Chunk {chunk_number}: {len(chunk)} rows from {file_path.name}")
+            if load_type == '300A_summary':
+                self.load_300a_summary_data(chunk, load_id, data_year)
+            else:
+                self.load_case_detail_data(chunk, load_id, data_year)
+        
+        if load_id is not None:
+            self.finish_load_record(load_id, self.load_statistics[loaded_key])
+    
     def process_file(self, file_path: str, data_year: int = None):
         """Process a single Excel or CSV file"""
         file_path = Path(file_path)
@@ -642,6 +1677,8 @@ class OSHAITADataLoader:
         # Detect data year from filename or path if not provided
         if data_year is None:
             data_year = self._extract_year_from_path(str(file_path))
+        self._execute_query("SELECT ensure_year_partitions(%s)", (data_year,))
+        self.file_errors_start = self.load_statistics['errors']
         
         # Determine file type and load mode
         if file_path.suffix.lower() in ['.xlsx', '.xls']:
@@ -657,18 +1694,19 @@ class OSHAITADataLoader:
                 if self._is_300a_summary_data(columns):
                     load_id = self.create_data_load_record(str(file_path), '300A_summary', data_year)
                     self.load_300a_summary_data(df, load_id, data_year)
-                    self.update_load_record(load_id, 'completed', 
-                                          self.load_statistics['summary_records_loaded'])
+                    self.finish_load_record(load_id, self.load_statistics['summary_records_loaded'])
                     
                 elif self._is_case_detail_data(columns):
                     load_id = self.create_data_load_record(str(file_path), 'case_detail', data_year)
                     self.load_case_detail_data(df, load_id, data_year)
-                    self.update_load_record(load_id, 'completed', 
-                                          self.load_statistics['case_records_loaded'])
+                    self.finish_load_record(load_id, self.load_statistics['case_records_loaded'])
                     
                 else:
                     self.logger.warning(f"Unknown data type in sheet {sheet_name} of {file_path}")
                     
+        elif file_path.suffix.lower() == '.csv' and self.chunksize:
+            self.process_csv_chunks(file_path, data_year)
+            
         elif file_path.suffix.lower() == '.csv':
             df = self.read_csv_file(str(file_path))
             
@@ -680,18 +1718,17 @@ class OSHAITADataLoader:
             if self._is_300a_summary_data(columns):
                 load_id = self.create_data_load_record(str(file_path), '300A_summary', data_year)
                 self.load_300a_summary_data(df, load_id, data_year)
-                self.update_load_record(load_id, 'completed', 
-                                      self.load_statistics['summary_records_loaded'])
+                self.finish_load_record(load_id, self.load_statistics['summary_records_loaded'])
                 
             elif self._is_case_detail_data(columns):
                 load_id = self.create_data_load_record(str(file_path), 'case_detail', data_year)
                 self.load_case_detail_data(df, load_id, data_year)
-                self.update_load_record(load_id, 'completed', 
-                                      self.load_statistics['case_records_loaded'])
+                self.finish_load_record(load_id, self.load_statistics['case_records_loaded'])
                 
             else:
                 self.logger.warning(f"Unknown data type in CSV file {file_path}")
         
+        self.refresh_establishment_rollup(self.swap_staged_partitions())
         self.load_statistics['files_processed'] += 1
     
     def _is_300a_summary_data(self, columns: set) -> bool:
@@ -746,7 +1783,7 @@ class OSHAITADataLoader:
         self.logger.warning(f"Could not extract year from path: {file_path_str}")
         return datetime.now().year
     
-    def process_directory(self, root_dir: str, recursive: bool = True):
+    def process_directory(self, root_dir: str, recursive: bool = True, workers: int = None):
         """Process all Excel and CSV files in a directory structure"""
         root_path = Path(root_dir)
         self.logger.info(f"Processing directory: {root_path}")
@@ -777,23 +1814,199 @@ class OSHAITADataLoader:
             year = self._extract_year_from_path(str(file_path))
             self.logger.info(f"Will process: {file_path} (Year: {year})")
         
-        # Process files in order
-        for file_path in sorted(data_files):
+        data_files = self.select_files_to_load(sorted(data_files))
+        
+        # Create year partitions up front so parallel workers never contend on them
+        for year in sorted({self._extract_year_from_path(str(file_path)) for file_path in data_files}):
+            self._execute_query("SELECT ensure_year_partitions(%s)", (year,))
+        if not self.dry_run:
+            self.conn.commit()
+        
+        if workers and workers > 1:
+            self.process_years_parallel(data_files, workers)
+        else:
+            self.process_files(sorted(data_files))
+    
+    def select_files_to_load(self, file_paths: List[Path]) -> List[Path]:
+        """Classify files against completed loads and drop unchanged ones unless forced
+        
+        A file is unchanged when a completed data_loads record with no failed
+        rows has its content hash, changed when only its name was loaded before
+        (including partial loads that lost rows), and new otherwise.
+        When replacing years, the first file loaded for a year replaces the whole
+        partition, so every file of a year with a new or changed file is reloaded.
+        """
+        hashes = {str(file_path): self._calculate_file_hash(str(file_path)) for file_path in file_paths}
+        
+        loaded_hashes, loaded_names = set(), set()
+        if hashes:
+            self.cursor.execute("""
+                SELECT source_file_name, source_file_hash, load_status, records_failed
+                FROM data_loads
+                WHERE load_status IN ('completed', 'partial')
+                  AND (source_file_hash = ANY(%s) OR source_file_name = ANY(%s))
+            """, (list(set(hashes.values())), list(hashes)))
+            for row in self.cursor.fetchall():
+                if row['load_status'] == 'completed' and not row['records_failed']:
+                    loaded_hashes.add(row['source_file_hash'])
+                loaded_names.add(row['source_file_name'])
+        
+        statuses = {}
+        seen_hashes = set()
+        for file_path in file_paths:
+            file_hash = hashes[str(file_path)]
+            if file_hash in loaded_hashes or file_hash in seen_hashes:
+                status = 'unchanged'
+            elif str(file_path) in loaded_names:
+                status = 'changed'
+            else:
+                status = 'new'
+            self.file_status[status].append(str(file_path))
+            statuses[file_path] = status
+            seen_hashes.add(file_hash)
+        
+        reload_years = set()
+        if self.replace_years:
+            reload_years = {self._extract_year_from_path(str(file_path))
+                            for file_path, status in statuses.items() if status != 'unchanged'}
+        
+        selected = []
+        for file_path in file_paths:
+            if statuses[file_path] == 'unchanged' and not self.force:
+                year = self._extract_year_from_path(str(file_path))
+                if year in reload_years:
+                    self.logger.info(f"Reloading unchanged file: {file_path} (year {year} is being replaced)")
+                else:
+                    self.logger.info(f"Skipping unchanged file: {file_path}")
+                    self.load_statistics['files_skipped'] += 1
+                    continue
+            selected.append(file_path)
+        
+        self.logger.info(f"Files - new: {len(self.file_status['new'])}, "
+                         f"changed: {len(self.file_status['changed'])}, "
+                         f"unchanged: {len(self.file_status['unchanged'])}"
+                         f"{' (reloading, --force)' if self.force else ''}")
+        return selected
+    
+    def process_files(self, file_paths: List[Path]):
+        """Process files in order, committing each one or rolling it back on failure
+        
+        When replacing years, a failed file stops the rest of its year: the next
+        file would otherwise replace the partition without the failed file's rows.
+        """
+        failed_years = set()
+        for file_path in file_paths:
+            year = self._extract_year_from_path(str(file_path))
+            if self.replace_years and year in failed_years:
+                self.logger.error(f"Skipping {file_path}: an earlier file of year {year} failed")
+                self.load_statistics['errors'] += 1
+                continue
             try:
                 self.logger.info(f"Processing: {file_path}")
+                self._load_file(file_path)
+                    
+            except Exception as e:
+                self.logger.error(f"Failed to process file {file_path}: {e}")
+                self._rollback_file()
+                self.load_statistics['errors'] += 1
+                failed_years.add(year)
+                continue
+    
+    def _load_file(self, file_path: Path):
+        """Process and commit one file, loading it again when it loses a deadlock
+        
+        Parallel workers upsert the same establishments, and a chunked file does
+        so in several statements, so a file may be picked as a deadlock victim;
+        its transaction is rolled back and its statistics restored before the retry.
+        """
+        for attempt in range(self.DEADLOCK_RETRIES + 1):
+            statistics = dict(self.load_statistics)
+            replaced_partitions = set(self.replaced_partitions)
+            try:
                 self.process_file(file_path)
                 
                 # Commit after each file if not in dry run mode
                 if not self.dry_run:
                     self.conn.commit()
                     self.logger.debug(f"Committed changes for file: {file_path}")
-                    
-            except Exception as e:
-                self.logger.error(f"Failed to process file {file_path}: {e}")
-                if not self.dry_run:
-                    self.conn.rollback()
-                self.load_statistics['errors'] += 1
-                continue
+                return
+            except psycopg2.errors.DeadlockDetected:
+                if attempt == self.DEADLOCK_RETRIES:
+                    raise
+                self.logger.warning(f"Deadlock while loading {file_path}, retrying "
+                                    f"({attempt + 1}/{self.DEADLOCK_RETRIES})")
+                self._rollback_file()
+                self.load_statistics.update(statistics)
+                self.replaced_partitions = replaced_partitions
+    
+    def _rollback_file(self):
+        """Roll back the current file and drop state that referred to its transaction"""
+        if not self.dry_run:
+            self.conn.rollback()
+            self.establishment_cache.clear()  # may hold rolled-back inserts
+            self.staged_partitions.clear()
+            self.file_load_ids = []
+            self.deferred_load_records = {}
+            self.deferred_establishments = {}
+    
+    def process_years_parallel(self, data_files: List[Path], workers: int):
+        """Process each filing year's files in its own worker process
+        
+        Years touch disjoint year_filing_for slices, so they load concurrently;
+        files of one year still run in order. Workers always use the bulk path;
+        each file stays one transaction and is retried if it loses a deadlock.
+        """
+        files_by_year = {}
+        for file_path in sorted(data_files):
+            year = self._extract_year_from_path(str(file_path))
+            files_by_year.setdefault(year, []).append(str(file_path))
+        
+        # Start the biggest years first so the longest one is never queued last
+        years = sorted(files_by_year, reverse=True,
+                       key=lambda y: sum(os.path.getsize(p) for p in files_by_year[y]))
+        if not years:
+            return
+        workers = min(workers, len(years))
+        self.logger.info(f"Processing {len(years)} years with {workers} workers")
+        
+        started = datetime.now()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_process_year_worker, self.db_config, year, files_by_year[year],
+                                self._worker_options()): year
+                for year in years
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. BrokenProcessPool); its year failed
+                    self.logger.error(f"Year {futures[future]}: FAILED - {type(e).__name__}: {e}")
+                    self.load_statistics['errors'] += 1
+                    continue
+                for key, value in result['load_statistics'].items():
+                    self.load_statistics[key] += value
+                if result['status'] == 'success':
+                    self.logger.info(f"Year {result['year']}: {result['files']} files in "
+                                     f"{result['elapsed_seconds']:.2f}s")
+                else:
+                    self.logger.error(f"Year {result['year']}: FAILED - {result['error']}")
+                    self.load_statistics['errors'] += 1
+        
+        self.logger.info(f"Parallel load finished in {(datetime.now() - started).total_seconds():.2f}s")
+    
+    def _worker_options(self) -> dict:
+        """Loader settings a parallel worker is created with"""
+        return {
+            'load_mode': self.load_mode,
+            'dry_run': self.dry_run,
+            'chunksize': self.chunksize,
+            'cache_dir': self.cache_dir,
+            'cache_max_mb': self.cache_max_mb,
+            'force': self.force,
+            'audit_mode': self.audit_mode,
+            'replace_years': self.replace_years,
+        }
     
     def validate_data_integrity(self) -> Dict[str, Any]:
         """Validate data integrity after loading"""
@@ -878,6 +2091,17 @@ class OSHAITADataLoader:
             report.append(f"  {key.replace('_', ' ').title()}: {value:,}")
         report.append("")
         
+        if any(self.file_status.values()):
+            report.append("FILES:")
+            report.append("-" * 20)
+            labels = [('new', 'New'), ('changed', 'Changed'),
+                      ('unchanged', 'Unchanged (reloaded)' if self.force else 'Skipped (unchanged)')]
+            for status, label in labels:
+                report.append(f"  {label}: {len(self.file_status[status])}")
+                for file_path in self.file_status[status]:
+                    report.append(f"    - {file_path}")
+            report.append("")
+        
         # Get validation results
         validation = self.validate_data_integrity()
         report.append("DATA VALIDATION:")
@@ -902,6 +2126,26 @@ class OSHAITADataLoader:
         return "\n".join(report)
 
 
+def _process_year_worker(db_config: dict, year: int, file_paths: List[str], options: dict) -> dict:
+    """Process pool worker: load one year's files on its own connection"""
+    started = datetime.now()
+    loader = OSHAITADataLoader(db_config, bulk=True, **options)
+    result = {'year': year, 'files': len(file_paths), 'status': 'success', 'error': None}
+    
+    try:
+        loader.connect()
+        loader.process_files([Path(file_path) for file_path in file_paths])
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+    finally:
+        loader.disconnect()
+    
+    result['load_statistics'] = loader.load_statistics
+    result['elapsed_seconds'] = (datetime.now() - started).total_seconds()
+    return result
+
+
 def main():
     """Main entry point with comprehensive argument parsing"""
     parser = argparse.ArgumentParser(
@@ -918,6 +2162,30 @@ Examples:
   # Dry run to see what would happen
   python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --dry-run
 
+  # Bulk COPY load of a directory
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --bulk
+
+  # Stream large CSV files 50,000 rows at a time
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --bulk --chunksize 50000
+
+  # Backfill every year in parallel, one worker per year
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --workers 4
+
+  # Cache parsed workbooks so reruns and dry runs skip Excel parsing
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --cache-dir .ita_cache
+
+  # Reload files even if an identical copy was already loaded
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --force
+
+  # Bulk load with one audit entry per load instead of one per row
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --bulk --audit batch
+
+  # Reload the 2023 files by swapping in freshly loaded year partitions
+  python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata\\ITA Data CY 2023" --replace-years --force
+
+  # Repair the establishment summary rollup
+  python osha_ita_loader.py --rebuild-rollup
+
   # Process with debug logging
   python osha_ita_loader.py --directory "C:\\Users\\Neera\\Downloads\\Oshareporting\\oshadata" --log-level DEBUG
 
@@ -938,6 +2206,8 @@ Directory Structure Expected:
                        help='Process all files in this directory (alternative to input_path)')
     parser.add_argument('--recursive', '-r', action='store_true', default=True,
                        help='Process directories recursively (default: True)')
+    parser.add_argument('--workers', '-w', type=int,
+                       help='Load each filing year in its own worker process (bulk path)')
     
     # Data processing options
     parser.add_argument('--mode', '-m', 
@@ -948,6 +2218,24 @@ Directory Structure Expected:
                        help='Override data year (auto-detected from path if not specified)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Perform dry run without making database changes')
+    parser.add_argument('--force', action='store_true',
+                       help='Load files even if an identical file was already loaded successfully')
+    parser.add_argument('--bulk', action='store_true',
+                       help='Convert columns in bulk and write each sheet with COPY')
+    parser.add_argument('--chunksize', type=int,
+                       help='Read CSV files in chunks of this many rows to bound memory use')
+    parser.add_argument('--replace-years', action='store_true',
+                       help='Replace each loaded year by swapping in a freshly COPY-loaded '
+                            'partition (implies --bulk)')
+    parser.add_argument('--rebuild-rollup', action='store_true',
+                       help='Recompute the establishment summary rollup from all loaded data and exit')
+    parser.add_argument('--audit', choices=['row', 'batch'], default='row',
+                       help='Audit every changed row, or record one audit entry per load (default: row)')
+    parser.add_argument('--cache-dir',
+                       help='Cache parsed files here, keyed by file hash (default: no cache)')
+    parser.add_argument('--cache-max-mb', type=int, default=OSHAITADataLoader.DEFAULT_CACHE_MAX_MB,
+                       help=f'Evict least recently used cache entries above this size '
+                            f'(default: {OSHAITADataLoader.DEFAULT_CACHE_MAX_MB})')
     
     # Database configuration (uses DB_CONFIG by default)
     parser.add_argument('--host', default=DB_CONFIG['host'],
@@ -978,7 +2266,7 @@ Directory Structure Expected:
     args = parser.parse_args()
     
     # Validate arguments
-    if not args.input_path and not args.directory:
+    if not args.input_path and not args.directory and not args.rebuild_rollup:
         parser.error("Must specify either input_path or --directory")
     
     # Setup logging
@@ -1008,7 +2296,14 @@ Directory Structure Expected:
         loader = OSHAITADataLoader(
             db_config=db_config,
             load_mode=load_mode,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            bulk=args.bulk or args.replace_years,
+            chunksize=args.chunksize,
+            cache_dir=args.cache_dir,
+            cache_max_mb=args.cache_max_mb,
+            force=args.force,
+            audit_mode=args.audit,
+            replace_years=args.replace_years
         )
         
         # Connect to database
@@ -1016,14 +2311,18 @@ Directory Structure Expected:
         
         # Process data
         input_path = args.directory or args.input_path
-        if os.path.isdir(input_path):
-            loader.process_directory(input_path, args.recursive)
-        else:
+        if args.rebuild_rollup:
+            loader.rebuild_establishment_rollup()
+        elif os.path.isdir(input_path):
+            loader.process_directory(input_path, args.recursive, args.workers)
+        elif loader.select_files_to_load([Path(input_path)]):
             loader.process_file(input_path, args.year)
         
         # Commit final transaction
         if not args.dry_run:
             loader.conn.commit()
+        if args.replace_years:
+            loader.drop_retired_partitions()
         
         # Generate report
         report = loader.generate_load_report()
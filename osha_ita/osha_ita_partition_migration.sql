@@ -0,0 +1,301 @@
+-- =============================================================================
+-- OSHA ITA - Migrate fact tables to year partitions
+-- Converts summary_300a_data and case_detail_data in a database created from an
+-- earlier osha_ita_schema.sql into tables LIST-partitioned on year_filing_for,
+-- one partition per filing year, keeping every row, key and audit trigger.
+--
+-- Run once:
+--   psql -d compliease_sbx -v ON_ERROR_STOP=1 -f osha_ita_partition_migration.sql
+-- =============================================================================
+
+BEGIN;
+
+SET LOCAL search_path TO osha_ita, public;
+
+-- =============================================================================
+-- PARTITION HELPERS (same definitions as osha_ita_schema.sql)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION year_partition_name(p_table TEXT, p_year INTEGER)
+RETURNS TEXT AS $$
+    SELECT p_table || '_y' || p_year;
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION ensure_year_partitions(p_year INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    fact_table TEXT;
+BEGIN
+    FOREACH fact_table IN ARRAY ARRAY['summary_300a_data', 'case_detail_data'] LOOP
+        IF to_regclass(year_partition_name(fact_table, p_year)) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES IN (%s)',
+                           year_partition_name(fact_table, p_year), fact_table, p_year);
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION swap_year_partition(p_table TEXT, p_year INTEGER, p_staging TEXT)
+RETURNS BIGINT AS $$
+DECLARE
+    partition_name TEXT := year_partition_name(p_table, p_year);
+    replaced_count BIGINT := 0;
+    attached_count BIGINT;
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        EXECUTE format('SELECT count(*) FROM %I', partition_name) INTO replaced_count;
+        EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', p_table, partition_name);
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', partition_name,
+                       partition_name || '_retired_' || txid_current());
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', p_staging, partition_name);
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES IN (%s)',
+                   p_table, partition_name, p_year);
+    EXECUTE format('SELECT count(*) FROM %I', partition_name) INTO attached_count;
+
+    INSERT INTO audit_log (table_name, record_id, operation, new_values, changed_fields)
+    VALUES (p_table, 'partition:' || partition_name, 'ATTACH',
+            jsonb_build_object('year', p_year, 'row_count', attached_count,
+                               'replaced_row_count', replaced_count), '{}');
+
+    RETURN attached_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION drop_retired_partitions()
+RETURNS INTEGER AS $$
+DECLARE
+    retired_table TEXT;
+    dropped INTEGER := 0;
+BEGIN
+    FOR retired_table IN
+        SELECT tablename FROM pg_tables
+        WHERE schemaname = current_schema()
+          AND tablename ~ '^(summary_300a_data|case_detail_data)_y[0-9]+_retired_[0-9]+$'
+    LOOP
+        EXECUTE format('DROP TABLE %I', retired_table);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =============================================================================
+-- COPY DATA INTO PARTITIONED TABLES
+-- =============================================================================
+
+-- The views reference the old tables and are recreated at the end
+DROP VIEW IF EXISTS v_establishment_summary;
+DROP VIEW IF EXISTS v_current_case_details;
+DROP VIEW IF EXISTS v_current_300a_summary;
+
+CREATE TABLE summary_300a_data_partitioned (LIKE summary_300a_data INCLUDING DEFAULTS)
+    PARTITION BY LIST (year_filing_for);
+CREATE TABLE case_detail_data_partitioned (LIKE case_detail_data INCLUDING DEFAULTS)
+    PARTITION BY LIST (year_filing_for);
+
+DO $$
+DECLARE
+    filing_year INTEGER;
+BEGIN
+    FOR filing_year IN
+        SELECT year_filing_for FROM summary_300a_data
+        UNION
+        SELECT year_filing_for FROM case_detail_data
+    LOOP
+        EXECUTE format('CREATE TABLE %I PARTITION OF summary_300a_data_partitioned FOR VALUES IN (%s)',
+                       year_partition_name('summary_300a_data', filing_year), filing_year);
+        EXECUTE format('CREATE TABLE %I PARTITION OF case_detail_data_partitioned FOR VALUES IN (%s)',
+                       year_partition_name('case_detail_data', filing_year), filing_year);
+    END LOOP;
+END $$;
+
+-- Load before any keys or indexes exist; they are built once per partition below
+INSERT INTO summary_300a_data_partitioned SELECT * FROM summary_300a_data;
+INSERT INTO case_detail_data_partitioned SELECT * FROM case_detail_data;
+
+-- Old tables take their indexes, constraints and triggers with them
+DROP TABLE summary_300a_data;
+DROP TABLE case_detail_data;
+ALTER TABLE summary_300a_data_partitioned RENAME TO summary_300a_data;
+ALTER TABLE case_detail_data_partitioned RENAME TO case_detail_data;
+
+-- =============================================================================
+-- KEYS AND INDEXES
+-- =============================================================================
+
+ALTER TABLE summary_300a_data
+    ADD PRIMARY KEY (summary_uuid, year_filing_for),
+    ADD FOREIGN KEY (establishment_uuid) REFERENCES establishments(establishment_uuid),
+    ADD FOREIGN KEY (load_id) REFERENCES data_loads(load_id),
+    ADD CONSTRAINT unique_300a_per_establishment_year UNIQUE (establishment_uuid, year_filing_for, data_version);
+ALTER TABLE summary_300a_data
+    ADD FOREIGN KEY (superseded_by, year_filing_for) REFERENCES summary_300a_data(summary_uuid, year_filing_for);
+
+ALTER TABLE case_detail_data
+    ADD PRIMARY KEY (case_uuid, year_filing_for),
+    ADD FOREIGN KEY (establishment_uuid) REFERENCES establishments(establishment_uuid),
+    ADD FOREIGN KEY (load_id) REFERENCES data_loads(load_id),
+    ADD FOREIGN KEY (soc_code) REFERENCES ref_soc_codes(soc_code),
+    ADD CONSTRAINT unique_case_per_establishment_year UNIQUE (establishment_uuid, case_number, year_filing_for, data_version);
+ALTER TABLE case_detail_data
+    ADD FOREIGN KEY (superseded_by, year_filing_for) REFERENCES case_detail_data(case_uuid, year_filing_for);
+
+-- Same as osha_ita_schema.sql; partition pruning replaces the year indexes
+CREATE INDEX idx_300a_establishment ON summary_300a_data(establishment_uuid);
+CREATE INDEX idx_300a_load ON summary_300a_data(load_id);
+CREATE INDEX idx_300a_current ON summary_300a_data(is_current) WHERE is_current = true;
+CREATE INDEX idx_300a_ita_id ON summary_300a_data(ita_id);
+
+CREATE INDEX idx_case_establishment ON case_detail_data(establishment_uuid);
+CREATE INDEX idx_case_load ON case_detail_data(load_id);
+CREATE INDEX idx_case_current ON case_detail_data(is_current) WHERE is_current = true;
+CREATE INDEX idx_case_incident_date ON case_detail_data(date_of_incident);
+CREATE INDEX idx_case_outcome ON case_detail_data(incident_outcome);
+CREATE INDEX idx_case_type ON case_detail_data(type_of_incident);
+CREATE INDEX idx_case_soc ON case_detail_data(soc_code);
+CREATE INDEX idx_case_narratives_gin ON case_detail_data USING gin(incident_narratives);
+
+-- =============================================================================
+-- AUDIT TRIGGERS
+-- =============================================================================
+
+-- Statement-level triggers when the database has audit_statement_function,
+-- otherwise the original row-level audit_trigger_function
+DO $$
+DECLARE
+    fact_table TEXT;
+    key_column TEXT;
+    trigger_prefix TEXT;
+BEGIN
+    FOR fact_table, key_column, trigger_prefix IN
+        VALUES ('summary_300a_data', 'summary_uuid', 'summary_300a'),
+               ('case_detail_data', 'case_uuid', 'case_detail')
+    LOOP
+        IF to_regproc('audit_statement_function') IS NOT NULL THEN
+            EXECUTE format('CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS new_rows '
+                           'FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function(%L)',
+                           trigger_prefix || '_audit_insert', fact_table, key_column);
+            EXECUTE format('CREATE TRIGGER %I AFTER UPDATE ON %I REFERENCING OLD TABLE AS old_rows '
+                           'NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function(%L)',
+                           trigger_prefix || '_audit_update', fact_table, key_column);
+            EXECUTE format('CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS old_rows '
+                           'FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function(%L)',
+                           trigger_prefix || '_audit_delete', fact_table, key_column);
+        ELSE
+            EXECUTE format('CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE ON %I '
+                           'FOR EACH ROW EXECUTE FUNCTION audit_trigger_function()',
+                           trigger_prefix || '_audit_trigger', fact_table);
+        END IF;
+    END LOOP;
+END $$;
+
+-- =============================================================================
+-- VIEWS AND COMMENTS
+-- =============================================================================
+
+CREATE VIEW v_current_300a_summary AS
+SELECT
+    s.*,
+    e.establishment_name,
+    e.company_name,
+    e.current_address,
+    e.primary_naics_code,
+    e.industry_description,
+    dl.load_timestamp,
+    dl.source_file_name
+FROM summary_300a_data s
+JOIN establishments e ON s.establishment_uuid = e.establishment_uuid
+JOIN data_loads dl ON s.load_id = dl.load_id
+WHERE s.is_current = true;
+
+CREATE VIEW v_current_case_details AS
+SELECT
+    c.*,
+    e.establishment_name,
+    e.company_name,
+    e.current_address,
+    e.primary_naics_code,
+    e.industry_description,
+    dl.load_timestamp,
+    dl.source_file_name
+FROM case_detail_data c
+JOIN establishments e ON c.establishment_uuid = e.establishment_uuid
+JOIN data_loads dl ON c.load_id = dl.load_id
+WHERE c.is_current = true;
+
+-- Rollup-backed when osha_ita_rollup_migration.sql already ran, so rerunning
+-- this migration in either order keeps dashboards off the fact tables
+DO $$
+BEGIN
+    IF to_regclass('establishment_year_rollup') IS NOT NULL THEN
+        CREATE VIEW v_establishment_summary AS
+        SELECT
+            e.*,
+            s_latest.year_filing_for as latest_300a_year,
+            s_latest.annual_average_employees,
+            s_latest.total_hours_worked,
+            s_latest.total_injuries,
+            c_counts.total_cases,
+            c_counts.latest_case_year
+        FROM establishments e
+        LEFT JOIN LATERAL (
+            SELECT
+                year_filing_for,
+                annual_average_employees,
+                total_hours_worked,
+                total_injuries
+            FROM establishment_year_rollup r
+            WHERE r.establishment_uuid = e.establishment_uuid
+            AND r.has_300a
+            ORDER BY year_filing_for DESC
+            LIMIT 1
+        ) s_latest ON true
+        LEFT JOIN LATERAL (
+            SELECT
+                SUM(case_count) FILTER (WHERE case_count > 0) as total_cases,
+                MAX(year_filing_for) FILTER (WHERE case_count > 0) as latest_case_year
+            FROM establishment_year_rollup r
+            WHERE r.establishment_uuid = e.establishment_uuid
+        ) c_counts ON true;
+    ELSE
+        CREATE VIEW v_establishment_summary AS
+        SELECT
+            e.*,
+            s_latest.year_filing_for as latest_300a_year,
+            s_latest.annual_average_employees,
+            s_latest.total_hours_worked,
+            s_latest.total_injuries,
+            c_counts.total_cases,
+            c_counts.latest_case_year
+        FROM establishments e
+        LEFT JOIN (
+            SELECT DISTINCT ON (establishment_uuid)
+                establishment_uuid,
+                year_filing_for,
+                annual_average_employees,
+                total_hours_worked,
+                total_injuries
+            FROM summary_300a_data
+            WHERE is_current = true
+            ORDER BY establishment_uuid, year_filing_for DESC
+        ) s_latest ON e.establishment_uuid = s_latest.establishment_uuid
+        LEFT JOIN (
+            SELECT
+                establishment_uuid,
+                COUNT(*) as total_cases,
+                MAX(year_filing_for) as latest_case_year
+            FROM case_detail_data
+            WHERE is_current = true
+            GROUP BY establishment_uuid
+        ) c_counts ON e.establishment_uuid = c_counts.establishment_uuid;
+    END IF;
+END $$;
+
+COMMENT ON TABLE summary_300a_data IS 'Annual summary data from OSHA Form 300A with full versioning';
+COMMENT ON TABLE case_detail_data IS 'Individual incident/case details from OSHA Forms 300/301 with versioning';
+COMMENT ON COLUMN summary_300a_data.establishment_snapshot IS 'JSON snapshot of establishment data at time of filing';
+COMMENT ON COLUMN case_detail_data.incident_narratives IS 'JSON structure containing all narrative fields for easy analysis';
+
+COMMIT;
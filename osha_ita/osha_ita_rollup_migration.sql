@@ -0,0 +1,158 @@
+-- =============================================================================
+-- OSHA ITA - Add the maintained establishment summary rollup
+-- Creates establishment_year_rollup and its refresh functions in a database
+-- created from an earlier osha_ita_schema.sql, fills it, and points
+-- v_establishment_summary at it.
+--
+-- Run once:
+--   psql -d compliease_sbx -v ON_ERROR_STOP=1 -f osha_ita_rollup_migration.sql
+-- =============================================================================
+
+BEGIN;
+
+SET LOCAL search_path TO osha_ita, public;
+
+-- One row per establishment and filing year with current data: the current
+-- 300A figures and the number of current cases. The loader refreshes the rows
+-- of the loads it writes with refresh_establishment_rollup();
+-- rebuild_establishment_rollup() recomputes everything.
+CREATE TABLE establishment_year_rollup (
+    establishment_uuid UUID NOT NULL REFERENCES establishments(establishment_uuid),
+    year_filing_for INTEGER NOT NULL,
+    
+    -- Current 300A summary for the year
+    has_300a BOOLEAN NOT NULL DEFAULT false,
+    annual_average_employees INTEGER,
+    total_hours_worked BIGINT,
+    total_injuries INTEGER,
+    
+    -- Current case detail records for the year
+    case_count INTEGER NOT NULL DEFAULT 0,
+    
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (establishment_uuid, year_filing_for)
+);
+
+-- Recompute the establishment_year_rollup rows touched by the given loads, plus
+-- every row of the given years (years whose partition was replaced). Returns
+-- the number of rollup rows written.
+CREATE OR REPLACE FUNCTION refresh_establishment_rollup(p_load_ids UUID[], p_years INTEGER[] DEFAULT '{}')
+RETURNS INTEGER AS $$
+DECLARE
+    touched_years INTEGER[];
+    refreshed INTEGER;
+BEGIN
+    CREATE TEMP TABLE IF NOT EXISTS rollup_touched (
+        establishment_uuid UUID,
+        year_filing_for INTEGER
+    ) ON COMMIT DELETE ROWS;
+    TRUNCATE rollup_touched;
+    
+    INSERT INTO rollup_touched
+    SELECT establishment_uuid, year_filing_for FROM summary_300a_data WHERE load_id = ANY(p_load_ids)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM case_detail_data WHERE load_id = ANY(p_load_ids)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM summary_300a_data WHERE year_filing_for = ANY(p_years)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM case_detail_data WHERE year_filing_for = ANY(p_years)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM establishment_year_rollup WHERE year_filing_for = ANY(p_years);
+    
+    SELECT array_agg(DISTINCT year_filing_for) INTO touched_years FROM rollup_touched;
+    IF touched_years IS NULL THEN
+        RETURN 0;
+    END IF;
+    
+    DELETE FROM establishment_year_rollup r
+    USING rollup_touched t
+    WHERE r.establishment_uuid = t.establishment_uuid
+    AND r.year_filing_for = t.year_filing_for;
+    
+    -- Aggregate only the touched years' partitions, filtered to touched pairs
+    INSERT INTO establishment_year_rollup (
+        establishment_uuid, year_filing_for, has_300a, annual_average_employees,
+        total_hours_worked, total_injuries, case_count
+    )
+    SELECT 
+        establishment_uuid,
+        year_filing_for,
+        s.establishment_uuid IS NOT NULL,
+        s.annual_average_employees,
+        s.total_hours_worked,
+        s.total_injuries,
+        COALESCE(c.case_count, 0)
+    FROM (
+        SELECT DISTINCT ON (establishment_uuid, year_filing_for)
+            establishment_uuid, year_filing_for, annual_average_employees,
+            total_hours_worked, total_injuries
+        FROM summary_300a_data
+        WHERE is_current = true
+        AND year_filing_for = ANY(touched_years)
+        AND (establishment_uuid, year_filing_for) IN (SELECT establishment_uuid, year_filing_for FROM rollup_touched)
+        ORDER BY establishment_uuid, year_filing_for, data_version DESC
+    ) s
+    FULL JOIN (
+        SELECT establishment_uuid, year_filing_for, COUNT(*) as case_count
+        FROM case_detail_data
+        WHERE is_current = true
+        AND year_filing_for = ANY(touched_years)
+        AND (establishment_uuid, year_filing_for) IN (SELECT establishment_uuid, year_filing_for FROM rollup_touched)
+        GROUP BY establishment_uuid, year_filing_for
+    ) c USING (establishment_uuid, year_filing_for);
+    
+    GET DIAGNOSTICS refreshed = ROW_COUNT;
+    RETURN refreshed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute establishment_year_rollup from scratch (repair)
+CREATE OR REPLACE FUNCTION rebuild_establishment_rollup()
+RETURNS INTEGER AS $$
+BEGIN
+    TRUNCATE establishment_year_rollup;
+    RETURN refresh_establishment_rollup('{}', ARRAY(
+        SELECT year_filing_for FROM summary_300a_data
+        UNION
+        SELECT year_filing_for FROM case_detail_data
+    ));
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT rebuild_establishment_rollup();
+
+-- Establishment summary with latest data, read from the maintained rollup
+CREATE OR REPLACE VIEW v_establishment_summary AS
+SELECT 
+    e.*,
+    s_latest.year_filing_for as latest_300a_year,
+    s_latest.annual_average_employees,
+    s_latest.total_hours_worked,
+    s_latest.total_injuries,
+    c_counts.total_cases,
+    c_counts.latest_case_year
+FROM establishments e
+LEFT JOIN LATERAL (
+    SELECT 
+        year_filing_for,
+        annual_average_employees,
+        total_hours_worked,
+        total_injuries
+    FROM establishment_year_rollup r
+    WHERE r.establishment_uuid = e.establishment_uuid
+    AND r.has_300a
+    ORDER BY year_filing_for DESC
+    LIMIT 1
+) s_latest ON true
+LEFT JOIN LATERAL (
+    SELECT 
+        SUM(case_count) FILTER (WHERE case_count > 0) as total_cases,
+        MAX(year_filing_for) FILTER (WHERE case_count > 0) as latest_case_year
+    FROM establishment_year_rollup r
+    WHERE r.establishment_uuid = e.establishment_uuid
+) c_counts ON true;
+
+COMMENT ON TABLE establishment_year_rollup IS 'Current 300A figures and case counts per establishment and year, maintained by the loader';
+
+COMMIT;
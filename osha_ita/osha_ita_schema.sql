@@ -26,7 +26,7 @@ CREATE TABLE data_loads (
     records_loaded INTEGER DEFAULT 0,
     records_updated INTEGER DEFAULT 0,
     records_failed INTEGER DEFAULT 0,
-    load_status VARCHAR(20) DEFAULT 'in_progress', -- 'in_progress', 'completed', 'failed'
+    load_status VARCHAR(20) DEFAULT 'in_progress', -- 'in_progress', 'completed', 'partial', 'failed'
     load_notes TEXT,
     loaded_by VARCHAR(100) DEFAULT current_user,
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
@@ -125,8 +125,10 @@ CREATE TABLE establishments (
 -- 300A SUMMARY DATA (Annual Establishment Summary)
 -- =============================================================================
 
+-- Partitioned by filing year: one partition per year_filing_for, created by
+-- ensure_year_partitions() and replaced wholesale by swap_year_partition()
 CREATE TABLE summary_300a_data (
-    summary_uuid UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    summary_uuid UUID NOT NULL DEFAULT uuid_generate_v4(),
     
     -- Reference to establishment and load
     establishment_uuid UUID NOT NULL REFERENCES establishments(establishment_uuid),
@@ -178,7 +180,7 @@ CREATE TABLE summary_300a_data (
     -- Versioning and Audit
     data_version INTEGER DEFAULT 1,
     is_current BOOLEAN DEFAULT true,
-    superseded_by UUID REFERENCES summary_300a_data(summary_uuid),
+    superseded_by UUID, -- a later version within the same filing year
     effective_from TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     effective_until TIMESTAMPTZ,
     
@@ -186,16 +188,21 @@ CREATE TABLE summary_300a_data (
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     
+    -- Keys of a partitioned table must include the partition key
+    PRIMARY KEY (summary_uuid, year_filing_for),
+    FOREIGN KEY (superseded_by, year_filing_for) REFERENCES summary_300a_data(summary_uuid, year_filing_for),
+    
     -- Ensure uniqueness per establishment per year per version
     CONSTRAINT unique_300a_per_establishment_year UNIQUE (establishment_uuid, year_filing_for, data_version)
-);
+) PARTITION BY LIST (year_filing_for);
 
 -- =============================================================================
 -- CASE DETAIL DATA (Individual Incident Records)
 -- =============================================================================
 
+-- Partitioned by filing year like summary_300a_data
 CREATE TABLE case_detail_data (
-    case_uuid UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    case_uuid UUID NOT NULL DEFAULT uuid_generate_v4(),
     
     -- Reference to establishment and load
     establishment_uuid UUID NOT NULL REFERENCES establishments(establishment_uuid),
@@ -254,7 +261,7 @@ CREATE TABLE case_detail_data (
     -- Versioning and Audit
     data_version INTEGER DEFAULT 1,
     is_current BOOLEAN DEFAULT true,
-    superseded_by UUID REFERENCES case_detail_data(case_uuid),
+    superseded_by UUID, -- a later version within the same filing year
     effective_from TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     effective_until TIMESTAMPTZ,
     
@@ -262,8 +269,38 @@ CREATE TABLE case_detail_data (
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     
+    -- Keys of a partitioned table must include the partition key
+    PRIMARY KEY (case_uuid, year_filing_for),
+    FOREIGN KEY (superseded_by, year_filing_for) REFERENCES case_detail_data(case_uuid, year_filing_for),
+    
     -- Business logic constraints
     CONSTRAINT unique_case_per_establishment_year UNIQUE (establishment_uuid, case_number, year_filing_for, data_version)
+) PARTITION BY LIST (year_filing_for);
+
+-- =============================================================================
+-- ESTABLISHMENT YEAR ROLLUP (maintained aggregate behind v_establishment_summary)
+-- =============================================================================
+
+-- One row per establishment and filing year with current data: the current
+-- 300A figures and the number of current cases. The loader refreshes the rows
+-- of the loads it writes with refresh_establishment_rollup();
+-- rebuild_establishment_rollup() recomputes everything.
+CREATE TABLE establishment_year_rollup (
+    establishment_uuid UUID NOT NULL REFERENCES establishments(establishment_uuid),
+    year_filing_for INTEGER NOT NULL,
+    
+    -- Current 300A summary for the year
+    has_300a BOOLEAN NOT NULL DEFAULT false,
+    annual_average_employees INTEGER,
+    total_hours_worked BIGINT,
+    total_injuries INTEGER,
+    
+    -- Current case detail records for the year
+    case_count INTEGER NOT NULL DEFAULT 0,
+    
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (establishment_uuid, year_filing_for)
 );
 
 -- =============================================================================
@@ -279,14 +316,12 @@ CREATE INDEX idx_establishments_name_gin ON establishments USING gin(establishme
 
 -- 300A Summary Data
 CREATE INDEX idx_300a_establishment ON summary_300a_data(establishment_uuid);
-CREATE INDEX idx_300a_year ON summary_300a_data(year_filing_for);
 CREATE INDEX idx_300a_load ON summary_300a_data(load_id);
 CREATE INDEX idx_300a_current ON summary_300a_data(is_current) WHERE is_current = true;
 CREATE INDEX idx_300a_ita_id ON summary_300a_data(ita_id);
 
 -- Case Detail Data
 CREATE INDEX idx_case_establishment ON case_detail_data(establishment_uuid);
-CREATE INDEX idx_case_year ON case_detail_data(year_filing_for);
 CREATE INDEX idx_case_load ON case_detail_data(load_id);
 CREATE INDEX idx_case_current ON case_detail_data(is_current) WHERE is_current = true;
 CREATE INDEX idx_case_incident_date ON case_detail_data(date_of_incident);
@@ -301,6 +336,7 @@ CREATE INDEX idx_audit_load ON audit_log(load_id);
 CREATE INDEX idx_audit_timestamp ON audit_log(changed_at);
 CREATE INDEX idx_loads_year_type ON data_loads(data_year, load_type);
 CREATE INDEX idx_loads_timestamp ON data_loads(load_timestamp);
+CREATE INDEX idx_loads_completed_hash ON data_loads(source_file_hash) WHERE load_status = 'completed';
 
 -- =============================================================================
 -- VIEWS FOR EASY DATA ACCESS
@@ -338,7 +374,7 @@ JOIN establishments e ON c.establishment_uuid = e.establishment_uuid
 JOIN data_loads dl ON c.load_id = dl.load_id
 WHERE c.is_current = true;
 
--- Establishment summary with latest data
+-- Establishment summary with latest data, read from the maintained rollup
 CREATE VIEW v_establishment_summary AS
 SELECT 
     e.*,
@@ -349,105 +385,161 @@ SELECT
     c_counts.total_cases,
     c_counts.latest_case_year
 FROM establishments e
-LEFT JOIN (
-    SELECT DISTINCT ON (establishment_uuid) 
-        establishment_uuid,
+LEFT JOIN LATERAL (
+    SELECT 
         year_filing_for,
         annual_average_employees,
         total_hours_worked,
         total_injuries
-    FROM summary_300a_data 
-    WHERE is_current = true 
-    ORDER BY establishment_uuid, year_filing_for DESC
-) s_latest ON e.establishment_uuid = s_latest.establishment_uuid
-LEFT JOIN (
+    FROM establishment_year_rollup r
+    WHERE r.establishment_uuid = e.establishment_uuid
+    AND r.has_300a
+    ORDER BY year_filing_for DESC
+    LIMIT 1
+) s_latest ON true
+LEFT JOIN LATERAL (
     SELECT 
-        establishment_uuid,
-        COUNT(*) as total_cases,
-        MAX(year_filing_for) as latest_case_year
-    FROM case_detail_data 
-    WHERE is_current = true 
-    GROUP BY establishment_uuid
-) c_counts ON e.establishment_uuid = c_counts.establishment_uuid;
+        SUM(case_count) FILTER (WHERE case_count > 0) as total_cases,
+        MAX(year_filing_for) FILTER (WHERE case_count > 0) as latest_case_year
+    FROM establishment_year_rollup r
+    WHERE r.establishment_uuid = e.establishment_uuid
+) c_counts ON true;
 
 -- =============================================================================
 -- TRIGGERS FOR AUDIT TRAIL
 -- =============================================================================
 
--- Generic audit trigger function
-CREATE OR REPLACE FUNCTION audit_trigger_function()
+-- Generic statement-level audit trigger function. It reads the statement's
+-- transition tables, so an INSERT, UPDATE, DELETE or COPY of any size writes
+-- its audit rows with one set-based INSERT. TG_ARGV[0] is the table's primary
+-- key column, used to pair the old and new version of each updated row.
+--
+-- Batch mode: when the session sets osha_ita.audit_load_id (the loader does
+-- this for --audit batch), each statement only adds its row count to a single
+-- audit_log entry per load, table and operation instead of one entry per row.
+CREATE OR REPLACE FUNCTION audit_statement_function()
 RETURNS TRIGGER AS $$
 DECLARE
-    old_data JSONB;
-    new_data JSONB;
-    changed_fields TEXT[] := '{}';
-    field_name TEXT;
+    batch_load_id UUID := NULLIF(current_setting('osha_ita.audit_load_id', true), '')::UUID;
+    row_count BIGINT;
 BEGIN
-    -- Convert OLD and NEW to JSONB
-    IF TG_OP = 'DELETE' THEN
-        old_data := to_jsonb(OLD);
-        new_data := NULL;
-    ELSIF TG_OP = 'INSERT' THEN
-        old_data := NULL;
-        new_data := to_jsonb(NEW);
-    ELSE -- UPDATE
-        old_data := to_jsonb(OLD);
-        new_data := to_jsonb(NEW);
+    IF batch_load_id IS NOT NULL THEN
+        IF TG_OP = 'DELETE' THEN
+            SELECT count(*) INTO row_count FROM old_rows;
+        ELSE
+            SELECT count(*) INTO row_count FROM new_rows;
+        END IF;
+        
+        -- INSERT ... ON CONFLICT fires both statement triggers, often for no rows
+        IF row_count = 0 THEN
+            RETURN NULL;
+        END IF;
         
-        -- Find changed fields
-        FOR field_name IN SELECT jsonb_object_keys(new_data) LOOP
-            IF old_data->field_name IS DISTINCT FROM new_data->field_name THEN
-                changed_fields := array_append(changed_fields, field_name);
-            END IF;
-        END LOOP;
+        UPDATE audit_log
+        SET new_values = jsonb_set(new_values, '{row_count}',
+                                   to_jsonb((new_values->>'row_count')::BIGINT + row_count)),
+            changed_at = CURRENT_TIMESTAMP
+        WHERE table_name = TG_TABLE_NAME
+        AND record_id = 'load:' || batch_load_id
+        AND operation = TG_OP;
+        
+        -- The setting is session-wide and survives a rollback, so it can still name
+        -- a load whose data_loads row was rolled back; load_id stays NULL then
+        -- rather than failing the foreign key
+        IF NOT FOUND THEN
+            INSERT INTO audit_log (
+                table_name, record_id, operation, new_values, changed_fields, load_id
+            )
+            SELECT TG_TABLE_NAME, 'load:' || batch_load_id, TG_OP,
+                   jsonb_build_object('batch', true, 'row_count', row_count), '{}',
+                   (SELECT load_id FROM data_loads WHERE load_id = batch_load_id);
+        END IF;
+        RETURN NULL;
     END IF;
     
-    -- Insert audit record
-    INSERT INTO audit_log (
-        table_name,
-        record_id,
-        operation,
-        old_values,
-        new_values,
-        changed_fields
-    ) VALUES (
-        TG_TABLE_NAME,
-        COALESCE(
-            (new_data->>'establishment_uuid'),
-            (new_data->>'summary_uuid'),
-            (new_data->>'case_uuid'),
-            (old_data->>'establishment_uuid'),
-            (old_data->>'summary_uuid'),
-            (old_data->>'case_uuid'),
-            'unknown'
-        ),
-        TG_OP,
-        old_data,
-        new_data,
-        changed_fields
-    );
-    
-    -- Return appropriate record
-    IF TG_OP = 'DELETE' THEN
-        RETURN OLD;
-    ELSE
-        RETURN NEW;
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO audit_log (
+            table_name, record_id, operation, old_values, new_values, changed_fields, load_id
+        )
+        SELECT TG_TABLE_NAME,
+               COALESCE(new_data->>'establishment_uuid', new_data->>'summary_uuid',
+                        new_data->>'case_uuid', 'unknown'),
+               TG_OP, NULL, new_data, '{}', (new_data->>'load_id')::UUID
+        FROM (SELECT to_jsonb(n) AS new_data FROM new_rows n) changed;
+        
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO audit_log (
+            table_name, record_id, operation, old_values, new_values, changed_fields, load_id
+        )
+        SELECT TG_TABLE_NAME,
+               COALESCE(old_data->>'establishment_uuid', old_data->>'summary_uuid',
+                        old_data->>'case_uuid', 'unknown'),
+               TG_OP, old_data, NULL, '{}', (old_data->>'load_id')::UUID
+        FROM (SELECT to_jsonb(o) AS old_data FROM old_rows o) changed;
+        
+    ELSE -- UPDATE: one join of old and new rows, changed fields diffed in set form
+        EXECUTE format($sql$
+            INSERT INTO audit_log (
+                table_name, record_id, operation, old_values, new_values, changed_fields, load_id
+            )
+            SELECT $1,
+                   COALESCE(new_data->>'establishment_uuid', new_data->>'summary_uuid',
+                            new_data->>'case_uuid', 'unknown'),
+                   'UPDATE', old_data, new_data,
+                   ARRAY(
+                       SELECT field.key
+                       FROM jsonb_each(new_data) AS field
+                       WHERE field.value IS DISTINCT FROM old_data->field.key
+                   ),
+                   (new_data->>'load_id')::UUID
+            FROM (
+                SELECT to_jsonb(o) AS old_data, to_jsonb(n) AS new_data
+                FROM new_rows n
+                JOIN old_rows o ON o.%1$I = n.%1$I
+            ) changed
+        $sql$, TG_ARGV[0]) USING TG_TABLE_NAME;
     END IF;
+    
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Apply audit triggers to main tables
-CREATE TRIGGER establishments_audit_trigger
-    AFTER INSERT OR UPDATE OR DELETE ON establishments
-    FOR EACH ROW EXECUTE FUNCTION audit_trigger_function();
-
-CREATE TRIGGER summary_300a_audit_trigger
-    AFTER INSERT OR UPDATE OR DELETE ON summary_300a_data
-    FOR EACH ROW EXECUTE FUNCTION audit_trigger_function();
-
-CREATE TRIGGER case_detail_audit_trigger
-    AFTER INSERT OR UPDATE OR DELETE ON case_detail_data
-    FOR EACH ROW EXECUTE FUNCTION audit_trigger_function();
+-- Apply audit triggers to main tables. Transition tables allow one event per
+-- trigger, so each table gets an INSERT, UPDATE and DELETE trigger.
+DROP TRIGGER IF EXISTS establishments_audit_trigger ON establishments;
+DROP TRIGGER IF EXISTS summary_300a_audit_trigger ON summary_300a_data;
+DROP TRIGGER IF EXISTS case_detail_audit_trigger ON case_detail_data;
+DROP FUNCTION IF EXISTS audit_trigger_function();
+
+CREATE TRIGGER establishments_audit_insert
+    AFTER INSERT ON establishments REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('establishment_uuid');
+CREATE TRIGGER establishments_audit_update
+    AFTER UPDATE ON establishments REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('establishment_uuid');
+CREATE TRIGGER establishments_audit_delete
+    AFTER DELETE ON establishments REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('establishment_uuid');
+
+CREATE TRIGGER summary_300a_audit_insert
+    AFTER INSERT ON summary_300a_data REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('summary_uuid');
+CREATE TRIGGER summary_300a_audit_update
+    AFTER UPDATE ON summary_300a_data REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('summary_uuid');
+CREATE TRIGGER summary_300a_audit_delete
+    AFTER DELETE ON summary_300a_data REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('summary_uuid');
+
+CREATE TRIGGER case_detail_audit_insert
+    AFTER INSERT ON case_detail_data REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('case_uuid');
+CREATE TRIGGER case_detail_audit_update
+    AFTER UPDATE ON case_detail_data REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('case_uuid');
+CREATE TRIGGER case_detail_audit_delete
+    AFTER DELETE ON case_detail_data REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION audit_statement_function('case_uuid');
 
 -- =============================================================================
 -- HELPER FUNCTIONS
@@ -483,6 +575,168 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Name of the partition holding one filing year of a fact table
+CREATE OR REPLACE FUNCTION year_partition_name(p_table TEXT, p_year INTEGER)
+RETURNS TEXT AS $$
+    SELECT p_table || '_y' || p_year;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Create the summary_300a_data and case_detail_data partitions for a year
+CREATE OR REPLACE FUNCTION ensure_year_partitions(p_year INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    fact_table TEXT;
+BEGIN
+    FOREACH fact_table IN ARRAY ARRAY['summary_300a_data', 'case_detail_data'] LOOP
+        IF to_regclass(year_partition_name(fact_table, p_year)) IS NULL THEN
+            EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES IN (%s)',
+                           year_partition_name(fact_table, p_year), fact_table, p_year);
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Replace a year's partition with a freshly loaded staging table. The staging
+-- table must match the parent's columns and carry CHECK (year_filing_for = p_year)
+-- so the attach skips its validation scan; indexes and foreign keys are built
+-- on attach. Rows loaded into the staging table bypassed the audit triggers,
+-- so the swap is recorded as one audit entry. The replaced partition is only
+-- renamed: dropping it locks establishments and data_loads against every other
+-- load, so drop_retired_partitions() removes it once no load is running.
+-- Returns the rows attached.
+CREATE OR REPLACE FUNCTION swap_year_partition(p_table TEXT, p_year INTEGER, p_staging TEXT)
+RETURNS BIGINT AS $$
+DECLARE
+    partition_name TEXT := year_partition_name(p_table, p_year);
+    replaced_count BIGINT := 0;
+    attached_count BIGINT;
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        EXECUTE format('SELECT count(*) FROM %I', partition_name) INTO replaced_count;
+        EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', p_table, partition_name);
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', partition_name,
+                       partition_name || '_retired_' || txid_current());
+    END IF;
+    
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', p_staging, partition_name);
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES IN (%s)',
+                   p_table, partition_name, p_year);
+    EXECUTE format('SELECT count(*) FROM %I', partition_name) INTO attached_count;
+    
+    INSERT INTO audit_log (table_name, record_id, operation, new_values, changed_fields)
+    VALUES (p_table, 'partition:' || partition_name, 'ATTACH',
+            jsonb_build_object('year', p_year, 'row_count', attached_count,
+                               'replaced_row_count', replaced_count), '{}');
+    
+    RETURN attached_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Drop the partitions swap_year_partition replaced. Returns the tables dropped.
+CREATE OR REPLACE FUNCTION drop_retired_partitions()
+RETURNS INTEGER AS $$
+DECLARE
+    retired_table TEXT;
+    dropped INTEGER := 0;
+BEGIN
+    FOR retired_table IN
+        SELECT tablename FROM pg_tables
+        WHERE schemaname = current_schema()
+          AND tablename ~ '^(summary_300a_data|case_detail_data)_y[0-9]+_retired_[0-9]+$'
+    LOOP
+        EXECUTE format('DROP TABLE %I', retired_table);
+        dropped := dropped + 1;
+    END LOOP;
+    RETURN dropped;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute the establishment_year_rollup rows touched by the given loads, plus
+-- every row of the given years (years whose partition was replaced). Returns
+-- the number of rollup rows written.
+CREATE OR REPLACE FUNCTION refresh_establishment_rollup(p_load_ids UUID[], p_years INTEGER[] DEFAULT '{}')
+RETURNS INTEGER AS $$
+DECLARE
+    touched_years INTEGER[];
+    refreshed INTEGER;
+BEGIN
+    CREATE TEMP TABLE IF NOT EXISTS rollup_touched (
+        establishment_uuid UUID,
+        year_filing_for INTEGER
+    ) ON COMMIT DELETE ROWS;
+    TRUNCATE rollup_touched;
+    
+    INSERT INTO rollup_touched
+    SELECT establishment_uuid, year_filing_for FROM summary_300a_data WHERE load_id = ANY(p_load_ids)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM case_detail_data WHERE load_id = ANY(p_load_ids)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM summary_300a_data WHERE year_filing_for = ANY(p_years)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM case_detail_data WHERE year_filing_for = ANY(p_years)
+    UNION
+    SELECT establishment_uuid, year_filing_for FROM establishment_year_rollup WHERE year_filing_for = ANY(p_years);
+    
+    SELECT array_agg(DISTINCT year_filing_for) INTO touched_years FROM rollup_touched;
+    IF touched_years IS NULL THEN
+        RETURN 0;
+    END IF;
+    
+    DELETE FROM establishment_year_rollup r
+    USING rollup_touched t
+    WHERE r.establishment_uuid = t.establishment_uuid
+    AND r.year_filing_for = t.year_filing_for;
+    
+    -- Aggregate only the touched years' partitions, filtered to touched pairs
+    INSERT INTO establishment_year_rollup (
+        establishment_uuid, year_filing_for, has_300a, annual_average_employees,
+        total_hours_worked, total_injuries, case_count
+    )
+    SELECT 
+        establishment_uuid,
+        year_filing_for,
+        s.establishment_uuid IS NOT NULL,
+        s.annual_average_employees,
+        s.total_hours_worked,
+        s.total_injuries,
+        COALESCE(c.case_count, 0)
+    FROM (
+        SELECT DISTINCT ON (establishment_uuid, year_filing_for)
+            establishment_uuid, year_filing_for, annual_average_employees,
+            total_hours_worked, total_injuries
+        FROM summary_300a_data
+        WHERE is_current = true
+        AND year_filing_for = ANY(touched_years)
+        AND (establishment_uuid, year_filing_for) IN (SELECT establishment_uuid, year_filing_for FROM rollup_touched)
+        ORDER BY establishment_uuid, year_filing_for, data_version DESC
+    ) s
+    FULL JOIN (
+        SELECT establishment_uuid, year_filing_for, COUNT(*) as case_count
+        FROM case_detail_data
+        WHERE is_current = true
+        AND year_filing_for = ANY(touched_years)
+        AND (establishment_uuid, year_filing_for) IN (SELECT establishment_uuid, year_filing_for FROM rollup_touched)
+        GROUP BY establishment_uuid, year_filing_for
+    ) c USING (establishment_uuid, year_filing_for);
+    
+    GET DIAGNOSTICS refreshed = ROW_COUNT;
+    RETURN refreshed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute establishment_year_rollup from scratch (repair)
+CREATE OR REPLACE FUNCTION rebuild_establishment_rollup()
+RETURNS INTEGER AS $$
+BEGIN
+    TRUNCATE establishment_year_rollup;
+    RETURN refresh_establishment_rollup('{}', ARRAY(
+        SELECT year_filing_for FROM summary_300a_data
+        UNION
+        SELECT year_filing_for FROM case_detail_data
+    ));
+END;
+$$ LANGUAGE plpgsql;
+
 -- Function to update load statistics
 CREATE OR REPLACE FUNCTION update_load_stats(
     load_id_param UUID,
@@ -573,6 +827,7 @@ COMMENT ON TABLE summary_300a_data IS 'Annual summary data from OSHA Form 300A w
 COMMENT ON TABLE case_detail_data IS 'Individual incident/case details from OSHA Forms 300/301 with versioning';
 COMMENT ON TABLE data_loads IS 'Tracks all data load operations for audit and recovery';
 COMMENT ON TABLE audit_log IS 'Complete audit trail for all data changes';
+COMMENT ON TABLE establishment_year_rollup IS 'Current 300A figures and case counts per establishment and year, maintained by the loader';
 
 COMMENT ON COLUMN establishments.establishment_uuid IS 'Internal UUID for establishment - never changes';
 COMMENT ON COLUMN establishments.establishment_id IS 'OSHA assigned establishment ID - may change over time';
@@ -13,6 +13,7 @@ import logging
 from typing import Dict, List, Any, Optional
 import sys
 import hashlib
+import uuid
 import argparse
 from enum import Enum
 
@@ -49,17 +50,20 @@ class CFR1904EnhancedLoader:
     """Enhanced loader for 29 CFR Part 1904 data with flexible loading modes"""
     
     def __init__(self, db_config: dict, load_mode: LoadMode = LoadMode.INCREMENTAL, 
-                 dry_run: bool = False, backup_enabled: bool = True):
+                 dry_run: bool = False, backup_enabled: bool = True, bulk: bool = False):
         self.db_config = db_config
         self.load_mode = load_mode
         self.dry_run = dry_run
         self.backup_enabled = backup_enabled
+        self.bulk = bulk
         self.conn = None
         self.cursor = None
         self.version_id = None
         self.logger = logging.getLogger(__name__)
         self.changes_detected = False
         self.backup_tables = []
+        self.keep_backups = False
+        self.single_transaction = False
         
     def connect(self):
         """Establish database connection"""
@@ -138,6 +142,25 @@ class CFR1904EnhancedLoader:
         self.cursor.execute(backup_query)
         self.backup_tables.append(backup_table)
     
+    def _commit_step(self):
+        """Commit a load step unless a truncate-load is holding one transaction"""
+        if not self.dry_run and not self.single_transaction:
+            self.conn.commit()
+    
+    def _snapshot_before_truncate(self, tables: List[str]):
+        """Keep the pre-load state recoverable without copying every table.
+        
+        TRUNCATE is transactional, so the truncate and the reload share one
+        transaction and any failure rolls back to the old rows. Full
+        CREATE TABLE AS copies are only written when backups are to be kept.
+        """
+        if self.dry_run:
+            return
+        self.single_transaction = True
+        if self.keep_backups:
+            for table in tables:
+                self._backup_table(table)
+    
     def _truncate_all_tables(self):
         """Truncate all tables in dependency order"""
         tables_to_truncate = [
@@ -164,16 +187,14 @@ class CFR1904EnhancedLoader:
         ]
         
         if self.backup_enabled:
-            for table in reversed(tables_to_truncate):  # Backup in reverse order
-                self._backup_table(table)
+            self._snapshot_before_truncate(list(reversed(tables_to_truncate)))  # Backup in reverse order
         
         self.logger.info("Truncating all tables...")
-        for table in tables_to_truncate:
-            if not self.dry_run:
-                self.cursor.execute(f"TRUNCATE TABLE {table} CASCADE")
-                self.logger.debug(f"Truncated table: {table}")
-            else:
-                self.logger.debug(f"DRY RUN - Would truncate table: {table}")
+        if not self.dry_run:
+            self.cursor.execute(f"TRUNCATE TABLE {', '.join(tables_to_truncate)} CASCADE")
+            self.logger.debug(f"Truncated {len(tables_to_truncate)} tables")
+        else:
+            self.logger.debug(f"DRY RUN - Would truncate tables: {', '.join(tables_to_truncate)}")
     
     def check_version_exists(self, regulation_id: str, version_number: str, content_hash: str) -> dict:
         """Check if version already exists and detect changes"""
@@ -289,7 +310,7 @@ class CFR1904EnhancedLoader:
         if not self.dry_run:
             version_id = result['id']
             self.version_id = version_id
-            self.conn.commit()
+            self._commit_step()
         else:
             self.version_id = 'DRY_RUN_VERSION_ID'
             version_id = self.version_id
@@ -362,8 +383,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(version_id)s, %(authority_type)s, %(citation)s, %(description)s)
             """, authority_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(legal_basis)} legal authorities")
     
     def load_regulation_amendments(self, editorial_notes: List[dict]):
@@ -386,8 +406,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(version_id)s, %(amendment_date)s, %(federal_register_citation)s, %(amendment_type)s, %(description)s)
             """, amendment_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(editorial_notes)} editorial notes")
     
     def load_size_exemptions(self, size_exemptions: List[dict]):
@@ -435,8 +454,7 @@ class CFR1904EnhancedLoader:
                     VALUES (%(size_exemption_id)s, %(exception_type)s, %(requirement_description)s, %(regulation_ref)s)
                 """, exception_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(size_exemptions)} size exemptions")
     
     def load_naics_codes(self, company_applicability: dict):
@@ -486,8 +504,7 @@ class CFR1904EnhancedLoader:
                 """, naics_record)
                 naics_loaded += 1
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {naics_loaded} NAICS codes")
     
     def load_decision_tree_steps(self, recording_criteria: dict):
@@ -518,8 +535,7 @@ class CFR1904EnhancedLoader:
                         %(yes_path_action)s, %(no_path_action)s, %(determination_method)s, %(notes)s)
             """, step_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(decision_path)} decision tree steps")
     
     def load_work_relatedness_criteria(self, recording_criteria: dict):
@@ -563,8 +579,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(criteria_id)s, %(exception_type)s, %(description)s, %(notes)s)
             """, exception_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded work-relatedness criteria with {len(work_criteria.get('exceptions', []))} exceptions")
     
     def load_general_recording_criteria(self, recording_criteria: dict):
@@ -611,8 +626,7 @@ class CFR1904EnhancedLoader:
                     VALUES (%(criterion_id)s, %(requirement_type)s, %(timing)s, %(regulation_ref)s, %(description)s)
                 """, req_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(general_criteria)} general recording criteria")
     
     def load_specific_recording_criteria(self, recording_criteria: dict):
@@ -638,8 +652,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(version_id)s, %(criterion_type)s, %(regulation_ref)s, %(requirement_description)s, %(form_entry_instructions)s, %(privacy_protection_required)s)
             """, criterion_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(specific_criteria)} specific recording criteria")
     
     def load_required_forms(self, form_requirements: dict):
@@ -686,8 +699,7 @@ class CFR1904EnhancedLoader:
                     VALUES (%(form_id)s, %(information_type)s, %(description)s, %(is_required)s)
                 """, info_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(required_forms)} required forms")
     
     def load_privacy_concern_cases(self, form_requirements: dict):
@@ -712,8 +724,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(version_id)s, %(case_type)s, %(description)s, %(handling_instructions)s)
             """, case_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(privacy_cases)} privacy concern cases")
     
     def load_immediate_reporting_requirements(self, government_reporting: dict):
@@ -772,8 +783,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(reporting_requirement_id)s, %(information_type)s, %(description)s, %(is_required)s)
             """, info_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(immediate_reporting)} immediate reporting requirements")
     
     def load_regulatory_definitions(self, reference_data: dict):
@@ -811,8 +821,7 @@ class CFR1904EnhancedLoader:
                 VALUES (%(version_id)s, %(term)s, %(regulation_ref)s, %(definition_type)s, %(definition_text)s, %(examples)s, %(exceptions)s)
             """, def_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(definitions)} regulatory definitions")
     
     def load_first_aid_treatments(self, reference_data: dict):
@@ -837,10 +846,294 @@ class CFR1904EnhancedLoader:
                 VALUES (%(version_id)s, %(treatment_name)s, %(treatment_details)s, %(exceptions)s)
             """, treatment_record)
         
-        if not self.dry_run:
-            self.conn.commit()
+        self._commit_step()
         self.logger.info(f"Loaded {len(treatments)} first aid treatments")
     
+    # Bulk write plan: (table, columns, parent table, foreign key column to parent)
+    # Parents are listed before their children so their assigned ids exist before the child rows reference them.
+    BULK_TABLE_PLAN = [
+        ('regulation_authorities', ['version_id', 'authority_type', 'citation', 'description'], None, None),
+        ('regulation_amendments', ['version_id', 'amendment_date', 'federal_register_citation', 'amendment_type', 'description'], None, None),
+        ('size_exemptions', ['version_id', 'exemption_id', 'regulation_ref', 'employee_threshold',
+                             'condition_description', 'scope', 'result_description', 'verbatim_text'], None, None),
+        ('size_exemption_exceptions', ['size_exemption_id', 'exception_type', 'requirement_description', 'regulation_ref'],
+         'size_exemptions', 'size_exemption_id'),
+        ('naics_codes', ['version_id', 'naics_code', 'industry_description', 'exemption_type', 'appendix_reference'], None, None),
+        ('decision_tree_steps', ['version_id', 'step_number', 'question', 'regulation_ref',
+                                 'yes_path_action', 'no_path_action', 'determination_method', 'notes'], None, None),
+        ('work_relatedness_criteria', ['version_id', 'regulation_ref', 'basic_requirement', 'presumption_rule',
+                                       'work_environment_definition'], None, None),
+        ('work_relatedness_exceptions', ['criteria_id', 'exception_type', 'description', 'notes'],
+         'work_relatedness_criteria', 'criteria_id'),
+        ('general_recording_criteria', ['version_id', 'criterion_name', 'regulation_ref', 'condition_description',
+                                        'form_name', 'form_action'], None, None),
+        ('criterion_additional_requirements', ['criterion_id', 'requirement_type', 'timing', 'regulation_ref', 'description'],
+         'general_recording_criteria', 'criterion_id'),
+        ('specific_recording_criteria', ['version_id', 'criterion_type', 'regulation_ref', 'requirement_description',
+                                         'form_entry_instructions', 'privacy_protection_required'], None, None),
+        ('required_forms', ['version_id', 'form_id', 'form_name', 'regulation_ref', 'purpose_description',
+                            'completion_deadline', 'completion_trigger'], None, None),
+        ('form_required_information', ['form_id', 'information_type', 'description', 'is_required'],
+         'required_forms', 'form_id'),
+        ('privacy_concern_cases', ['version_id', 'case_type', 'description', 'handling_instructions'], None, None),
+        ('immediate_reporting_requirements', ['version_id', 'trigger_event', 'regulation_ref', 'deadline', 'recipient'], None, None),
+        ('reporting_methods', ['reporting_requirement_id', 'method_description', 'contact_info'],
+         'immediate_reporting_requirements', 'reporting_requirement_id'),
+        ('required_reporting_information', ['reporting_requirement_id', 'information_type', 'description', 'is_required'],
+         'immediate_reporting_requirements', 'reporting_requirement_id'),
+        ('regulatory_definitions', ['version_id', 'term', 'regulation_ref', 'definition_type', 'definition_text',
+                                    'examples', 'exceptions'], None, None),
+        ('first_aid_treatments', ['version_id', 'treatment_name', 'treatment_details', 'exceptions'], None, None),
+    ]
+    
+    def build_row_buffers(self, json_data: dict) -> Dict[str, List[dict]]:
+        """
+        Build one row buffer per target table from the JSON document.
+        Child rows carry '_parent', the index of their parent row in the
+        parent table's buffer; version_id and parent ids are filled in at write time.
+        """
+        buffers = {table: [] for table, _, _, _ in self.BULK_TABLE_PLAN}
+        
+        metadata = json_data.get('regulation_metadata', {})
+        for citation in metadata.get('legal_basis', []):
+            buffers['regulation_authorities'].append({
+                'authority_type': 'USC' if 'U.S.C.' in citation else 'CFR' if 'CFR' in citation else 'Other',
+                'citation': citation,
+                'description': None
+            })
+        
+        for note in metadata.get('editorial_notes', []):
+            buffers['regulation_amendments'].append({
+                'amendment_date': self._parse_date(note.get('date')),
+                'federal_register_citation': note.get('citation'),
+                'amendment_type': 'modification',
+                'description': note.get('note', '')
+            })
+        
+        company_applicability = json_data.get('company_applicability', {})
+        for exemption in company_applicability.get('size_exemptions', []):
+            parent = len(buffers['size_exemptions'])
+            buffers['size_exemptions'].append({
+                'exemption_id': exemption.get('exemption_id'),
+                'regulation_ref': exemption.get('regulation_ref'),
+                'employee_threshold': 10,  # Extract from condition
+                'condition_description': exemption.get('condition'),
+                'scope': exemption.get('scope'),
+                'result_description': exemption.get('result'),
+                'verbatim_text': exemption.get('verbatim_text')
+            })
+            for exception in exemption.get('exceptions', []):
+                buffers['size_exemption_exceptions'].append({
+                    '_parent': parent,
+                    'exception_type': exception.get('exception_type'),
+                    'requirement_description': exception.get('requirement'),
+                    'regulation_ref': exception.get('regulation_ref')
+                })
+        
+        for exemption in company_applicability.get('industry_exemptions', []):
+            for naics_item in exemption.get('naics_codes', []):
+                buffers['naics_codes'].append({
+                    'naics_code': naics_item.get('code'),
+                    'industry_description': naics_item.get('industry'),
+                    'exemption_type': 'partial_exemption',
+                    'appendix_reference': 'A'
+                })
+        
+        naics_reference = company_applicability.get('reference_data', {}).get('naics_codes', {})
+        for appendix_key, naics_list in naics_reference.items():
+            exemption_type = appendix_key.replace('appendix_', '')
+            appendix_ref = 'A' if 'appendix_a' in appendix_key else 'B' if 'appendix_b' in appendix_key else 'Other'
+            for naics_item in naics_list:
+                buffers['naics_codes'].append({
+                    'naics_code': naics_item.get('naics_code'),
+                    'industry_description': naics_item.get('industry'),
+                    'exemption_type': exemption_type,
+                    'appendix_reference': appendix_ref
+                })
+        
+        recording_criteria = json_data.get('recording_criteria', {})
+        decision_tree = recording_criteria.get('recordability_decision_tree', {})
+        for step in decision_tree.get('decision_path', []):
+            buffers['decision_tree_steps'].append({
+                'step_number': step.get('step'),
+                'question': step.get('question'),
+                'regulation_ref': step.get('regulation_ref'),
+                'yes_path_action': step.get('yes_path'),
+                'no_path_action': step.get('no_path'),
+                'determination_method': step.get('determination_method'),
+                'notes': step.get('notes')
+            })
+        
+        work_criteria = recording_criteria.get('work_relatedness_criteria', {})
+        buffers['work_relatedness_criteria'].append({
+            'regulation_ref': work_criteria.get('regulation_ref'),
+            'basic_requirement': work_criteria.get('basic_requirement'),
+            'presumption_rule': work_criteria.get('presumption'),
+            'work_environment_definition': work_criteria.get('work_environment_definition')
+        })
+        for exception in work_criteria.get('exceptions', []):
+            buffers['work_relatedness_exceptions'].append({
+                '_parent': 0,
+                'exception_type': exception.get('exception'),
+                'description': exception.get('description'),
+                'notes': exception.get('note', '')
+            })
+        
+        for criterion in recording_criteria.get('general_recording_criteria', []):
+            parent = len(buffers['general_recording_criteria'])
+            buffers['general_recording_criteria'].append({
+                'criterion_name': criterion.get('criterion'),
+                'regulation_ref': criterion.get('regulation_ref'),
+                'condition_description': criterion.get('condition'),
+                'form_name': criterion.get('form_action', {}).get('form'),
+                'form_action': criterion.get('form_action', {}).get('action')
+            })
+            for req in criterion.get('additional_requirements', []):
+                buffers['criterion_additional_requirements'].append({
+                    '_parent': parent,
+                    'requirement_type': req.get('requirement'),
+                    'timing': req.get('timing'),
+                    'regulation_ref': req.get('regulation_ref'),
+                    'description': req.get('requirement')
+                })
+        
+        for criterion_type, details in recording_criteria.get('specific_recording_criteria', {}).items():
+            buffers['specific_recording_criteria'].append({
+                'criterion_type': criterion_type,
+                'regulation_ref': details.get('regulation_ref'),
+                'requirement_description': details.get('requirement'),
+                'form_entry_instructions': details.get('form_entry'),
+                'privacy_protection_required': details.get('privacy_protection') == 'may_not_enter_employee_name_use_privacy_case_procedures'
+            })
+        
+        form_requirements = json_data.get('form_requirements', {})
+        for form in form_requirements.get('required_forms', []):
+            parent = len(buffers['required_forms'])
+            buffers['required_forms'].append({
+                'form_id': form.get('form_id'),
+                'form_name': form.get('form_name'),
+                'regulation_ref': form.get('regulation_ref'),
+                'purpose_description': form.get('purpose'),
+                'completion_deadline': form.get('completion_timing', {}).get('deadline'),
+                'completion_trigger': form.get('completion_timing', {}).get('trigger')
+            })
+            for info in form.get('required_information', []):
+                buffers['form_required_information'].append({
+                    '_parent': parent,
+                    'information_type': info,
+                    'description': info,
+                    'is_required': True
+                })
+        
+        privacy_protections = form_requirements.get('privacy_protections', {})
+        for case_type in privacy_protections.get('complete_list_privacy_concern_cases', []):
+            buffers['privacy_concern_cases'].append({
+                'case_type': case_type,
+                'description': case_type.replace('_', ' ').title(),
+                'handling_instructions': privacy_protections.get('privacy_case_procedures', {}).get('log_entry')
+            })
+        
+        government_reporting = json_data.get('government_reporting', {})
+        for requirement in government_reporting.get('immediate_reporting', []):
+            parent = len(buffers['immediate_reporting_requirements'])
+            buffers['immediate_reporting_requirements'].append({
+                'trigger_event': requirement.get('trigger'),
+                'regulation_ref': requirement.get('regulation_ref'),
+                'deadline': requirement.get('deadline'),
+                'recipient': requirement.get('recipient')
+            })
+            for method in requirement.get('reporting_methods', []):
+                buffers['reporting_methods'].append({
+                    '_parent': parent,
+                    'method_description': method,
+                    'contact_info': None
+                })
+        
+        # Required information hangs off the last reporting requirement, as in the row-by-row loader
+        last_requirement = len(buffers['immediate_reporting_requirements']) - 1
+        if last_requirement >= 0:
+            for info in government_reporting.get('required_information', []):
+                buffers['required_reporting_information'].append({
+                    '_parent': last_requirement,
+                    'information_type': info,
+                    'description': info,
+                    'is_required': True
+                })
+        
+        reference_data = json_data.get('reference_data', {})
+        for term, definition_data in reference_data.get('definitions', {}).items():
+            if isinstance(definition_data, dict):
+                buffers['regulatory_definitions'].append({
+                    'term': term,
+                    'regulation_ref': definition_data.get('regulation_ref'),
+                    'definition_type': definition_data.get('definition_type'),
+                    'definition_text': definition_data.get('basic_definition') or definition_data.get('completeness_note') or str(definition_data),
+                    'examples': None,
+                    'exceptions': None
+                })
+            else:
+                buffers['regulatory_definitions'].append({
+                    'term': term,
+                    'regulation_ref': None,
+                    'definition_type': 'basic_definition',
+                    'definition_text': str(definition_data),
+                    'examples': None,
+                    'exceptions': None
+                })
+        
+        first_aid = reference_data.get('definitions', {}).get('first_aid', {})
+        for treatment in first_aid.get('items', []):
+            buffers['first_aid_treatments'].append({
+                'treatment_name': treatment.get('treatment'),
+                'treatment_details': treatment.get('details'),
+                'exceptions': treatment.get('exception')
+            })
+        
+        return buffers
+    
+    def bulk_load_buffers(self, buffers: Dict[str, List[dict]]) -> Dict[str, int]:
+        """
+        Write each table's row buffer with a single execute_values call.
+        Parent rows get their id here rather than from the column default,
+        since RETURNING order is not guaranteed to follow VALUES order; child
+        rows take it by buffer index. No per-row SELECTs.
+        Returns: rows written per table
+        """
+        parent_tables = {parent_table for _, _, parent_table, _ in self.BULK_TABLE_PLAN if parent_table}
+        assigned_ids = {}
+        counts = {}
+        
+        for table, columns, parent_table, parent_fk in self.BULK_TABLE_PLAN:
+            rows = buffers.get(table, [])
+            counts[table] = len(rows)
+            if table in parent_tables:
+                columns = ['id'] + columns
+                assigned_ids[table] = [str(uuid.uuid4()) for _ in rows]
+            if not rows:
+                continue
+            
+            values = []
+            for index, row in enumerate(rows):
+                record = dict(row)
+                if table in parent_tables:
+                    record['id'] = assigned_ids[table][index]
+                if parent_table:
+                    record[parent_fk] = assigned_ids[parent_table][row['_parent']]
+                else:
+                    record['version_id'] = self.version_id
+                values.append(tuple(record[column] for column in columns))
+            
+            if self.dry_run:
+                self.logger.debug(f"DRY RUN - Would insert {len(values)} rows into {table}")
+                continue
+            
+            query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+            psycopg2.extras.execute_values(self.cursor, query, values, page_size=len(values))
+            self.logger.debug(f"Bulk inserted {len(values)} rows into {table}")
+        
+        self.logger.info(f"Bulk loaded {sum(counts.values())} rows into {len(self.BULK_TABLE_PLAN)} tables")
+        return counts
+    
     def cleanup_backup_tables(self, keep_backups: bool = False):
         """Clean up backup tables after successful load"""
         if keep_backups or self.dry_run:
@@ -926,6 +1219,7 @@ class CFR1904EnhancedLoader:
             
             # Connect to database
             self.connect()
+            self.keep_backups = keep_backups
             
             # Handle truncate mode
             if self.load_mode == LoadMode.TRUNCATE_LOAD:
@@ -949,6 +1243,18 @@ class CFR1904EnhancedLoader:
                 self.logger.info("INCREMENTAL: No changes detected, skipping data load")
                 return summary
             
+            if self.bulk:
+                self.logger.info("Phase 2-7: Bulk loading all tables from row buffers...")
+                self.bulk_load_buffers(self.build_row_buffers(json_data))
+                
+                if not self.dry_run:
+                    self.conn.commit()
+                    self.cleanup_backup_tables(keep_backups)
+                
+                self.logger.info(f"Version ID: {self.version_id}")
+                self.logger.info("Data loading completed successfully!")
+                return summary
+            
             # Phase 2: Load core metadata
             self.logger.info("Phase 2: Loading core metadata...")
             legal_basis = metadata.get('legal_basis', [])
@@ -1023,6 +1329,7 @@ class CFR1904EnhancedLoader:
                 self.conn.rollback()
             raise
         finally:
+            self.single_transaction = False
             self.disconnect()
 
 def main():
@@ -1052,6 +1359,9 @@ Examples:
 
   # Validate changes only
   python cfr_1904_enhanced_loader.py data.json --mode validate_only
+
+  # Bulk load: one multi-row insert per table, one transaction
+  python cfr_1904_enhanced_loader.py data.json --bulk
         """
     )
     
@@ -1063,11 +1373,13 @@ Examples:
     parser.add_argument('--dry-run', '-d', action='store_true',
                        help='Perform dry run without making changes')
     parser.add_argument('--no-backup', action='store_true',
-                       help='Disable backup table creation')
+                       help='Commit each table as it loads instead of one rollback-safe transaction')
     parser.add_argument('--force-update', '-f', action='store_true',
                        help='Force update even if no content changes detected')
     parser.add_argument('--keep-backups', action='store_true',
-                       help='Keep backup tables after successful load')
+                       help='Also write and keep full backup table copies before truncating')
+    parser.add_argument('--bulk', action='store_true',
+                       help='Write each table with one multi-row insert in a single transaction')
     parser.add_argument('--log-level', '-l',
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        default='INFO',
@@ -1087,7 +1399,8 @@ Examples:
             db_config=DB_CONFIG,
             load_mode=load_mode,
             dry_run=args.dry_run,
-            backup_enabled=not args.no_backup
+            backup_enabled=not args.no_backup,
+            bulk=args.bulk
         )
         
         # Load dataset
@@ -58,6 +58,7 @@ class OSHAJSONBLoader:
         self.logger = logging.getLogger(__name__)
         self.changes_detected = False
         self.backup_tables = []
+        self.keep_backups = False
         
     def connect(self):
         """Establish database connection"""
@@ -424,8 +425,10 @@ class OSHAJSONBLoader:
         
         # For TRUNCATE_LOAD or new versions, create new version
         if self.load_mode == LoadMode.TRUNCATE_LOAD:
-            # Backup and truncate
-            if self.backup_enabled:
+            # The truncate and the insert below commit together, so a failed
+            # load rolls back to the old rows; only copy the table when the
+            # backup is meant to outlive the load.
+            if self.keep_backups:
                 self._backup_table('regulations')
             
             if not self.dry_run:
@@ -578,6 +581,7 @@ class OSHAJSONBLoader:
             
             # Connect to database
             self.connect()
+            self.keep_backups = keep_backups
             
             # Setup database schema
             self.logger.info("Setting up database schema...")
@@ -665,7 +669,7 @@ Examples:
     parser.add_argument('--force-update', '-f', action='store_true',
                        help='Force update even if no content changes detected')
     parser.add_argument('--keep-backups', action='store_true',
-                       help='Keep backup tables after successful load')
+                       help='Also write and keep a full backup table copy before truncating')
     parser.add_argument('--log-level', '-l',
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        default='INFO',